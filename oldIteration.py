@@ -7,25 +7,50 @@ A GUI application to check card prices and rip card packs with voice recognition
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
 import json
 import os
 from datetime import datetime
 import threading
+import concurrent.futures
 import time
 import re
+import functools
+import heapq
+import importlib.util
+from collections import Counter, OrderedDict, defaultdict
 try:
-    from fuzzywuzzy import fuzz, process
+    # rapidfuzz is API-compatible with fuzzywuzzy and scores whole lists in C++
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.utils import default_process as _fuzz_key
+    RAPIDFUZZ_AVAILABLE = True
     FUZZYWUZZY_AVAILABLE = True
 except ImportError:
-    FUZZYWUZZY_AVAILABLE = False
-    print("fuzzywuzzy not available - string matching features disabled")
+    RAPIDFUZZ_AVAILABLE = False
+    try:
+        from fuzzywuzzy import fuzz, process
+        from fuzzywuzzy.utils import full_process as _fuzz_key
+        FUZZYWUZZY_AVAILABLE = True
+    except ImportError:
+        FUZZYWUZZY_AVAILABLE = False
+        _fuzz_key = str.lower
+        print("fuzzywuzzy not available - string matching features disabled")
+# rapidfuzz's process.cdist returns NumPy score matrices - only its presence matters here
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+# openpyxl takes a noticeable part of startup to import and is only used by the
+# export fallback, so just check it is installed - _write_cards_openpyxl imports it
+OPENPYXL_AVAILABLE = importlib.util.find_spec('openpyxl') is not None
 try:
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment
-    OPENPYXL_AVAILABLE = True
+    # Preferred Excel writer: constant_memory mode streams each row to disk
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
 except ImportError:
-    OPENPYXL_AVAILABLE = False
-    print("openpyxl not available - Excel export features disabled")
+    XLSXWRITER_AVAILABLE = False
+EXCEL_EXPORT_AVAILABLE = OPENPYXL_AVAILABLE or XLSXWRITER_AVAILABLE
+if not EXCEL_EXPORT_AVAILABLE:
+    print("openpyxl/xlsxwriter not available - Excel export features disabled")
 try:
     import speech_recognition as sr
     SPEECH_RECOGNITION_AVAILABLE = True
@@ -39,8 +64,32 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
     print("PIL not available - image features disabled")
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("orjson not available - using standard JSON parsing")
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+try:
+    import brotli  # noqa: F401 - lets urllib3 decode Content-Encoding: br
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+    print("diskcache not available - image cache index falls back to directory scans")
 import urllib.parse
 import hashlib
+import io
+import zipfile
 
 # Performance timing decorator for debugging lag issues
 def performance_timer(func_name):
@@ -62,8 +111,9 @@ def performance_timer(func_name):
     return decorator
 
 # Configure logging
+# INFO by default; set YGO_RIPPER_DEBUG=1 for the per-image/per-widget debug output
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.DEBUG if os.environ.get('YGO_RIPPER_DEBUG') else logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler('ygo_ripper_ui.log'),
@@ -72,6 +122,152 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Separator lines for formatted text output, built once
+_HR80 = "=" * 80
+_HR40 = "-" * 40
+
+# Price check failure texts for the results pane, keyed by failure kind
+_ERROR_TEMPLATES = {
+    "connection": "🚫 CONNECTION ERROR\n\nCould not connect to: {url}\n\nPossible solutions:\n• Check if the API server is running\n• Verify the API_URL environment variable is correct\n• Check your internet connection\n• Ensure the server is accessible",
+    "timeout": "⏰ TIMEOUT ERROR\n\nThe request took too long to complete.\nThe server might be experiencing high load.\nPlease try again in a few moments.",
+    "http": "🔴 HTTP ERROR\n\nServer Error: {error}\nStatus Code: {status}\n\nThe server returned an error. Please check your input data and try again.",
+    "unexpected": "❌ UNEXPECTED ERROR\n\nAn unexpected error occurred:\n{error}\n\nPlease try again or contact support if the problem persists.",
+}
+
+# Voice parsing patterns, compiled once. Input is lowercased before matching.
+# Order matters: the first pattern that matches wins.
+_ART_PATTERNS = tuple(re.compile(p) for p in (
+    r'art variant (\w+)',
+    r'art (\w+)',
+    r'variant (\w+)',
+    r'artwork (\w+)',
+    r'art rarity (.+?)(?:\s|$)',
+    r'art variant (.+?)(?:\s|$)',
+))
+
+# Known rarity names, most specific first: at any position the longer name wins,
+# and word boundaries keep "rare"/"common" from matching inside other words
+_RARITY_RE = re.compile(
+    r'\b(quarter century secret rare|quarter century secret|prismatic secret rare|prismatic secret'
+    r'|starlight rare|collector.*?rare|ghost rare|secret rare|ultra rare|super rare|rare|common)\b'
+)
+
+# Fallbacks when no known rarity is named: the rarity is captured in group 1
+_RARITY_CAPTURE_PATTERNS = tuple(re.compile(p) for p in (
+    r'rarity (.+?)(?:\s|$)',
+    r'rare (.+?)(?:\s|$)',
+    r'(.+?) rare(?:\s|$)',
+    r'(.+?) rarity(?:\s|$)',
+))
+
+_NUMBER_PATTERNS = tuple(re.compile(p) for p in (
+    r'^\s*(\d+)\s*$',
+    r'option\s+(\d+)',
+    r'select\s+(\d+)',
+    r'choose\s+(\d+)',
+    r'number\s+(\d+)',
+))
+
+# Any hit cancels, so one alternation is equivalent to testing each word
+_REJECT_RE = re.compile(r'reject|cancel|no|none|skip')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# API TTL cache key for the full /card-sets/from-cache list (startup load and Load Sets)
+_CARD_SETS_CACHE_KEY = "card-sets"
+
+# Tk builds the whole combobox listbox on open, so long set lists are capped
+_SET_DROPDOWN_LIMIT = 50
+
+# Excel export columns and their header labels (only the session tracker export offers quantity)
+_EXPORT_FIELD_LABELS = {
+    'card_name': 'Card Name',
+    'card_rarity': 'Card Rarity',
+    'quantity': 'Quantity',
+    'art_variant': 'Art Variant',
+    'tcg_price': 'TCGPlayer Low Price',
+    'tcg_market_price': 'TCGPlayer Market Price',
+    'set_code': 'Set Code',
+    'booster_set_name': 'Set Name',
+    'card_number': 'Card Number',
+    'card_art_variant': 'Card Art Variant',
+    'scrape_success': 'Scrape Success',
+    'source_url': 'Source URL',
+    'last_price_updt': 'Last Updated',
+    'timestamp': 'Added Timestamp',
+    'error_message': 'Error Message (if any)'
+}
+_SESSION_EXPORT_FIELDS = tuple(_EXPORT_FIELD_LABELS)
+_EXPORT_FIELDS = tuple(field for field in _SESSION_EXPORT_FIELDS if field != 'quantity')
+
+@functools.lru_cache(maxsize=32)
+def export_headers(selected_fields):
+    """Header labels for a tuple of export fields"""
+    return tuple(_EXPORT_FIELD_LABELS.get(field, field) for field in selected_fields)
+
+# Exports are opened straight away, not archived - deflate level 1 is several times
+# faster than zlib's default 6 for a slightly larger file
+_EXPORT_ZIP_LEVEL = 1
+
+# Price checker results pane texts
+_WELCOME_MSG = """Welcome to YGORipperUI! 🃏
+
+Enter the card information above and click "Check Price" to get pricing data.
+
+Required fields:
+• Card Number: The card's identification number
+• Card Rarity: The rarity of the card
+• Force Refresh: Check this to force a fresh data scrape
+
+Optional fields:
+• Card Name: The name of the card
+• Art Variant: Specific art variant if applicable
+
+The application will fetch pricing data from TCGPlayer and display:
+• Card details (name, rarity, set)
+• TCGPlayer Low and Market prices
+• Last update timestamp
+"""
+
+_WELCOME_BACK_MSG = """Welcome back! 🃏
+
+Enter new card information above and click "Check Price" to get pricing data.
+"""
+
+# Tcl proc that builds a whole quantity row (-, qty, +, remove) in one tk.call
+# instead of ~6 Python widget constructions. Layouts mirror the old ttk code.
+# Texts are passed as args so emoji never go through the Tcl parser.
+QTY_ROW_TCL_PROC = r"""
+proc ::ygo_qty_row {frame layout qty dec_cmd inc_cmd rm_cmd lbl_text rm_text args} {
+    ttk::frame $frame
+    grid $frame {*}$args
+    switch -- $layout {
+        focus   {set w 2; set font {Arial 9 bold}; set pad {0 0}}
+        normal  {set w 3; set font {Arial 10 bold}; set pad {5 2}}
+        default {set w 2; set font {Arial 8 bold}; set pad {0 0}}
+    }
+    if {$lbl_text ne ""} {
+        ttk::label $frame.lbl -text $lbl_text -font {Arial 10}
+        pack $frame.lbl -side left
+    }
+    ttk::button $frame.dec -text - -width $w -command $dec_cmd
+    ttk::label $frame.qty -text $qty -font $font -width $w
+    ttk::button $frame.inc -text + -width $w -command $inc_cmd
+    pack $frame.dec -side left -padx $pad
+    pack $frame.qty -side left -padx 2
+    pack $frame.inc -side left -padx [lreverse $pad]
+    if {$rm_cmd ne ""} {
+        if {$layout eq "focus"} {
+            ttk::button $frame.rm -text $rm_text -width 3 -command $rm_cmd
+            pack $frame.rm -side right
+        } else {
+            ttk::button $frame.rm -text $rm_text -command $rm_cmd
+            pack $frame.rm -side left -padx {10 0}
+        }
+    }
+    return $frame.qty
+}
+"""
+
 class SessionTrackerWindow:
     """Dedicated window for tracking pack session cards with high-performance virtual scrolling"""
     def __init__(self, parent, pack_session, image_manager):
@@ -93,7 +289,12 @@ class SessionTrackerWindow:
         
         # Bulk preload management
         self.bulk_preload_started = False  # Prevent multiple preload runs
-        
+
+        # Chunked widget building - first screenful renders immediately, rest fills in during idle time
+        self.build_chunk_size = 20  # Number of card widgets built per idle callback
+        self._build_queue = []  # Card indices still waiting for a widget
+        self._build_generation = 0  # Bumped on every rebuild so stale chunks cancel themselves
+
         # Create the session tracker window with dynamic sizing
         self.window = tk.Toplevel(parent)
         self.window.title("YGO Pack Session Tracker")
@@ -259,9 +460,9 @@ class SessionTrackerWindow:
         settings_btn = ttk.Button(controls_frame, text="⚙️ Display", command=self.show_display_settings)
         settings_btn.pack(side=tk.LEFT, padx=(0, 5))
         
-        # Excel export button
-        export_btn = ttk.Button(controls_frame, text="📊 Export Excel", command=self.export_session_to_excel)
-        export_btn.pack(side=tk.LEFT, padx=(0, 5))
+        # Excel export button (disabled while an export is being written)
+        self.export_btn = ttk.Button(controls_frame, text="📊 Export Excel", command=self.export_session_to_excel)
+        self.export_btn.pack(side=tk.LEFT, padx=(0, 5))
         
         # Card count
         self.card_count_label = ttk.Label(controls_frame, text=f"Cards: {len(self.pack_session.cards)}")
@@ -439,12 +640,15 @@ class SessionTrackerWindow:
         """Clear all card widgets cleanly"""
         try:
             print(f"[CLEAR WIDGETS] Clearing {len(self.card_widgets)} widgets")
-            
+
+            # Cancel any chunked build still pending from a previous refresh
+            self.cancel_pending_build()
+
             # Destroy all widgets
             for widget in self.card_widgets:
                 try:
                     if hasattr(widget, 'winfo_exists') and widget.winfo_exists():
-                        widget.destroy()
+                        self.release_card_widget(widget)
                 except Exception as e:
                     print(f"[CLEAR WIDGETS] Error destroying widget: {e}")
             
@@ -468,31 +672,73 @@ class SessionTrackerWindow:
         try:
             print(f"[REBUILD] Rebuilding display for {'focus' if self.focus_mode else 'normal'} mode")
             print(f"[REBUILD] Cards to display: {len(self.pack_session.cards)}")
-            
-            # Create widgets for all cards
-            for i, card in enumerate(self.pack_session.cards):
+
+            # Build widgets in idle-time chunks so the first screenful appears immediately
+            self.start_chunked_build(0)
+
+        except Exception as e:
+            print(f"[REBUILD] Error rebuilding display: {e}")
+            import traceback
+            traceback.print_exc()
+
+    def start_chunked_build(self, start_index):
+        """Queue widgets for cards from start_index onward and build them in idle-time chunks"""
+        new_indices = range(start_index, len(self.pack_session.cards))
+
+        if self._build_queue:
+            # A build is already in flight - just append the new cards to it
+            self._build_queue.extend(i for i in new_indices if i > self._build_queue[-1])
+            return
+
+        self._build_generation += 1
+        self._build_queue = list(new_indices)
+        self._build_next_chunk(self._build_generation)
+
+    def _build_next_chunk(self, generation):
+        """Build the next chunk of queued card widgets, then yield back to the event loop"""
+        # A newer rebuild superseded this one
+        if generation != self._build_generation:
+            return
+
+        try:
+            if not (hasattr(self, 'window') and self.window and self.window.winfo_exists()):
+                self._build_queue = []
+                return
+
+            chunk = self._build_queue[:self.build_chunk_size]
+            del self._build_queue[:self.build_chunk_size]
+
+            for i in chunk:
+                if i >= len(self.pack_session.cards):
+                    continue
+                card = self.pack_session.cards[i]
                 try:
                     if self.focus_mode:
                         self.create_focus_mode_widget_simple(card, i)
                     else:
                         self.create_normal_mode_widget_simple(card, i)
                 except Exception as e:
-                    print(f"[REBUILD] Error creating widget {i}: {e}")
-                    continue
-            
-            # Update the scroll region
+                    print(f"[CHUNKED BUILD] Error creating widget {i}: {e}")
+
+            if self._build_queue:
+                # Let Tk handle pending clicks/redraws before building the next chunk
+                self.window.after_idle(lambda: self._build_next_chunk(generation))
+                return
+
+            # Build finished - update scroll region and show newest cards
             self.update_scroll_region_simple()
-            
-            # Auto-scroll to bottom to show newest cards
             self.window.after(100, self.auto_scroll_to_bottom)
-            
-            print(f"[REBUILD] Rebuild complete. Created {len(self.card_widgets)} widgets")
-            
+            print(f"[CHUNKED BUILD] Build complete. Created {len(self.card_widgets)} widgets")
+
         except Exception as e:
-            print(f"[REBUILD] Error rebuilding display: {e}")
-            import traceback
-            traceback.print_exc()
-    
+            print(f"[CHUNKED BUILD] Error building chunk: {e}")
+            self._build_queue = []
+
+    def cancel_pending_build(self):
+        """Cancel any queued chunked build so stale chunks don't run after a refresh"""
+        self._build_generation += 1
+        self._build_queue = []
+
     def create_focus_mode_widget_simple(self, card, index):
         """Create focus mode widget with simplified, stable approach"""
         try:
@@ -519,6 +765,7 @@ class SessionTrackerWindow:
             if self.display_settings.get('show_images', True) and PIL_AVAILABLE:
                 image_label = ttk.Label(card_frame, text="🖼️", font=("Arial", 8), justify="center")
                 image_label.grid(row=0, column=0, rowspan=5, padx=(0, 8), pady=4, sticky="n")
+                card_frame._image_label = image_label  # Direct handle for release_card_widget
                 
                 # Load image
                 self.load_card_image_simple(card, image_label, focus_mode=True)
@@ -581,6 +828,7 @@ class SessionTrackerWindow:
                 image_label = ttk.Label(card_frame, text="🖼️\nLoading...", 
                                       font=("Arial", 9), justify="center")
                 image_label.grid(row=0, column=0, rowspan=7, padx=(0, 15), pady=5, sticky="n")
+                card_frame._image_label = image_label  # Direct handle for release_card_widget
                 
                 # Load image
                 self.load_card_image_simple(card, image_label, focus_mode=False)
@@ -667,9 +915,40 @@ class SessionTrackerWindow:
             print(f"[IMAGE LOAD] Error loading image: {e}")
             image_label.configure(text="❌\nError", font=("Arial", 8))
     
+    def create_qty_row_tcl(self, parent, card, layout, grid_opts, lbl_text="", rm_text="", with_remove=True):
+        """Build a quantity row with the cached Tcl proc; returns False if Tcl path is unavailable"""
+        try:
+            tk_app = parent.tk
+            if not getattr(self, '_qty_row_proc_ready', False):
+                tk_app.eval(QTY_ROW_TCL_PROC)
+                self._qty_row_proc_ready = True
+            
+            card_id = card.get('id', 'unknown')
+            
+            # Commands are registered on the parent so they are deleted when it is destroyed
+            dec_cmd = parent.register(lambda: self.update_card_quantity_by_id(card_id, -1))
+            inc_cmd = parent.register(lambda: self.update_card_quantity_by_id(card_id, 1))
+            rm_cmd = parent.register(lambda: self.remove_card_by_id(card_id)) if with_remove else ""
+            
+            qty_path = tk_app.call('::ygo_qty_row', f"{parent._w}.qty", layout, str(card.get('quantity', 1)),
+                                   dec_cmd, inc_cmd, rm_cmd, lbl_text, rm_text, *grid_opts)
+            
+            # Tcl-created widgets are invisible to winfo_children(), so remember the label path
+            parent._qty_label_path = str(qty_path)
+            return True
+            
+        except tk.TclError as e:
+            logger.debug("[QTY CONTROLS] Tcl quantity row unavailable, using ttk widgets: %s", e)
+            self._qty_row_proc_ready = False
+            return False
+    
     def add_quantity_controls_focus(self, parent, card, index):
         """Add quantity controls for focus mode"""
         try:
+            if self.create_qty_row_tcl(parent, card, 'focus',
+                                       ('-row', 3, '-column', 0, '-sticky', 'we', '-pady', 2), rm_text="🗑️"):
+                return
+            
             qty_frame = ttk.Frame(parent)
             qty_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=2)
             
@@ -698,6 +977,11 @@ class SessionTrackerWindow:
     def add_quantity_controls_normal(self, parent, card, index, row):
         """Add quantity controls for normal mode"""
         try:
+            if self.create_qty_row_tcl(parent, card, 'normal',
+                                       ('-row', row, '-column', 1, '-sticky', 'w', '-pady', 4),
+                                       lbl_text="📦 Quantity:", rm_text="🗑️ Remove"):
+                return
+            
             qty_frame = ttk.Frame(parent)
             qty_frame.grid(row=row, column=1, sticky=(tk.W), pady=4)
             
@@ -821,12 +1105,18 @@ class SessionTrackerWindow:
         """Efficiently remove a card widget and update display without full rebuild"""
         try:
             print(f"[EFFICIENT REMOVE] Removing widget at index {removed_index}")
-            
+
+            # Queued indices shift after a removal - restart the build instead of patching them
+            if self._build_queue:
+                self.clear_all_widgets()
+                self.rebuild_display_for_mode()
+                return
+
             # Remove the specific widget
             if removed_index < len(self.card_widgets):
                 widget_to_remove = self.card_widgets[removed_index]
                 if hasattr(widget_to_remove, 'winfo_exists') and widget_to_remove.winfo_exists():
-                    widget_to_remove.destroy()
+                    self.release_card_widget(widget_to_remove)
                 
                 # Remove from widget list
                 del self.card_widgets[removed_index]
@@ -930,6 +1220,12 @@ class SessionTrackerWindow:
     def update_quantity_display_recursive(self, widget, new_quantity):
         """Recursively find and update quantity displays"""
         try:
+            # Rows built by the Tcl proc keep their label path on the parent widget
+            qty_label_path = getattr(widget, '_qty_label_path', None)
+            if qty_label_path:
+                widget.tk.call(qty_label_path, 'configure', '-text', str(new_quantity))
+                return
+            
             # Check if this widget is a quantity label
             if hasattr(widget, 'cget') and hasattr(widget, 'configure'):
                 try:
@@ -1340,6 +1636,11 @@ class SessionTrackerWindow:
     def add_compact_quantity_controls(self, parent, card, index, focus_mode):
         """Add compact quantity controls"""
         try:
+            if self.create_qty_row_tcl(parent, card, 'compact',
+                                       ('-row', 2, '-column', 1, '-sticky', 'we', '-pady', 2),
+                                       rm_text="Remove", with_remove=not focus_mode):
+                return
+            
             qty_frame = ttk.Frame(parent)
             qty_frame.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=2)
             
@@ -1623,7 +1924,7 @@ class SessionTrackerWindow:
             for widget in widgets_to_destroy:
                 try:
                     if hasattr(widget, 'winfo_exists') and widget.winfo_exists():
-                        widget.destroy()
+                        self.release_card_widget(widget)
                 except:
                     pass  # Ignore errors during cleanup for speed
                     
@@ -1918,8 +2219,8 @@ class SessionTrackerWindow:
                 # For virtual scrolling, just update the virtual display
                 self.update_virtual_display_simple()
             else:
-                # Regular update logic
-                current_widget_count = len(self.card_widgets)
+                # Regular update logic - count widgets still queued for a chunked build as present
+                current_widget_count = len(self.card_widgets) + len(self._build_queue)
                 required_widget_count = len(self.pack_session.cards)
                 
                 if required_widget_count == current_widget_count:
@@ -1970,20 +2271,9 @@ class SessionTrackerWindow:
     def add_new_cards_simple(self, start_index):
         """Add new cards starting from start_index"""
         try:
-            for i in range(start_index, len(self.pack_session.cards)):
-                card = self.pack_session.cards[i]
-                
-                if self.focus_mode:
-                    self.create_focus_mode_widget_simple(card, i)
-                else:
-                    self.create_normal_mode_widget_simple(card, i)
-            
-            # Update scroll region
-            self.update_scroll_region_simple()
-            
-            # Auto-scroll to show new cards
-            self.window.after(100, self.auto_scroll_to_bottom)
-            
+            # Chunked build updates the scroll region and auto-scrolls once it finishes
+            self.start_chunked_build(start_index)
+
         except Exception as e:
             print(f"[ADD NEW CARDS] Error adding new cards: {e}")
             import traceback
@@ -2115,12 +2405,8 @@ class SessionTrackerWindow:
                         image_url = card_images[0].get('image_url')
                         card_id = card.get('id', 'unknown')
                         if image_url and card_id:
-                            # Pre-load for both modes in background
-                            threading.Thread(
-                                target=self.image_manager.preload_image_for_both_modes,
-                                args=(card_id, image_url),
-                                daemon=True
-                            ).start()
+                            # Queue pre-loading for both modes on the image manager's pool
+                            self.image_manager.preload_image_for_both_modes(card_id, image_url)
             
             # Add widgets for new cards only
             print(f"[ADD WIDGETS DEBUG] Starting widget creation loop from {start_index} to {len(self.pack_session.cards)}")
@@ -2157,8 +2443,7 @@ class SessionTrackerWindow:
             for widget in widgets_to_remove:
                 try:
                     if hasattr(widget, 'winfo_exists') and widget.winfo_exists():
-                        self.clear_widget_image_references(widget)
-                        widget.destroy()
+                        self.release_card_widget(widget)
                 except Exception as e:
                     print(f"[SESSION TRACKER] Error removing widget: {e}")
             
@@ -2566,6 +2851,20 @@ class SessionTrackerWindow:
         
         ttk.Button(qty_frame, text="🗑️ Remove", command=remove_card).pack(side=tk.LEFT, padx=(10, 0))
         
+    def release_card_widget(self, card_frame):
+        """Detach the card's PhotoImage from its label, then destroy the frame"""
+        try:
+            # Tk can keep the image alive (and leak it) if the label still points at it on destroy
+            image_label = getattr(card_frame, '_image_label', None)
+            if image_label is not None:
+                image_label.configure(image='')
+                image_label.image = None
+            else:
+                self.clear_widget_image_references(card_frame)
+        except Exception:
+            pass
+        card_frame.destroy()
+    
     def clear_widget_image_references(self, widget):
         """Recursively clear image references in widget tree"""
         try:
@@ -2592,13 +2891,13 @@ class SessionTrackerWindow:
             # Get card image URL
             card_images = card.get('card_images', [])
             if not card_images or len(card_images) == 0:
-                print(f"[IMAGE DEBUG] No images available for {card.get('card_name', 'Unknown')}")
+                logger.debug("[IMAGE DEBUG] No images available for %s", card.get('card_name', 'Unknown'))
                 self.set_image_placeholder(image_label, "🃏\nNo Image")
                 return
             
             image_url = card_images[0].get('image_url')
             if not image_url:
-                print(f"[IMAGE DEBUG] No image URL for {card.get('card_name', 'Unknown')}")
+                logger.debug("[IMAGE DEBUG] No image URL for %s", card.get('card_name', 'Unknown'))
                 self.set_image_placeholder(image_label, "🃏\nNo URL")
                 return
             
@@ -2608,10 +2907,10 @@ class SessionTrackerWindow:
             # Use appropriate size based on current mode
             if self.focus_mode:
                 display_size = self.image_manager.focus_mode_size
-                print(f"[IMAGE DEBUG] Loading focus mode image for {card_name} (ID: {card_id})")
             else:
                 display_size = self.image_manager.normal_mode_size
-                print(f"[IMAGE DEBUG] Loading normal mode image for {card_name} (ID: {card_id})")
+            logger.debug("[IMAGE DEBUG] Loading %s mode image for %s (ID: %s)",
+                         'focus' if self.focus_mode else 'normal', card_name, card_id)
             
             # Try to get cached image first
             photo = self.image_manager.get_cached_image_for_mode(card_id, self.focus_mode)
@@ -2623,19 +2922,17 @@ class SessionTrackerWindow:
             if photo:
                 # Verify widget still exists before updating
                 if hasattr(image_label, 'winfo_exists') and image_label.winfo_exists():
-                    print(f"[IMAGE DEBUG] Setting image for {card_name}")
+                    logger.debug("[IMAGE DEBUG] Setting image for %s", card_name)
                     image_label.configure(image=photo, text="")
                     image_label.image = photo  # Keep reference to prevent garbage collection
                 else:
-                    print(f"[IMAGE DEBUG] Widget no longer exists for {card_name}")
+                    logger.debug("[IMAGE DEBUG] Widget no longer exists for %s", card_name)
             else:
-                print(f"[IMAGE DEBUG] Failed to load photo for {card_name}")
+                logger.debug("[IMAGE DEBUG] Failed to load photo for %s", card_name)
                 self.set_image_placeholder(image_label, "🖼️\nError")
                 
         except Exception as e:
-            print(f"[IMAGE DEBUG] Error loading image for {card.get('card_name', 'Unknown')}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[IMAGE DEBUG] Error loading image for %s: %s", card.get('card_name', 'Unknown'), e)
             self.set_image_placeholder(image_label, "❌\nError")
     
     def set_image_placeholder(self, image_label, text):
@@ -2701,14 +2998,14 @@ class SessionTrackerWindow:
         """Update the quantity of a card in the session with optimized UI updates"""
         if 0 <= card_index < len(self.pack_session.cards):
             self.pack_session.cards[card_index]['quantity'] = new_quantity
-            print(f"[SESSION TRACKER] Updated card {card_index} quantity to {new_quantity}")
+            logger.debug("[SESSION TRACKER] Updated card %d quantity to %d", card_index, new_quantity)
             
             # Try to update just the quantity label instead of rebuilding everything
             if self.update_quantity_label_only(card_index, new_quantity):
-                print(f"[SESSION TRACKER] Updated quantity label in-place for card {card_index}")
+                logger.debug("[SESSION TRACKER] Updated quantity label in-place for card %d", card_index)
             else:
                 # Fallback to full refresh if in-place update fails
-                print(f"[SESSION TRACKER] Falling back to full refresh for card {card_index}")
+                logger.debug("[SESSION TRACKER] Falling back to full refresh for card %d", card_index)
                 self.safe_update_cards_display()
     
     def update_quantity_label_only(self, card_index, new_quantity):
@@ -2750,20 +3047,20 @@ class SessionTrackerWindow:
         """Remove a card from the session"""
         if 0 <= card_index < len(self.pack_session.cards):
             removed_card = self.pack_session.cards.pop(card_index)
-            print(f"[SESSION TRACKER] Removed card: {removed_card.get('card_name', 'Unknown')}")
+            logger.debug("[SESSION TRACKER] Removed card: %s", removed_card.get('card_name', 'Unknown'))
             # Refresh display
             self.safe_update_cards_display()
     
     def auto_scroll_to_bottom(self):
         """Automatically scroll to the bottom of the card display with enhanced reliability"""
-        print(f"[AUTO SCROLL DEBUG] auto_scroll_to_bottom called")
+        logger.debug("[AUTO SCROLL DEBUG] auto_scroll_to_bottom called")
         try:
             if hasattr(self, 'cards_canvas') and self.cards_canvas:
-                print(f"[AUTO SCROLL DEBUG] Canvas exists, scheduling scroll operation")
+                logger.debug("[AUTO SCROLL DEBUG] Canvas exists, scheduling scroll operation")
                 # Schedule the scroll operation to happen after UI updates complete
                 def scroll_to_bottom():
                     try:
-                        print(f"[AUTO SCROLL DEBUG] Executing scroll_to_bottom")
+                        logger.debug("[AUTO SCROLL DEBUG] Executing scroll_to_bottom")
                         
                         # Force final updates before scrolling
                         self.cards_canvas.update_idletasks()
@@ -2771,28 +3068,28 @@ class SessionTrackerWindow:
                         
                         # Check current scroll region
                         scroll_region = self.cards_canvas.cget('scrollregion')
-                        print(f"[AUTO SCROLL DEBUG] Current scrollregion: {scroll_region}")
+                        logger.debug("[AUTO SCROLL DEBUG] Current scrollregion: %s", scroll_region)
                         
                         # Verify we have a valid scroll region
                         if scroll_region and scroll_region != "0 0 0 0":
                             # Scroll to the very bottom
                             self.cards_canvas.yview_moveto(1.0)
-                            print("[AUTO SCROLL DEBUG] Auto-scrolled to bottom (yview_moveto 1.0)")
+                            logger.debug("[AUTO SCROLL DEBUG] Auto-scrolled to bottom (yview_moveto 1.0)")
                             
                             # Verify scroll position
                             current_view = self.cards_canvas.yview()
-                            print(f"[AUTO SCROLL DEBUG] Current yview after scroll: {current_view}")
+                            logger.debug("[AUTO SCROLL DEBUG] Current yview after scroll: %s", current_view)
                             
                             # If we're not at the bottom, try alternative scroll methods
                             if current_view[1] < 0.99:  # Allow for small floating point differences
-                                print(f"[AUTO SCROLL DEBUG] Not at bottom, trying yview_scroll to end")
+                                logger.debug("[AUTO SCROLL DEBUG] Not at bottom, trying yview_scroll to end")
                                 self.cards_canvas.yview_scroll(1000, "units")  # Large scroll to ensure we reach bottom
                                 
                                 # Check again
-                                final_view = self.cards_canvas.yview()
-                                print(f"[AUTO SCROLL DEBUG] Final yview after scroll: {final_view}")
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("[AUTO SCROLL DEBUG] Final yview after scroll: %s", self.cards_canvas.yview())
                         else:
-                            print(f"[AUTO SCROLL DEBUG] Invalid scroll region, trying to recalculate")
+                            logger.debug("[AUTO SCROLL DEBUG] Invalid scroll region, trying to recalculate")
                             # Try to recalculate scroll region
                             bbox = self.cards_canvas.bbox("all")
                             if bbox:
@@ -2800,20 +3097,18 @@ class SessionTrackerWindow:
                                 expanded_bbox = (x1, y1, x2, y2 + 50)
                                 self.cards_canvas.configure(scrollregion=expanded_bbox)
                                 self.cards_canvas.yview_moveto(1.0)
-                                print(f"[AUTO SCROLL DEBUG] Recalculated scroll region and scrolled to bottom")
+                                logger.debug("[AUTO SCROLL DEBUG] Recalculated scroll region and scrolled to bottom")
                         
                     except Exception as e:
-                        print(f"[AUTO SCROLL DEBUG] Error during auto-scroll: {e}")
-                        import traceback
-                        traceback.print_exc()
+                        logger.exception("[AUTO SCROLL DEBUG] Error during auto-scroll: %s", e)
                 
                 # Schedule after a delay to ensure UI updates are complete
-                print(f"[AUTO SCROLL DEBUG] Scheduling scroll_to_bottom after 200ms")
+                logger.debug("[AUTO SCROLL DEBUG] Scheduling scroll_to_bottom after 200ms")
                 self.window.after(200, scroll_to_bottom)  # Increased delay for better reliability
             else:
-                print(f"[AUTO SCROLL DEBUG] No canvas available for scrolling")
+                logger.debug("[AUTO SCROLL DEBUG] No canvas available for scrolling")
         except Exception as e:
-            print(f"[AUTO SCROLL DEBUG] Error in auto_scroll_to_bottom: {e}")
+            logger.error("[AUTO SCROLL DEBUG] Error in auto_scroll_to_bottom: %s", e)
     
     def show_display_settings(self):
         """Show display settings dialog"""
@@ -2914,26 +3209,9 @@ class SessionTrackerWindow:
         ttk.Label(dialog, text="Select fields to export:", font=("Arial", 12, "bold")).pack(pady=10)
         
         # Available fields for session export
-        available_fields = {
-            'card_name': 'Card Name',
-            'card_rarity': 'Card Rarity',
-            'quantity': 'Quantity',  # Add quantity field
-            'art_variant': 'Art Variant',
-            'tcg_price': 'TCGPlayer Low Price',
-            'tcg_market_price': 'TCGPlayer Market Price',
-            'set_code': 'Set Code',
-            'booster_set_name': 'Set Name',
-            'card_number': 'Card Number',
-            'card_art_variant': 'Card Art Variant',
-            'scrape_success': 'Scrape Success',
-            'source_url': 'Source URL',
-            'last_price_updt': 'Last Updated',
-            'timestamp': 'Added Timestamp',
-            'error_message': 'Error Message (if any)'
-        }
-        
         field_vars = {}
-        for field, label in available_fields.items():
+        for field in _SESSION_EXPORT_FIELDS:
+            label = _EXPORT_FIELD_LABELS[field]
             var = tk.BooleanVar(value=True)  # Default to selected
             field_vars[field] = var
             ttk.Checkbutton(dialog, text=label, variable=var).pack(anchor=tk.W, padx=20, pady=2)
@@ -2947,15 +3225,15 @@ class SessionTrackerWindow:
     
     def perform_session_excel_export(self, selected_fields):
         """Perform the actual Excel export for session"""
-        if not OPENPYXL_AVAILABLE:
-            messagebox.showerror("Export Error", "openpyxl library is not available. Please install it to use Excel export functionality.")
+        if not EXCEL_EXPORT_AVAILABLE:
+            messagebox.showerror("Export Error", "xlsxwriter or openpyxl is required for Excel export. Please install one of them to use Excel export functionality.")
             return
         
         # Create ExcelExports directory if it doesn't exist
         export_dir = os.path.join(os.getcwd(), "ExcelExports")
         if not os.path.exists(export_dir):
             os.makedirs(export_dir)
-            print(f"[EXPORT] Created ExcelExports directory: {export_dir}")
+            logger.info("[EXPORT] Created ExcelExports directory: %s", export_dir)
         
         # Generate default filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -2977,110 +3255,326 @@ class SessionTrackerWindow:
         if not file_path:
             return
         
+        headers = export_headers(tuple(selected_fields))
+        
+        # Write on a worker thread from a snapshot of the card list; cards added by voice
+        # meanwhile go into the next export
+        cards = list(self.pack_session.cards)
+        self.export_btn.config(state='disabled')
+        logger.debug("[SESSION EXPORT DEBUG] Starting export of %d cards from session", len(cards))
+        threading.Thread(target=self._session_export_worker, args=(file_path, cards, selected_fields, headers),
+                         daemon=True).start()
+    
+    def _session_export_worker(self, file_path, cards, selected_fields, headers):
+        """Write the session workbook off the Tk thread, then report back on it"""
         try:
-            # Create workbook
-            workbook = openpyxl.Workbook()
-            worksheet = workbook.active
-            worksheet.title = "Pack Session Cards"
-            
-            # Field labels
-            field_labels = {
-                'card_name': 'Card Name',
-                'card_rarity': 'Card Rarity',
-                'quantity': 'Quantity',  # Add quantity field
-                'art_variant': 'Art Variant',
-                'tcg_price': 'TCGPlayer Low Price',
-                'tcg_market_price': 'TCGPlayer Market Price',
-                'set_code': 'Set Code',
-                'booster_set_name': 'Set Name',
-                'card_number': 'Card Number',
-                'card_art_variant': 'Card Art Variant',
-                'scrape_success': 'Scrape Success',
-                'source_url': 'Source URL',
-                'last_price_updt': 'Last Updated',
-                'timestamp': 'Added Timestamp',
-                'error_message': 'Error Message (if any)'
-            }
-            
-            # Write headers
-            headers = [field_labels.get(field, field) for field in selected_fields]
-            worksheet.append(headers)
-            
-            # Style headers
-            for cell in worksheet["1:1"]:
-                cell.font = openpyxl.styles.Font(bold=True, color="FFFFFF")
-                cell.fill = openpyxl.styles.PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-                cell.alignment = openpyxl.styles.Alignment(horizontal="center", vertical="center")
-            
-            # Write data
-            print(f"[SESSION EXPORT DEBUG] Starting export of {len(self.pack_session.cards)} cards from session")
-            row_count = 0
-            for card in self.pack_session.cards:
-                row_data = []
-                for field in selected_fields:
-                    value = card.get(field, "N/A")
-                    if value is None:
-                        value = "N/A"
-                    row_data.append(value)
-                worksheet.append(row_data)
-                row_count += 1
-                if row_count <= 5:  # Debug first 5 cards
-                    print(f"[SESSION EXPORT DEBUG] Exported card {row_count}: {card.get("card_name", "Unknown")} - Qty: {card.get("quantity", "N/A")} - Rarity: {card.get("card_rarity", "N/A")}")
-            
-            print(f"[SESSION EXPORT DEBUG] Total cards exported: {row_count}")
-            print(f"[SESSION EXPORT DEBUG] Session cards count: {len(self.pack_session.cards)}")
-            
-            # Auto-size columns
-            for column in worksheet.columns:
-                max_length = 0
-                column = [cell for cell in column]
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)  # Cap at 50 chars
-                worksheet.column_dimensions[column[0].column_letter].width = adjusted_width
-            
-            # Save workbook
-            workbook.save(file_path)
-            
-            # Calculate total quantity for better messaging
-            total_quantity = sum(card.get('quantity', 1) for card in self.pack_session.cards)
-            
-            messagebox.showinfo("Export Success", 
-                               f"Excel file created successfully!\n\nFile: {file_path}\nCards exported: {len(self.pack_session.cards)} records\nTotal quantity: {total_quantity} cards")
-            print(f"[SESSION EXPORT] Session exported to: {file_path}")
-            print(f"[SESSION EXPORT] Records: {len(self.pack_session.cards)}, Total Quantity: {total_quantity}")
-            
+            write_cards_workbook(file_path, cards, selected_fields, headers)
+            error = None
         except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to create Excel file:\n{str(e)}")
-            print(f"[EXPORT] Export failed: {str(e)}")
-            
+            error = str(e)
+        # The tracker window may be closed by now, so report through the root window
+        self.parent.after(0, self._finish_session_export, file_path, cards, error)
+    
+    def _finish_session_export(self, file_path, cards, error):
+        """Re-enable export and show the result (Tk thread)"""
+        try:
+            if self.export_btn.winfo_exists():
+                self.export_btn.config(state='normal')
+        except tk.TclError:
+            pass
+        
+        if error is not None:
+            messagebox.showerror("Export Error", f"Failed to create Excel file:\n{error}")
+            logger.error("[EXPORT] Export failed: %s", error)
+            return
+        
+        total_quantity = sum(card.get('quantity', 1) for card in cards)
+        for row_count, card in enumerate(cards[:5], 1):  # Debug first 5 cards
+            logger.debug("[SESSION EXPORT DEBUG] Exported card %d: %s - Qty: %s - Rarity: %s",
+                         row_count, card.get('card_name', 'Unknown'), card.get('quantity', 'N/A'),
+                         card.get('card_rarity', 'N/A'))
+        logger.debug("[SESSION EXPORT DEBUG] Total cards exported: %d", len(cards))
+        
+        messagebox.showinfo("Export Success", 
+                           f"Excel file created successfully!\n\nFile: {file_path}\nCards exported: {len(cards)} records\nTotal quantity: {total_quantity} cards")
+        logger.info("[SESSION EXPORT] Session exported to: %s", file_path)
+        logger.info("[SESSION EXPORT] Records: %d, Total Quantity: %s", len(cards), total_quantity)
+    
     def close_window(self):
         """Close the session tracker window"""
+        self.cancel_pending_build()
+        
+        # Release PhotoImages before the widget tree goes away
+        for widget in self.card_widgets:
+            try:
+                if widget.winfo_exists():
+                    self.release_card_widget(widget)
+            except Exception:
+                pass
+        self.card_widgets = []
+        
+        # The ImageManager caches are shared with the main window, so they stay warm
         self.window.destroy()
 
+class LRUCache:
+    """Small bounded LRU map - O(1) promote on hit, evicts the oldest entry on overflow"""
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._data = OrderedDict()
+    
+    def get(self, key, default=None):
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+    
+    def set(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+    
+    def pop(self, key, default=None):
+        return self._data.pop(key, default)
+    
+    def clear(self):
+        self._data.clear()
+    
+    def __contains__(self, key):
+        return key in self._data
+    
+    def __len__(self):
+        return len(self._data)
+
+class TTLCache:
+    """Time-limited cache for slow-changing API responses, mirrored to JSON files across restarts"""
+    def __init__(self, ttl=600, cache_dir=None):
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self._data = {}  # key -> (expiry_ts, value)
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+    
+    def _path(self, key):
+        return os.path.join(self.cache_dir, hashlib.md5(key.encode()).hexdigest() + ".json")
+    
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+        
+        # Lazy-load a disk entry that is still within the TTL
+        if self.cache_dir:
+            path = self._path(key)
+            try:
+                mtime = os.path.getmtime(path)
+                if now - mtime < self.ttl:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        value = json.load(f)
+                    with self._lock:
+                        self._data[key] = (mtime + self.ttl, value)
+                    return value
+            except (OSError, ValueError):
+                pass
+        return None
+    
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.time() + self.ttl, value)
+        if self.cache_dir:
+            try:
+                with open(self._path(key), 'w', encoding='utf-8') as f:
+                    json.dump(value, f)
+            except (OSError, TypeError) as e:
+                print(f"[API CACHE] Failed to persist {key}: {e}")
+
 class ImageManager:
     """Handles card image caching and display with enhanced safety features and performance optimizations"""
     def __init__(self):
         self.image_cache_dir = os.path.join(os.path.expanduser("~"), ".ygo_ripper_cache", "images")
         self.create_cache_directory()
         
-        # Enhanced caching system
-        self.image_cache = {}  # In-memory cache for loaded images
-        self.focus_mode_cache = {}  # Separate cache for focus mode images
-        self.normal_mode_cache = {}  # Separate cache for normal mode images
-        
         self.threaded_loading_enabled = True  # Safety switch for threading
         self.max_cache_size = 1000  # Increased cache size for better performance
-        self.loading_lock = threading.Lock()  # Thread safety for cache operations
+        
+        # Enhanced caching system - bounded LRUs so long sessions don't grow without limit.
+        # Striped by card_id so the UI and preload threads only contend on the same card's shard.
+        self.cache_shard_count = 16
+        shard_size = max(1, self.max_cache_size // self.cache_shard_count)
+        self.cache_shards = [
+            {
+                'general': LRUCache(shard_size),  # In-memory cache for loaded images
+                'focus': LRUCache(shard_size),    # Separate cache for focus mode images
+                'normal': LRUCache(shard_size),   # Separate cache for normal mode images
+                'pixels': LRUCache(shard_size),   # Resized PIL images staged by worker threads
+                'lock': threading.RLock()         # Thread safety for this shard's cache operations
+            }
+            for _ in range(self.cache_shard_count)
+        ]
+        
+        # Single-flight map: concurrent loads of the same card share one download/resize
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        
+        # (card_id, image_url) -> {size_suffix: path}; avoids re-hashing the URL on every lookup
+        self._path_cache = {}
+        
+        # Filenames present in the cache dir, listed once - replaces a stat() per lookup
+        self._disk_files = set(os.listdir(self.image_cache_dir))
+        
+        # (cache dir st_mtime_ns, MB) from the last directory walk in get_cache_size
+        self._cache_size_memo = (None, 0.0)
+        
+        # Pooled HTTP session - image downloads reuse TCP/TLS connections to the image host
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # Background preload pool; the semaphore bounds queued work - once it is full new
+        # preloads are skipped instead of piling up undecoded downloads
+        self._preload_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="image-preload")
+        self._preload_slots = threading.BoundedSemaphore(32)
+        
+        # SQLite-backed index of files in the image cache dir - O(1) presence/size lookups
+        # instead of listdir/getsize/glob walks of the whole directory
+        self._index = self.open_cache_index()
         
         # Define standard sizes for different modes - reduced for better performance
         self.focus_mode_size = (60, 90)    # Smaller for focus mode - reduced by 25%
         self.normal_mode_size = (100, 145)  # Standard for normal mode - reduced by 33%
     
+    def _shard(self, card_id):
+        """Return the cache shard that owns card_id"""
+        return self.cache_shards[hash(card_id) & (self.cache_shard_count - 1)]
+    
+    def _cache_len(self, kind):
+        """Total number of entries of one cache kind across all shards"""
+        return sum(len(shard[kind]) for shard in self.cache_shards)
+    
+    def _clear_caches(self, *kinds):
+        """Clear the given cache kinds in every shard"""
+        for shard in self.cache_shards:
+            with shard['lock']:
+                for kind in kinds:
+                    shard[kind].clear()
+    
+    def _single_flight(self, key, func, *args):
+        """Run func once per key; callers arriving while it runs wait for the same result"""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            result = func(*args)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _claim_flight(self, key):
+        """Own key's in-flight slot without running anything; returns its Future, or None if taken"""
+        with self._inflight_lock:
+            if key in self._inflight:
+                return None
+            future = self._inflight[key] = concurrent.futures.Future()
+            return future
+    
+    def _finish_flight(self, key, future, result):
+        """Hand a claimed slot's result to its waiters and free the key"""
+        future.set_result(result)
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+    
+    def open_cache_index(self):
+        """Open the on-disk cache index and reconcile it with the cache dir listing"""
+        if not DISKCACHE_AVAILABLE:
+            return None
+        try:
+            index = diskcache.Cache(os.path.join(self.image_cache_dir, "index"))
+            # Files can be added or deleted while the app is closed, so sync the index
+            # against the listing taken in __init__ (new files are the only stat()s)
+            indexed = {key for key in index if isinstance(key, str) and key.startswith("card_")}
+            for filename in indexed - self._disk_files:
+                self._unindex_file(index, filename)
+            for filename in self._disk_files - indexed:
+                file_path = os.path.join(self.image_cache_dir, filename)
+                if filename.startswith("card_") and filename.endswith(".jpg") and os.path.isfile(file_path):
+                    self._index_file(index, filename, os.path.getsize(file_path))
+            return index
+        except Exception as e:
+            logger.warning("[IMAGE CACHE] Could not open cache index, using directory scans: %s", e)
+            return None
+    
+    @staticmethod
+    def _index_key(filename):
+        """(card_id, size_suffix) presence key for a card_<id>_<hash>[_<WxH>].jpg cache file"""
+        parts = filename[len("card_"):-len(".jpg")].rsplit('_', 2)
+        if len(parts) == 3 and 'x' in parts[2]:
+            return parts[0], parts[2]
+        return filename[len("card_"):-len(".jpg")].rsplit('_', 1)[0], ""
+    
+    def _index_file(self, index, filename, nbytes):
+        """Record one cache file and its size in the index"""
+        previous = index.get(filename, 0)
+        index[filename] = nbytes
+        index[self._index_key(filename)] = True
+        index.incr('__total_bytes__', nbytes - previous, default=0)
+    
+    def _unindex_file(self, index, filename):
+        """Drop one cache file's size and presence entries from the index"""
+        nbytes = index.pop(filename, None)
+        if nbytes is None:
+            return
+        # The presence key may be shared with another hash's file - dropping it only
+        # costs that card a reload, never a false "cached" answer
+        index.pop(self._index_key(filename), None)
+        index.incr('__total_bytes__', -nbytes, default=0)
+    
+    def _is_on_disk(self, path):
+        """O(1) check of the in-memory cache dir listing"""
+        return os.path.basename(path) in self._disk_files
+    
+    def forget_cached_file(self, path):
+        """Drop a missing or unreadable cache file from the dir listing and the index"""
+        self._disk_files.discard(os.path.basename(path))
+        if self._index is None:
+            return
+        try:
+            self._unindex_file(self._index, os.path.basename(path))
+        except Exception as e:
+            logger.warning("[IMAGE CACHE] Failed to unindex %s: %s", path, e)
+    
+    def record_cached_file(self, path):
+        """Add a freshly written cache file to the dir listing and the index"""
+        self._disk_files.add(os.path.basename(path))
+        if self._index is None:
+            return
+        try:
+            self._index_file(self._index, os.path.basename(path), os.path.getsize(path))
+        except Exception as e:
+            logger.warning("[IMAGE CACHE] Failed to index %s: %s", path, e)
+    
+    def close(self):
+        """Drop queued preloads and close the image HTTP session (app shutdown)"""
+        # Preload workers aren't daemon threads, so exit would otherwise drain the queue
+        self._preload_executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+    
     def create_cache_directory(self):
         """Create image cache directory if it doesn't exist"""
         os.makedirs(self.image_cache_dir, exist_ok=True)
@@ -3096,8 +3590,15 @@ class ImageManager:
     
     def get_cached_image_path(self, card_id, image_url, size_suffix=""):
         """Get the local path for a cached image with optional size suffix"""
-        filename = self.get_image_filename(card_id, image_url, size_suffix)
-        return os.path.join(self.image_cache_dir, filename)
+        paths = self._path_cache.get((card_id, image_url))
+        if paths is None:
+            paths = self._path_cache.setdefault((card_id, image_url), {})
+        
+        path = paths.get(size_suffix)
+        if path is None:
+            filename = self.get_image_filename(card_id, image_url, size_suffix)
+            path = paths[size_suffix] = os.path.join(self.image_cache_dir, filename)
+        return path
     
     def download_and_cache_image(self, card_id, image_url, max_size=(200, 300)):
         """Download and cache a card image, return local path with enhanced error handling"""
@@ -3105,87 +3606,109 @@ class ImageManager:
             cache_path = self.get_cached_image_path(card_id, image_url)
             
             # If already cached, return the path
-            if os.path.exists(cache_path):
-                print(f"[IMAGE CACHE] Using existing cached image for card {card_id}")
+            if self._is_on_disk(cache_path):
+                logger.debug("[IMAGE CACHE] Using existing cached image for card %s", card_id)
+                return cache_path
+            
+            # Concurrent callers for the same image wait on one download instead of racing
+            return self._single_flight(('download', cache_path), self._download_image_uncached,
+                                       card_id, image_url, cache_path, max_size)
+        except Exception as e:
+            logger.warning("[IMAGE CACHE] Error downloading image for card %s: %s", card_id, e)
+            return None
+    
+    def _download_image_uncached(self, card_id, image_url, cache_path, max_size):
+        """Download, resize and save one card image (called once per in-flight cache_path)"""
+        try:
+            # Another caller may have finished the download while we waited to own the key
+            if self._is_on_disk(cache_path):
                 return cache_path
             
             # Download the image
-            print(f"[IMAGE CACHE] Downloading image for card {card_id}: {image_url}")
+            logger.debug("[IMAGE CACHE] Downloading image for card %s: %s", card_id, image_url)
             try:
-                response = requests.get(image_url, timeout=10, stream=True)
+                response = self._session.get(image_url, timeout=10, stream=True)
                 response.raise_for_status()
             except Exception as download_error:
-                print(f"[IMAGE CACHE] Download failed for card {card_id}: {download_error}")
+                logger.warning("[IMAGE CACHE] Download failed for card %s: %s", card_id, download_error)
                 return None
             
-            # Save the original image
-            temp_path = cache_path + ".tmp"
+            # Keep the original bytes in memory - decoded and written to disk only once
             try:
-                with open(temp_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                print(f"[IMAGE CACHE] Downloaded image data for card {card_id}")
+                image_data = io.BytesIO()
+                for chunk in response.iter_content(chunk_size=8192):
+                    image_data.write(chunk)
+                image_data.seek(0)
+                logger.debug("[IMAGE CACHE] Downloaded image data for card %s", card_id)
             except Exception as save_error:
-                print(f"[IMAGE CACHE] Failed to save image data for card {card_id}: {save_error}")
+                logger.warning("[IMAGE CACHE] Failed to read image data for card %s: %s", card_id, save_error)
                 return None
             
             # Resize image to save space and standardize display
             if PIL_AVAILABLE:
                 try:
-                    print(f"[IMAGE CACHE] Processing image for card {card_id}")
-                    with Image.open(temp_path) as img:
-                        print(f"[IMAGE CACHE] Original image mode: {img.mode}, size: {img.size} for card {card_id}")
-                        
-                        # Convert to RGB if necessary
-                        if img.mode in ('RGBA', 'LA', 'P'):
-                            print(f"[IMAGE CACHE] Converting {img.mode} to RGB for card {card_id}")
-                            img = img.convert('RGB')
-                        
-                        # Resize while maintaining aspect ratio
-                        img.thumbnail(max_size, Image.Resampling.LANCZOS)
-                        print(f"[IMAGE CACHE] Resized to {img.size} for card {card_id}")
-                        
-                        img.save(cache_path, 'JPEG', quality=85, optimize=True)
-                        print(f"[IMAGE CACHE] Saved processed image for card {card_id}")
+                    logger.debug("[IMAGE CACHE] Processing image for card %s", card_id)
+                    _, saved = self._resize_and_save(image_data, cache_path, max_size, quality=85)
+                    if not saved:
+                        raise IOError("resized image was not written")
+                    logger.debug("[IMAGE CACHE] Saved processed image for card %s", card_id)
                 except Exception as pil_error:
-                    print(f"[IMAGE CACHE] PIL processing failed for card {card_id}: {pil_error}")
-                    # Fallback: just copy the file
-                    import shutil
+                    logger.warning("[IMAGE CACHE] PIL processing failed for card %s: %s", card_id, pil_error)
+                    # Fallback: write the original bytes
                     try:
-                        shutil.copy(temp_path, cache_path)
-                        print(f"[IMAGE CACHE] Used fallback copy for card {card_id}")
+                        with open(cache_path, 'wb') as f:
+                            f.write(image_data.getvalue())
+                        logger.debug("[IMAGE CACHE] Used fallback copy for card %s", card_id)
                     except Exception as copy_error:
-                        print(f"[IMAGE CACHE] Fallback copy failed for card {card_id}: {copy_error}")
+                        logger.warning("[IMAGE CACHE] Fallback copy failed for card %s: %s", card_id, copy_error)
                         return None
             else:
-                # If PIL not available, just copy the file
-                import shutil
+                # If PIL not available, just write the original bytes
                 try:
-                    shutil.copy(temp_path, cache_path)
-                    print(f"[IMAGE CACHE] Copied without PIL for card {card_id}")
+                    with open(cache_path, 'wb') as f:
+                        f.write(image_data.getvalue())
+                    logger.debug("[IMAGE CACHE] Copied without PIL for card %s", card_id)
                 except Exception as copy_error:
-                    print(f"[IMAGE CACHE] Copy failed for card {card_id}: {copy_error}")
+                    logger.warning("[IMAGE CACHE] Copy failed for card %s: %s", card_id, copy_error)
                     return None
             
-            # Remove temporary file
-            try:
-                os.remove(temp_path)
-            except Exception as cleanup_error:
-                print(f"[IMAGE CACHE] Failed to cleanup temp file for card {card_id}: {cleanup_error}")
-            
-            print(f"[IMAGE CACHE] Successfully cached image: {cache_path}")
+            self.record_cached_file(cache_path)
+            logger.debug("[IMAGE CACHE] Successfully cached image: %s", cache_path)
             return cache_path
             
         except Exception as e:
-            print(f"[IMAGE CACHE] Error downloading image for card {card_id}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[IMAGE CACHE] Error downloading image for card %s: %s", card_id, e)
             return None
     
+    def _resize_and_save(self, src, dst, size, quality=85):
+        """Decode src at reduced scale, thumbnail to size and save as JPEG; returns (image, saved)"""
+        # No context manager: the resized image is handed back, and single-frame JPEGs
+        # release their file as soon as load() has read the pixels
+        img = Image.open(src)
+        
+        # Let libjpeg decode at 1/2, 1/4 or 1/8 scale - must happen before load()
+        img.draft('RGB', size)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        
+        # Box pre-reduce, then a LANCZOS polish to the exact size
+        img.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+        
+        return img, self._save_resized(img, dst, quality)
+    
+    def _save_resized(self, img, dst, quality):
+        """Write a resized image as progressive JPEG; returns True on success"""
+        try:
+            img.save(dst, 'JPEG', quality=quality, optimize=True, progressive=True, subsampling=2)
+            return True
+        except Exception as save_error:
+            logger.warning("[IMAGE CACHE] Failed to save resized image %s: %s", dst, save_error)
+            return False
+    
     def load_image_for_display(self, card_id, image_url, display_size=(150, 220)):
         """Load image for Tkinter display, using pre-cached resized images to eliminate repeated resizing"""
         if not PIL_AVAILABLE:
-            print(f"[IMAGE CACHE] PIL not available for card {card_id}")
+            logger.debug("[IMAGE CACHE] PIL not available for card %s", card_id)
             return None
             
         try:
@@ -3193,27 +3716,58 @@ class ImageManager:
             is_focus_mode = display_size == self.focus_mode_size
             is_normal_mode = display_size == self.normal_mode_size
             
-            with self.loading_lock:  # Thread-safe cache operations
-                # Check appropriate mode-specific cache first
-                if is_focus_mode and card_id in self.focus_mode_cache:
-                    # Reduce verbose logging for cached images
-                    return self.focus_mode_cache[card_id]
-                elif is_normal_mode and card_id in self.normal_mode_cache:
-                    # Reduce verbose logging for cached images
-                    return self.normal_mode_cache[card_id]
+            photo = self._get_memory_cached(card_id, display_size, is_focus_mode, is_normal_mode)
+            if photo:
+                return photo
+            
+            # Cache miss - share the disk/decode work with any concurrent caller for this card and size
+            pil_image = self._single_flight((card_id, display_size), self._prepare_pil_image,
+                                            card_id, image_url, display_size)
+            if pil_image is None:
+                return None
+            
+            # PhotoImage is only safe on the Tk thread - workers just stage the pixels for it
+            if threading.current_thread() is not threading.main_thread():
+                return None
+            return self._to_photo(card_id, pil_image, display_size, is_focus_mode, is_normal_mode)
                 
-                # Fallback to general cache
-                cache_key = f"{card_id}_{display_size}"
-                if cache_key in self.image_cache:
-                    # Reduce verbose logging - only log every 50th cache hit to avoid spam
-                    if hasattr(self, '_cache_hit_counter'):
-                        self._cache_hit_counter += 1
-                    else:
-                        self._cache_hit_counter = 1
-                    
-                    if self._cache_hit_counter % 50 == 0:
-                        print(f"[IMAGE CACHE] Using general cached image for card {card_id} (hit #{self._cache_hit_counter})")
-                    return self.image_cache[cache_key]
+        except Exception as e:
+            logger.exception("[IMAGE CACHE] Error loading image for display card %s: %s", card_id, e)
+            return None
+    
+    def _to_photo(self, card_id, pil_image, display_size, is_focus_mode, is_normal_mode):
+        """Convert staged pixels to a PhotoImage and memory-cache it - Tk thread only"""
+        photo = ImageTk.PhotoImage(pil_image)
+        self.cache_image_in_memory(card_id, photo, display_size, is_focus_mode, is_normal_mode)
+        
+        # The PhotoImage now owns the pixels
+        shard = self._shard(card_id)
+        with shard['lock']:
+            shard['pixels'].pop((card_id, display_size))
+        return photo
+    
+    def _prepare_pil_image(self, card_id, image_url, display_size):
+        """Produce the resized PIL image for display (no Tk calls - safe on any thread)"""
+        try:
+            shard = self._shard(card_id)
+            with shard['lock']:
+                staged = shard['pixels'].get((card_id, display_size))
+            if staged is not None:
+                return staged
+            
+            pil_image = self._load_pil_image(card_id, image_url, display_size)
+            if pil_image is not None:
+                with shard['lock']:
+                    shard['pixels'].set((card_id, display_size), pil_image)
+            return pil_image
+            
+        except Exception as e:
+            logger.exception("[IMAGE CACHE] Error preparing image for card %s: %s", card_id, e)
+            return None
+    
+    def _load_pil_image(self, card_id, image_url, display_size):
+        """Load the display-size image from the disk cache, creating it if needed"""
+        try:
             
             # Generate size suffix for filename
             size_suffix = f"{display_size[0]}x{display_size[1]}"
@@ -3221,119 +3775,105 @@ class ImageManager:
             # Check if pre-resized image exists on disk
             resized_cache_path = self.get_cached_image_path(card_id, image_url, size_suffix)
             
-            if os.path.exists(resized_cache_path):
+            if self._is_on_disk(resized_cache_path):
                 # Reduce verbose logging for disk cache hits
                 try:
-                    # Load pre-resized image directly
-                    with Image.open(resized_cache_path) as img:
-                        img_copy = img.copy()
-                        if img_copy.mode not in ('RGB', 'RGBA'):
-                            img_copy = img_copy.convert('RGB')
-                        
-                        photo = ImageTk.PhotoImage(img_copy)
-                        
-                        # Cache in memory
-                        self.cache_image_in_memory(card_id, photo, display_size, is_focus_mode, is_normal_mode)
-                        return photo
+                    # Load pre-resized image directly - load() reads the pixels and releases the file,
+                    # so no extra copy() of the buffer is needed
+                    img = Image.open(resized_cache_path)
+                    img.load()
+                    
+                    # Plain RGB keeps PhotoImage on its straight block-copy path (no alpha/palette branch)
+                    if img.mode != 'RGB':
+                        img = img.convert('RGB')
+                    return img
                         
                 except Exception as e:
-                    print(f"[IMAGE CACHE] Error loading pre-resized image for card {card_id}: {e}")
-                    # Fall through to create resized version
+                    logger.warning("[IMAGE CACHE] Error loading pre-resized image for card %s: %s", card_id, e)
+                    # Stale listing entry - fall through to create resized version
+                    self.forget_cached_file(resized_cache_path)
             
             # Get original cached image path
             original_cache_path = self.get_cached_image_path(card_id, image_url)
-            print(f"[IMAGE CACHE] Original cache path for card {card_id}: {original_cache_path}")
+            logger.debug("[IMAGE CACHE] Original cache path for card %s: %s", card_id, original_cache_path)
             
             # Download if not cached
-            if not os.path.exists(original_cache_path):
-                print(f"[IMAGE CACHE] Downloading image for card {card_id}")
+            if not self._is_on_disk(original_cache_path):
+                logger.debug("[IMAGE CACHE] Downloading image for card %s", card_id)
                 original_cache_path = self.download_and_cache_image(card_id, image_url)
                 if not original_cache_path:
-                    print(f"[IMAGE CACHE] Failed to download image for card {card_id}")
+                    logger.warning("[IMAGE CACHE] Failed to download image for card %s", card_id)
                     return None
             
             # Create and cache resized version
-            print(f"[IMAGE CACHE] Creating resized version for card {card_id}")
+            logger.debug("[IMAGE CACHE] Creating resized version for card %s", card_id)
             try:
-                with Image.open(original_cache_path) as img:
-                    print(f"[IMAGE CACHE] Image opened successfully for card {card_id}, mode: {img.mode}, size: {img.size}")
-                    
-                    # Create a copy to avoid issues with the context manager
-                    img_copy = img.copy()
-                    
-                    # Ensure RGB mode for consistent handling
-                    if img_copy.mode not in ('RGB', 'RGBA'):
-                        print(f"[IMAGE CACHE] Converting image mode from {img_copy.mode} to RGB for card {card_id}")
-                        img_copy = img_copy.convert('RGB')
-                    
-                    # Resize for display
-                    img_copy.thumbnail(display_size, Image.Resampling.LANCZOS)
-                    print(f"[IMAGE CACHE] Image resized to {img_copy.size} for card {card_id}")
-                    
-                    # Save the resized version to disk for future use
-                    try:
-                        img_copy.save(resized_cache_path, 'JPEG', quality=85, optimize=True)
-                        print(f"[IMAGE CACHE] Saved resized image to {resized_cache_path}")
-                    except Exception as save_error:
-                        print(f"[IMAGE CACHE] Failed to save resized image for card {card_id}: {save_error}")
-                    
-                    # Convert to PhotoImage for Tkinter
-                    print(f"[IMAGE CACHE] Converting to PhotoImage for card {card_id}")
-                    photo = ImageTk.PhotoImage(img_copy)
-                    print(f"[IMAGE CACHE] PhotoImage created successfully for card {card_id}")
-                    
-                    # Cache in memory
-                    self.cache_image_in_memory(card_id, photo, display_size, is_focus_mode, is_normal_mode)
-                    return photo
+                # Quality 80 is indistinguishable at thumbnail size and keeps warm-start reads small
+                img, saved = self._resize_and_save(original_cache_path, resized_cache_path, display_size, quality=80)
+                if saved:
+                    self.record_cached_file(resized_cache_path)
+                    logger.debug("[IMAGE CACHE] Saved resized image to %s", resized_cache_path)
+                return img
                     
             except Exception as img_error:
-                print(f"[IMAGE CACHE] PIL operation failed for card {card_id}: {img_error}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("[IMAGE CACHE] PIL operation failed for card %s: %s", card_id, img_error)
                 return None
                 
         except Exception as e:
-            print(f"[IMAGE CACHE] Error loading image for display card {card_id}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[IMAGE CACHE] Error loading image for display card %s: %s", card_id, e)
             return None
     
+    def _get_memory_cached(self, card_id, display_size, is_focus_mode, is_normal_mode):
+        """Look up a PhotoImage in the memory cache for its size (get() promotes the entry)"""
+        shard = self._shard(card_id)
+        with shard['lock']:  # Thread-safe cache operations
+            if is_focus_mode:
+                return shard['focus'].get(card_id)
+            if is_normal_mode:
+                return shard['normal'].get(card_id)
+            # Non-standard sizes are rare - only they go through the general cache
+            return shard['general'].get((card_id, display_size))
+    
     def cache_image_in_memory(self, card_id, photo, display_size, is_focus_mode, is_normal_mode):
         """Helper method to cache image in appropriate memory caches"""
-        with self.loading_lock:
-            # Store in mode-specific cache (reduce logging verbosity)
+        shard = self._shard(card_id)
+        with shard['lock']:
+            # The mode-specific caches cover both standard sizes; the LRU evicts the oldest entry once full
             if is_focus_mode:
-                self.focus_mode_cache[card_id] = photo
+                shard['focus'].set(card_id, photo)
             elif is_normal_mode:
-                self.normal_mode_cache[card_id] = photo
-            
-            # Also store in general cache with size limit check
-            cache_key = f"{card_id}_{display_size}"
-            if len(self.image_cache) < self.max_cache_size:
-                self.image_cache[cache_key] = photo
+                shard['normal'].set(card_id, photo)
             else:
-                # Only log cache full message occasionally to avoid spam
-                if not hasattr(self, '_cache_full_logged') or not self._cache_full_logged:
-                    print(f"[IMAGE CACHE] General cache full ({len(self.image_cache)}/{self.max_cache_size}), not caching image for card {card_id}")
-                    self._cache_full_logged = True
-                
-                # Optionally clear some cache to make room
-                if len(self.image_cache) >= self.max_cache_size * 1.2:  # 20% over limit
-                    print(f"[IMAGE CACHE] Cache size exceeded limit significantly, clearing general memory cache")
-                    self.clear_memory_cache()
-                    self._cache_full_logged = False  # Reset logging flag after cleanup
+                shard['general'].set((card_id, display_size), photo)
     
     def get_cache_size(self):
         """Get the total size of the image cache in MB"""
+        if self._index is not None:
+            try:
+                return self._index.get('__total_bytes__', 0) / (1024 * 1024)
+            except Exception:
+                pass
+        
+        # Adding or removing a file bumps the directory mtime, so an unchanged
+        # mtime means the last walk's total still holds
+        try:
+            dir_mtime = os.stat(self.image_cache_dir).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if dir_mtime is not None and self._cache_size_memo[0] == dir_mtime:
+            return self._cache_size_memo[1]
+        
         total_size = 0
         try:
-            for filename in os.listdir(self.image_cache_dir):
-                file_path = os.path.join(self.image_cache_dir, filename)
-                if os.path.isfile(file_path):
-                    total_size += os.path.getsize(file_path)
+            with os.scandir(self.image_cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        total_size += entry.stat().st_size
         except:
             pass
-        return total_size / (1024 * 1024)  # Convert to MB
+        cache_size = total_size / (1024 * 1024)  # Convert to MB
+        self._cache_size_memo = (dir_mtime, cache_size)
+        return cache_size
     
     def clear_cache(self):
         """Clear the image cache directory"""
@@ -3342,49 +3882,54 @@ class ImageManager:
                 file_path = os.path.join(self.image_cache_dir, filename)
                 if os.path.isfile(file_path):
                     os.remove(file_path)
-            self.image_cache.clear()
-            print("[IMAGE CACHE] Cache cleared")
+            if self._index is not None:
+                self._index.clear()
+            self._path_cache.clear()
+            self._disk_files.clear()
+            self._cache_size_memo = (None, 0.0)
+            self._clear_caches('general')
+            logger.info("[IMAGE CACHE] Cache cleared")
         except Exception as e:
-            print(f"[IMAGE CACHE] Error clearing cache: {e}")
+            logger.warning("[IMAGE CACHE] Error clearing cache: %s", e)
     
     def clear_memory_cache(self):
         """Clear only the in-memory image cache to reduce memory pressure"""
         try:
-            cache_size = len(self.image_cache)
-            focus_cache_size = len(self.focus_mode_cache)
-            normal_cache_size = len(self.normal_mode_cache)
+            cache_size = self._cache_len('general')
+            focus_cache_size = self._cache_len('focus')
+            normal_cache_size = self._cache_len('normal')
             
-            self.image_cache.clear()
+            self._clear_caches('general', 'pixels')
             # Don't clear mode-specific caches as they're more valuable for performance
-            # self.focus_mode_cache.clear()
-            # self.normal_mode_cache.clear()
             
-            print(f"[IMAGE CACHE] General memory cache cleared - freed {cache_size} images")
-            print(f"[IMAGE CACHE] Mode-specific caches preserved (focus: {focus_cache_size}, normal: {normal_cache_size})")
+            logger.debug("[IMAGE CACHE] General memory cache cleared - freed %s images", cache_size)
+            logger.debug("[IMAGE CACHE] Mode-specific caches preserved (focus: %s, normal: %s)", focus_cache_size, normal_cache_size)
         except Exception as e:
-            print(f"[IMAGE CACHE] Error clearing memory cache: {e}")
+            logger.warning("[IMAGE CACHE] Error clearing memory cache: %s", e)
     
     def clear_mode_specific_caches(self):
         """Clear mode-specific caches when needed (e.g., low memory)"""
         try:
-            focus_size = len(self.focus_mode_cache)
-            normal_size = len(self.normal_mode_cache)
+            focus_size = self._cache_len('focus')
+            normal_size = self._cache_len('normal')
             
-            self.focus_mode_cache.clear()
-            self.normal_mode_cache.clear()
+            self._clear_caches('focus', 'normal')
             
-            print(f"[IMAGE CACHE] Mode-specific caches cleared - freed {focus_size + normal_size} images")
+            logger.debug("[IMAGE CACHE] Mode-specific caches cleared - freed %s images", focus_size + normal_size)
         except Exception as e:
-            print(f"[IMAGE CACHE] Error clearing mode-specific caches: {e}")
+            logger.warning("[IMAGE CACHE] Error clearing mode-specific caches: %s", e)
     
     def get_cache_stats(self):
         """Get cache statistics for monitoring"""
         try:
+            general_size = self._cache_len('general')
+            focus_size = self._cache_len('focus')
+            normal_size = self._cache_len('normal')
             return {
-                'general_cache_size': len(self.image_cache),
-                'focus_cache_size': len(self.focus_mode_cache),
-                'normal_cache_size': len(self.normal_mode_cache),
-                'total_cached_images': len(self.image_cache) + len(self.focus_mode_cache) + len(self.normal_mode_cache)
+                'general_cache_size': general_size,
+                'focus_cache_size': focus_size,
+                'normal_cache_size': normal_size,
+                'total_cached_images': general_size + focus_size + normal_size
             }
         except Exception:
             return {
@@ -3395,18 +3940,96 @@ class ImageManager:
             }
     
     def preload_image_for_both_modes(self, card_id, image_url):
-        """Pre-load image in both focus and normal mode sizes for fast switching - optimized version"""
+        """Queue pre-loading of both focus and normal mode sizes; returns the Future (None if the queue is full)"""
         try:
-            # Pre-load focus mode image (this will create resized cache on disk if needed)
-            focus_photo = self.load_image_for_display(card_id, image_url, self.focus_mode_size)
+            # One pool job decodes the original once for both sizes (creates resized cache on disk if needed).
+            # Callers are on the Tk thread, so a full queue skips the warm-up instead of blocking -
+            # get_image still loads the card on demand
+            return self._submit_preload(self._prepare_both_sizes, card_id, image_url)
+        except Exception as e:
+            logger.warning("[IMAGE CACHE] Error pre-loading images for card %s: %s", card_id, e)
+            return None
+    
+    def _prepare_both_sizes(self, card_id, image_url):
+        """Stage focus and normal size pixels, decoding the original at most once"""
+        try:
+            to_resize = []
+            for size in (self.focus_mode_size, self.normal_mode_size):
+                size_suffix = f"{size[0]}x{size[1]}"
+                if self._is_on_disk(self.get_cached_image_path(card_id, image_url, size_suffix)):
+                    # Already resized on disk - loading it is cheap
+                    self._single_flight((card_id, size), self._prepare_pil_image, card_id, image_url, size)
+                else:
+                    to_resize.append(size)
+            
+            # Claim the same single-flight keys display loads use before decoding, so a
+            # concurrent load_image_for_display waits for these pixels instead of resizing
+            # and writing the same file; sizes someone else is already producing are skipped
+            claimed = {}
+            for size in to_resize:
+                future = self._claim_flight((card_id, size))
+                if future is not None:
+                    claimed[size] = future
+            if not claimed:
+                return
+        except Exception as e:
+            logger.exception("[IMAGE CACHE] Error pre-loading images for card %s: %s", card_id, e)
+            return
+        
+        results = {}
+        try:
+            shard = self._shard(card_id)
+            with shard['lock']:
+                for size in claimed:
+                    staged = shard['pixels'].get((card_id, size))
+                    if staged is not None:
+                        results[size] = staged  # Finished by another caller just before the claim
+            missing = [size for size in claimed if size not in results]
+            if not missing:
+                return
             
-            # Pre-load normal mode image (this will create resized cache on disk if needed)
-            normal_photo = self.load_image_for_display(card_id, image_url, self.normal_mode_size)
+            original_cache_path = self.download_and_cache_image(card_id, image_url)
+            if not original_cache_path:
+                return
+            
+            # Decode once at the scale the largest missing size needs; draft() must precede load()
+            img = Image.open(original_cache_path)
+            img.draft('RGB', max(missing))
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            img.load()
+            
+            for size in missing:
+                resized = img.copy()
+                resized.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
                 
-            return focus_photo, normal_photo
+                resized_cache_path = self.get_cached_image_path(card_id, image_url, f"{size[0]}x{size[1]}")
+                if self._save_resized(resized, resized_cache_path, quality=80):
+                    self.record_cached_file(resized_cache_path)
+                
+                # PhotoImage conversion happens on the Tk thread at first display
+                with shard['lock']:
+                    shard['pixels'].set((card_id, size), resized)
+                results[size] = resized
+                    
         except Exception as e:
-            print(f"[IMAGE CACHE] Error pre-loading images for card {card_id}: {e}")
-            return None, None
+            logger.exception("[IMAGE CACHE] Error pre-loading images for card %s: %s", card_id, e)
+        finally:
+            # Waiters get None for a size that failed, as from a failed _prepare_pil_image
+            for size, future in claimed.items():
+                self._finish_flight((card_id, size), future, results.get(size))
+    
+    def _submit_preload(self, func, *args):
+        """Submit one preload job to the bounded pool; returns None if it is full"""
+        if not self._preload_slots.acquire(blocking=False):
+            return None
+        try:
+            future = self._preload_executor.submit(func, *args)
+        except Exception:
+            self._preload_slots.release()
+            raise
+        future.add_done_callback(lambda _: self._preload_slots.release())
+        return future
     
     def get_image(self, card, focus_mode=False):
         """Main method to get card image for display with proper mode handling"""
@@ -3415,12 +4038,12 @@ class ImageManager:
             card_images = card.get('card_images', [])
             
             if not card_images or len(card_images) == 0:
-                print(f"[IMAGE CACHE] No images available for card {card_id}")
+                logger.debug("[IMAGE CACHE] No images available for card %s", card_id)
                 return None
                 
             image_url = card_images[0].get('image_url')
             if not image_url:
-                print(f"[IMAGE CACHE] No image URL for card {card_id}")
+                logger.debug("[IMAGE CACHE] No image URL for card %s", card_id)
                 return None
             
             # Get appropriate display size based on mode
@@ -3435,94 +4058,363 @@ class ImageManager:
             return self.load_image_for_display(card_id, image_url, display_size)
             
         except Exception as e:
-            print(f"[IMAGE CACHE] Error getting image for card {card.get('id', 'unknown')}: {e}")
+            logger.warning("[IMAGE CACHE] Error getting image for card %s: %s", card.get('id', 'unknown'), e)
             return None
 
     def is_image_fully_cached(self, card_id, focus_mode=False):
         """Check if image is fully cached (both in memory and on disk) for specified mode"""
         try:
-            # Check memory cache first
-            with self.loading_lock:
-                if focus_mode and card_id in self.focus_mode_cache:
-                    return True
-                elif not focus_mode and card_id in self.normal_mode_cache:
-                    return True
+            shard = self._shard(card_id)
             
-            # Check general memory cache
-            display_size = self.focus_mode_size if focus_mode else self.normal_mode_size
-            cache_key = f"{card_id}_{display_size}"
-            with self.loading_lock:
-                if cache_key in self.image_cache:
+            # Check memory cache first - one lock transition for the whole membership test
+            with shard['lock']:
+                if card_id in shard['focus' if focus_mode else 'normal']:
                     return True
             
-            # For disk cache, we need to check the cache directory for any files matching the card_id and size pattern
+            # Disk cache checks happen outside the shard lock
+            display_size = self.focus_mode_size if focus_mode else self.normal_mode_size
             size_suffix = f"{display_size[0]}x{display_size[1]}"
-            cache_pattern = f"card_{card_id}_*_{size_suffix}.jpg"
             
-            if hasattr(self, 'cache_dir') and os.path.exists(self.cache_dir):
-                import glob
-                matching_files = glob.glob(os.path.join(self.cache_dir, "images", cache_pattern))
-                if matching_files:
-                    return True
+            if self._index is not None:
+                return (str(card_id), size_suffix) in self._index
             
-            return False
+            # No index - look for any file matching the card_id and size pattern
+            import glob
+            cache_pattern = f"card_{card_id}_*_{size_suffix}.jpg"
+            return bool(glob.glob(os.path.join(self.image_cache_dir, cache_pattern)))
             
         except Exception as e:
-            print(f"[IMAGE CACHE] Error checking cache status for card {card_id}: {e}")
+            logger.warning("[IMAGE CACHE] Error checking cache status for card %s: %s", card_id, e)
             return False
 
     def get_cached_image_for_mode(self, card_id, focus_mode=False):
         """Get cached image for specific mode without loading"""
         try:
-            with self.loading_lock:
-                if focus_mode and card_id in self.focus_mode_cache:
-                    return self.focus_mode_cache[card_id]
-                elif not focus_mode and card_id in self.normal_mode_cache:
-                    return self.normal_mode_cache[card_id]
-            return None
+            shard = self._shard(card_id)
+            with shard['lock']:
+                return shard['focus' if focus_mode else 'normal'].get(card_id)
         except Exception as e:
-            print(f"[IMAGE CACHE] Error getting cached image for card {card_id}: {e}")
+            logger.warning("[IMAGE CACHE] Error getting cached image for card %s: %s", card_id, e)
             return None
 
+def parse_json_response(response):
+    """Decode a JSON response body, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+    return response.json()
+
+def parse_json_stream(response, min_stream_bytes=64 * 1024):
+    """Decode a stream=True JSON response incrementally with ijson when it is large"""
+    length = response.headers.get('Content-Length')
+    # Small bodies aren't worth the streaming setup; DEBUG logging needs the buffered body
+    if (not IJSON_AVAILABLE or logger.isEnabledFor(logging.DEBUG)
+            or (length is not None and int(length) < min_stream_bytes)):
+        return parse_json_response(response)
+    response.raw.decode_content = True  # Let urllib3 undo gzip/br before ijson sees it
+    # Reading response.raw bypasses requests' own error wrapping, so map mid-body failures
+    # to the RequestException types callers already handle (as iter_content would)
+    try:
+        return dict(ijson.kvitems(response.raw, '', use_float=True))
+    except ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e, response=response) from e
+    except ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e, response=response) from e
+    except (DecodeError, ijson.JSONError) as e:
+        raise requests.exceptions.ContentDecodingError(e, response=response) from e
+    finally:
+        response.close()
+
+class lazy_json:
+    """Defers json.dumps until a log record is actually emitted"""
+    def __init__(self, data):
+        self.data = data
+    
+    def __str__(self):
+        return json.dumps(self.data, indent=2)
+
 def log_api_call(method, url, headers=None, body=None, response=None, error=None):
-    """Comprehensive API call logging"""
-    logger.info("=" * 80)
-    logger.info(f"🌐 API CALL: {method.upper()} {url}")
-    logger.info("=" * 80)
+    """Comprehensive API call logging - headers and bodies only at DEBUG"""
+    if not logger.isEnabledFor(logging.INFO):
+        if error:
+            logger.error("❌ ERROR: %s", error)
+        return
+    
+    logger.info(_HR80)
+    logger.info("🌐 API CALL: %s %s", method.upper(), url)
+    logger.info(_HR80)
+    
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     # Log request details
-    if headers:
-        logger.info("📤 REQUEST HEADERS:")
+    if headers and debug:
+        logger.debug("📤 REQUEST HEADERS:")
         for key, value in headers.items():
-            logger.info(f"  {key}: {value}")
+            logger.debug("  %s: %s", key, value)
     
-    if body:
-        logger.info("📤 REQUEST BODY:")
+    if body and debug:
+        logger.debug("📤 REQUEST BODY:")
         if isinstance(body, dict):
-            logger.info(json.dumps(body, indent=2))
+            logger.debug("%s", lazy_json(body))
         else:
-            logger.info(str(body))
+            logger.debug("%s", body)
     
     # Log response details
     if response:
-        logger.info(f"📥 RESPONSE STATUS: {response.status_code}")
-        logger.info("📥 RESPONSE HEADERS:")
-        for key, value in response.headers.items():
-            logger.info(f"  {key}: {value}")
-        
-        try:
-            response_data = response.json()
-            logger.info("📥 RESPONSE BODY:")
-            logger.info(json.dumps(response_data, indent=2))
-        except:
-            logger.info("📥 RESPONSE BODY (non-JSON):")
-            logger.info(response.text[:1000] + "..." if len(response.text) > 1000 else response.text)
+        logger.info("📥 RESPONSE STATUS: %s", response.status_code)
+        if debug:
+            logger.debug("📥 RESPONSE HEADERS:")
+            for key, value in response.headers.items():
+                logger.debug("  %s: %s", key, value)
+            
+            try:
+                response_data = parse_json_response(response)
+                logger.debug("📥 RESPONSE BODY:")
+                logger.debug("%s", lazy_json(response_data))
+            except:
+                logger.debug("📥 RESPONSE BODY (non-JSON):")
+                logger.debug("%s", response.text[:1000] + "..." if len(response.text) > 1000 else response.text)
     
     # Log errors
     if error:
-        logger.error(f"❌ ERROR: {str(error)}")
+        logger.error("❌ ERROR: %s", error)
     
-    logger.info("=" * 80)
+    logger.info(_HR80)
+
+# Common YGO card name patterns and phonetic substitutions for lenient search
+_CARD_NAME_SUBSTITUTIONS = {
+    'yu': ['you', 'u'],
+    'gi': ['gee', 'ji'],
+    'oh': ['o'],
+    'elemental': ['elemental', 'element'],
+    'hero': ['hiro', 'heero', 'hero'],
+    'evil': ['evil', 'evel'],
+    'dark': ['dark', 'drak'],
+    'gaia': ['gaia', 'gaya', 'guy', 'gya'],
+    'cyber': ['siber', 'cyber'],
+    'dragon': ['drago', 'drag'],
+    'magician': ['magic', 'mage'],
+    'warrior': ['war', 'warrior'],
+    'machine': ['mach', 'machin'],
+    'beast': ['best', 'beast'],
+    'fiend': ['fend', 'fiend'],
+    'spellcaster': ['spell', 'caster'],
+    'aqua': ['agua', 'aqua'],
+    'winged': ['wing', 'winged'],
+    'thunder': ['under', 'thunder'],
+    'zombie': ['zomb', 'zombie'],
+    'plant': ['plan', 'plant'],
+    'insect': ['insec', 'insect'],
+    'rock': ['rok', 'rock'],
+    'pyro': ['fire', 'pyro'],
+    'sea': ['see', 'sea'],
+    'divine': ['divin', 'divine'],
+    # Add compound word handling
+    'metal flame': ['metalflame', 'metal flame'],
+    'flame': ['flame', 'flam'],
+    'metal': ['metal', 'mettle']
+}
+
+@functools.lru_cache(maxsize=1024)
+def get_card_name_variants(name):
+    """Generate alternative spellings and pronunciations for YGO cards"""
+    variants = [name]
+    
+    # Create phonetic alternatives
+    lower_name = name.lower()
+    for original, alternatives in _CARD_NAME_SUBSTITUTIONS.items():
+        if original in lower_name:
+            for alt in alternatives:
+                variants.append(lower_name.replace(original, alt))
+    
+    # Add compound word variants (for cases like "metal flame" -> "metalflame")
+    words = lower_name.split()
+    if len(words) >= 2:
+        # Add version with spaces removed
+        variants.append(''.join(words))
+        # Add version with different spacing
+        for i in range(1, len(words)):
+            compound_variant = ''.join(words[:i]) + ' ' + ' '.join(words[i:])
+            variants.append(compound_variant)
+    
+    # Remove duplicates (case-insensitively) while preserving order; first spelling wins
+    unique_variants = {}
+    for variant in variants:
+        unique_variants.setdefault(variant.lower(), variant)
+    
+    return tuple(unique_variants.values())
+
+_TOKEN_RE = re.compile(r'\w+')
+_TOKEN_PREFIX_LEN = 4  # Shared prefix that puts "magic" and "magician" in one bucket
+
+def name_index_tokens(name):
+    """Words of a name plus their short prefixes, as inverted-index keys"""
+    keys = set()
+    for token in _TOKEN_RE.findall(name.lower()):
+        keys.add(token)
+        if len(token) > _TOKEN_PREFIX_LEN:
+            keys.add(token[:_TOKEN_PREFIX_LEN])
+    return keys
+
+_NORMALIZE_RE = re.compile(r'[^\w\s]')
+
+@functools.lru_cache(maxsize=4096)
+def clean_card_name(name):
+    """Lowercase a card name and strip punctuation for word-level matching"""
+    return _NORMALIZE_RE.sub('', name.lower())
+
+_NGRAM_LEN = 3
+_NGRAM_MIN_SHARED = 2  # A misheard name still shares a couple of 3-grams with the real one
+
+def name_ngrams(name):
+    """Character 3-grams of a cleaned, space-free name (so "metal flame" meets "metalflame")"""
+    compact = clean_card_name(name).replace(' ', '')
+    return {compact[i:i + _NGRAM_LEN] for i in range(len(compact) - _NGRAM_LEN + 1)}
+
+def card_name_norm(name):
+    """Word-matching forms of a card name, built once per card by the match index"""
+    clean = clean_card_name(name)
+    words = tuple(clean.split())
+    return {'key': _fuzz_key(name), 'clean': clean, 'words': words, 'wordset': frozenset(words),
+            'nospace': clean.replace(' ', '')}
+
+def _cannot_match(a, b, cutoff):
+    """True if fuzz.ratio(a, b) cannot reach cutoff: the Indel score is at most 2*min/(la+lb)"""
+    la, lb = len(a), len(b)
+    return 200 * min(la, lb) < cutoff * (la + lb)
+
+def name_word_matches(input_word, card_words):
+    """True if a spoken word substring-matches or fuzzily matches (>=80) any card name word"""
+    # Exact substring match first, but only for meaningful words
+    # Avoid false positives from very short words like "a", "i", "of", "the"
+    if len(input_word) >= 3:
+        for card_word in card_words:
+            if len(card_word) >= 3 and (input_word in card_word or card_word in input_word):
+                return True
+    # Fuzzy similarity against all words, in one C++ call with rapidfuzz
+    if RAPIDFUZZ_AVAILABLE:
+        return process.extractOne(input_word, card_words, scorer=fuzz.ratio,
+                                  processor=None, score_cutoff=80) is not None
+    return any(fuzz.ratio(input_word, card_word) >= 80 for card_word in card_words
+               if not _cannot_match(input_word, card_word, 80))
+
+@functools.lru_cache(maxsize=1024)
+def rarity_similarity(input_rarity, set_rarity):
+    """fuzz.ratio between two normalised rarity strings; a set has only ~10 distinct rarities"""
+    return fuzz.ratio(input_rarity, set_rarity)
+
+def rarity_match_score(input_rarity, set_rarity):
+    """Score one normalised rarity pair: exact 100, partial 80, else fuzzy from 70% scaled down"""
+    if set_rarity == input_rarity:
+        return 100
+    if input_rarity in set_rarity or set_rarity in input_rarity:
+        return 80
+    similarity = rarity_similarity(input_rarity, set_rarity)
+    return similarity * 0.7 if similarity >= 70 else 0
+
+def normalize_set_cards(cards):
+    """Give every card a card_sets tuple so hot loops can index it directly"""
+    for card in cards:
+        card['card_sets'] = tuple(card.get('card_sets') or ())
+    return cards
+
+def write_cards_workbook(file_path, cards, selected_fields, headers):
+    """Write cards as one styled "Pack Session Cards" sheet, with xlsxwriter when available"""
+    if XLSXWRITER_AVAILABLE:
+        _write_cards_xlsxwriter(file_path, cards, selected_fields, headers)
+    else:
+        _write_cards_openpyxl(file_path, cards, selected_fields, headers)
+
+def _write_cards_xlsxwriter(file_path, cards, selected_fields, headers):
+    """xlsxwriter backend: constant_memory flushes each row once the next one starts"""
+    # Plain values like openpyxl writes them - no auto hyperlinks or formulas from strings
+    workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True,
+                                               'strings_to_urls': False,
+                                               'strings_to_formulas': False})
+    try:
+        worksheet = workbook.add_worksheet("Pack Session Cards")
+        header_format = workbook.add_format({'bold': True, 'font_color': 'white', 'bg_color': '#4F81BD',
+                                             'align': 'center', 'valign': 'vcenter'})
+        worksheet.write_row(0, 0, headers, header_format)
+        
+        # Column widths are free to set after the rows, so measure while writing
+        col_widths = [len(header) for header in headers]
+        for row_idx, card in enumerate(cards, 1):
+            row_data = []
+            for c, field in enumerate(selected_fields):
+                value = card.get(field, "N/A")
+                if value is None:
+                    value = "N/A"
+                value_len = len(value if isinstance(value, str) else str(value))
+                if value_len > col_widths[c]:
+                    col_widths[c] = value_len
+                row_data.append(value)
+            worksheet.write_row(row_idx, 0, row_data)
+        for c, max_length in enumerate(col_widths):
+            worksheet.set_column(c, c, min(max_length + 2, 50))  # Cap at 50 chars
+    finally:
+        workbook.close()
+
+def _write_cards_openpyxl(file_path, cards, selected_fields, headers):
+    """openpyxl fallback in write-only mode (rows stream to the file)"""
+    import openpyxl
+    from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
+    from openpyxl.utils import get_column_letter
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.writer.excel import ExcelWriter as OpenpyxlExcelWriter
+    
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title="Pack Session Cards")
+    
+    # Write-only sheets take column widths before the first row, so build the rows
+    # and measure them in one pass (each value is looked up and sized once)
+    col_widths = [len(header) for header in headers]
+    rows = []
+    for card in cards:
+        row_data = []
+        for c, field in enumerate(selected_fields):
+            value = card.get(field, "N/A")
+            if value is None:
+                value = "N/A"
+            value_len = len(value if isinstance(value, str) else str(value))
+            if value_len > col_widths[c]:
+                col_widths[c] = value_len
+            row_data.append(value)
+        rows.append(row_data)
+    for c, max_length in enumerate(col_widths, 1):
+        worksheet.column_dimensions[get_column_letter(c)].width = min(max_length + 2, 50)  # Cap at 50 chars
+    
+    # Header styles go on the cells themselves - appended rows can't be restyled.
+    # One registered named style is a single assignment per cell and one styles.xml entry
+    workbook.add_named_style(NamedStyle(name="ygo_header",
+                                        font=Font(bold=True, color="FFFFFF"),
+                                        fill=PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid"),
+                                        alignment=Alignment(horizontal="center", vertical="center")))
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(worksheet, value=header)
+        cell.style = "ygo_header"
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+    
+    for row_data in rows:
+        worksheet.append(row_data)
+    
+    # Same as workbook.save(), but with our own archive so the deflate level can be set
+    archive = zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True,
+                              compresslevel=_EXPORT_ZIP_LEVEL)
+    try:
+        OpenpyxlExcelWriter(workbook, archive).save()
+    except Exception:
+        # Don't leave the archive open or a truncated .xlsx behind
+        archive.close()
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+        raise
 
 class PackRipperSession:
     """Manages pack ripping session data"""
@@ -3533,12 +4425,15 @@ class PackRipperSession:
         self.session_file = "pack_session.json"
         self.auto_save_interval = 30  # seconds
         
-    def add_card(self, card_data):
-        """Add a card to the session"""
-        self.cards.append({
+    def add_card(self, card_data, **fields):
+        """Add a card (plus any extra fields) to the session and return the stored card dict"""
+        card = {
             **card_data,
+            **fields,
             'timestamp': datetime.now().isoformat()
-        })
+        }
+        self.cards.append(card)
+        return card
         
     def save_session(self):
         """Save current session to file"""
@@ -3564,7 +4459,7 @@ class PackRipperSession:
                     session_data = json.load(f)
                 self.cards = session_data.get('cards', [])
                 self.current_set = session_data.get('current_set')
-                self.set_cards = session_data.get('set_cards', [])
+                self.set_cards = normalize_set_cards(session_data.get('set_cards', []))
                 return True
         except Exception as e:
             print(f"Error loading session: {e}")
@@ -3582,9 +4477,11 @@ class VoiceRecognizer:
         self.is_listening = False
         self.audio_lock = threading.Lock()  # Prevent concurrent microphone access
         
-        # Adjust for ambient noise
-        with self.microphone as source:
-            self.recognizer.adjust_for_ambient_noise(source)
+        # Ambient noise calibration blocks ~1s, so it runs on the first listen instead of at startup
+        self._calibrated = False
+        
+        # Microphone stream kept open across listens (opened lazily, guarded by audio_lock)
+        self._source = None
         
         # Yu-Gi-Oh specific recognition improvements
         self.recognizer.energy_threshold = 300  # Lower threshold for better pickup
@@ -3599,37 +4496,19 @@ class VoiceRecognizer:
             return None
             
         try:
-            with self.microphone as source:
-                # Increased phrase_time_limit and improved audio capture
-                audio = self.recognizer.listen(source, timeout=timeout, phrase_time_limit=15)
-            
-            # Try multiple recognition approaches for better YGO card name detection
-            recognized_texts = []
+            source = self._open_source()
+            self._drain_stale_audio(source)
             
-            # Primary: Google Speech Recognition
-            try:
-                text = self.recognizer.recognize_google(audio)
-                recognized_texts.append(("google", text.lower().strip()))
-                print(f"[VOICE DEBUG] Google recognized: '{text.lower().strip()}'")
-            except:
-                pass
+            # Increased phrase_time_limit and improved audio capture
+            audio = self.recognizer.listen(source, timeout=timeout, phrase_time_limit=15)
             
-            # Secondary: Google with language hints (sometimes helps with fantasy words)
+            # Google Speech Recognition (en-US is already its default language, so one call is enough)
             try:
-                text = self.recognizer.recognize_google(audio, language='en-US', show_all=False)
-                recognized_texts.append(("google_en", text.lower().strip()))
-                print(f"[VOICE DEBUG] Google EN recognized: '{text.lower().strip()}'")
+                text = self.recognizer.recognize_google(audio).lower().strip()
+                print(f"[VOICE DEBUG] Google recognized: '{text}'")
+                return text
             except:
-                pass
-            
-            # Return the longest/most complete recognition
-            if recognized_texts:
-                # Prefer the longest recognition as it's often more complete
-                best_recognition = max(recognized_texts, key=lambda x: len(x[1]))
-                print(f"[VOICE DEBUG] Best recognition: '{best_recognition[1]}' (method: {best_recognition[0]})")
-                return best_recognition[1]
-            
-            return None
+                return None
             
         except sr.WaitTimeoutError:
             return None
@@ -3640,10 +4519,50 @@ class VoiceRecognizer:
             return None
         except Exception as e:
             print(f"[VOICE DEBUG] Unexpected audio error: {e}")
+            # The stream may be broken; reopen it on the next listen
+            self._close_source()
             return None
         finally:
             # Always release the lock
             self.audio_lock.release()
+    
+    def _open_source(self):
+        """Return the open microphone source, opening and calibrating it on first use (audio_lock held)"""
+        if self._source is None:
+            self._source = self.microphone.__enter__()
+            # Adjust for ambient noise once, the first time voice is actually used
+            if not self._calibrated:
+                self.recognizer.adjust_for_ambient_noise(self._source)
+                self._calibrated = True
+        return self._source
+    
+    def _drain_stale_audio(self, source):
+        """Drop audio buffered while nobody was listening, so each phrase starts from now"""
+        stream = getattr(source.stream, 'pyaudio_stream', None)
+        if stream is None:
+            return
+        try:
+            available = stream.get_read_available()
+            if available:
+                stream.read(available, exception_on_overflow=False)
+        except Exception as e:
+            print(f"[VOICE DEBUG] Could not drain microphone buffer: {e}")
+    
+    def _close_source(self):
+        """Close the microphone stream if open (audio_lock held)"""
+        if self._source is not None:
+            self._source = None
+            try:
+                self.microphone.__exit__(None, None, None)
+            except Exception as e:
+                print(f"[VOICE DEBUG] Error closing microphone: {e}")
+    
+    def release_microphone(self):
+        """Close the persistent microphone stream once listening stops"""
+        if not self.enabled:
+            return
+        with self.audio_lock:
+            self._close_source()
 
 class YGORipperUI:
     def __init__(self, root):
@@ -3664,14 +4583,46 @@ class YGORipperUI:
         # Get API URL from environment variable
         self.api_url = os.getenv('API_URL', 'http://127.0.0.1:8081')
         
+        # Shared HTTP session - keeps the TCP/TLS connection to the API warm between calls
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        self.http.headers.update({
+            'Connection': 'keep-alive',
+            # Large set-card lists compress well; only advertise br when it can be decoded
+            'Accept-Encoding': 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate'
+        })
+        
+        # Set lists and per-set card lists change rarely - keep them for 10 minutes
+        self.api_cache = TTLCache(ttl=600, cache_dir=os.path.join(os.path.expanduser("~"), ".ygo_ripper_cache", "api"))
+        
+        # Reused worker threads for API calls - repeat clicks don't spawn a fresh thread each time
+        self.io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="ygo-io")
+        # Long-lived voice loop thread (daemon, so exit never waits on a listen); kept so a
+        # quick stop/start hands the still-running loop back instead of starting a second one
+        self._voice_thread = None
+        
         # Initialize components
         self.pack_session = PackRipperSession()
         self.voice_recognizer = VoiceRecognizer()
         self.image_manager = ImageManager()  # Add image manager
         self.available_sets = []
         self.filtered_sets = []
+        self._available_sets_lower = []  # (lowercase name, set) pairs, rebuilt once per load
+        self._sets_by_name = {}  # set_name -> set, for O(1) combobox selection lookup
+        self._pending_payload = None  # Cleaned price check payload from validate_inputs
+        self._search_after_id = None  # Pending debounced set search
+        self._pending_set_names = None  # Combobox values prebuilt off the Tk thread
         
         # Voice confirmation state
+        # _can_listen is cleared only while the status is locked and no options dialog is
+        # open; the voice loop waits on it.
+        # Both flags are shared by the Tk and voice threads, so updates go through one lock.
+        self._voice_state_lock = threading.Lock()
+        self._can_listen = threading.Event()
+        self._status_locked = threading.Event()
         self.pending_voice_confirmation = False
         self.pending_card_options = []
         self.pending_voice_data = {}
@@ -3681,16 +4632,63 @@ class YGORipperUI:
         self.focus_mode = False
         self.auto_rarity_enabled = True  # Enable auto rarity extraction by default
         self.auto_art_rarity_enabled = True  # Enable auto art rarity extraction by default
+        self.recognition_pause_ms = 0  # Optional dead time after each recognised card
+        # Mirrors of the auto-confirm Tk vars, readable from the voice thread without Tcl calls
+        self._auto_confirm_enabled = False
+        self._auto_threshold = 85
         
         # Session tracker window
         self.session_tracker = None
+        self._session_update_pending = False  # A coalesced tracker refresh is scheduled
+        self._match_index_cards = None  # set_cards list the name keys below were built from
+        self._card_name_keys = []  # Fuzzy-normalised card names, parallel to set_cards
+        self._card_names_lower = []  # Lowercased card names, parallel to set_cards
+        self._card_rarity_keys = []  # Lowercased set rarities per card, parallel to set_cards
+        self._card_norms = []  # card_name_norm() per card, parallel to set_cards
+        self._set_rarity_vocab = frozenset()  # Distinct lowercased rarities in the set
+        self._token_to_cards = {}  # Name token/prefix -> set of set_cards indices
+        self._ngram_to_cards = {}  # Name 3-gram -> set of set_cards indices
+        self._name_score_cache = LRUCache(32)  # (spoken name, variants) -> name scores of its candidates
+        self._indices_by_name = {}  # Card name -> list of set_cards indices
         
         self.create_widgets()
         self.setup_auto_save()
         
+        # Release pooled connections when the main window closes
+        self.root.protocol("WM_DELETE_WINDOW", self.on_app_close)
+        
         # Auto-load card sets from cache on startup
         self.auto_load_card_sets()
-        
+    
+    def on_app_close(self):
+        """Close shared network resources and exit"""
+        try:
+            # Let the voice loop fall out on its next check so interpreter exit isn't held up
+            self.voice_listening = False
+            # Pool workers aren't daemon threads - drop queued requests so exit only waits
+            # on the ones already running, then close the session they would have used
+            self.io_pool.shutdown(wait=False, cancel_futures=True)
+            self.http.close()
+            self.image_manager.close()
+        except Exception as e:
+            print(f"[SHUTDOWN] Error closing network resources: {e}")
+        self.root.destroy()
+        
+    def submit_io(self, fn, *args, **kwargs):
+        """Run fn on the shared I/O pool, logging anything it raises"""
+        future = self.io_pool.submit(fn, *args, **kwargs)
+        future.add_done_callback(self._log_io_failure)
+        return future
+    
+    @staticmethod
+    def _log_io_failure(future):
+        """Done-callback: surface exceptions that would otherwise sit unread in the Future"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error("[IO POOL] Background job failed: %s", error, exc_info=error)
+    
     def auto_load_session(self):
         """Automatically load session on startup if it exists"""
         if self.pack_session.load_session():
@@ -3816,34 +4814,18 @@ class YGORipperUI:
         self.results_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Initial message
-        welcome_msg = """Welcome to YGORipperUI! 🃏
-
-Enter the card information above and click "Check Price" to get pricing data.
-
-Required fields:
-• Card Number: The card's identification number
-• Card Rarity: The rarity of the card
-• Force Refresh: Check this to force a fresh data scrape
-
-Optional fields:
-• Card Name: The name of the card
-• Art Variant: Specific art variant if applicable
-
-The application will fetch pricing data from TCGPlayer and display:
-• Card details (name, rarity, set)
-• TCGPlayer Low and Market prices
-• Last update timestamp
-"""
-        self.results_text.insert(tk.END, welcome_msg)
+        self.results_text.insert(tk.END, _WELCOME_MSG)
         
     def validate_inputs(self):
-        """Validate required fields"""
-        if not self.card_number_var.get().strip():
+        """Validate required fields, stashing the cleaned payload for the request thread"""
+        cleaned = self.prepare_payload()
+        if not cleaned["card_number"]:
             messagebox.showerror("Validation Error", "Card Number is required!")
             return False
-        if not self.card_rarity_var.get().strip():
+        if not cleaned["card_rarity"]:
             messagebox.showerror("Validation Error", "Card Rarity is required!")
             return False
+        self._pending_payload = cleaned
         return True
     
     def prepare_payload(self):
@@ -3863,127 +4845,126 @@ The application will fetch pricing data from TCGPlayer and display:
         
         card_data = data.get('data', {})
         
-        # Header information
-        result = "=" * 80 + "\n"
-        result += "🃏 YGORIPPERUI - CARD PRICE INFORMATION\n"
-        result += "=" * 80 + "\n\n"
-        
-        # Basic card info
-        result += "📋 CARD DETAILS:\n"
-        result += "-" * 40 + "\n"
-        result += f"Name: {card_data.get('card_name', 'N/A')}\n"
-        result += f"Number: {card_data.get('card_number', 'N/A')}\n"
-        result += f"Rarity: {card_data.get('card_rarity', 'N/A')}\n"
-        result += f"Set: {card_data.get('booster_set_name', 'N/A')}\n"
-        result += f"Art Variant: {card_data.get('card_art_variant', 'N/A')}\n"
-        result += f"Set Code: {card_data.get('set_code', 'N/A')}\n"
-        result += f"Last Updated: {card_data.get('last_price_updt', 'N/A')}\n\n"
-        
-        # Price information
-        result += "💰 PRICING INFORMATION:\n"
-        result += "-" * 40 + "\n"
-        
-        # Collect all non-null prices
-        prices = []
+        # Lines are collected and joined once instead of repeated +=
+        parts = [
+            _HR80,
+            "🃏 YGORIPPERUI - CARD PRICE INFORMATION",
+            _HR80,
+            "",
+            # Basic card info
+            "📋 CARD DETAILS:",
+            _HR40,
+            f"Name: {card_data.get('card_name', 'N/A')}",
+            f"Number: {card_data.get('card_number', 'N/A')}",
+            f"Rarity: {card_data.get('card_rarity', 'N/A')}",
+            f"Set: {card_data.get('booster_set_name', 'N/A')}",
+            f"Art Variant: {card_data.get('card_art_variant', 'N/A')}",
+            f"Set Code: {card_data.get('set_code', 'N/A')}",
+            f"Last Updated: {card_data.get('last_price_updt', 'N/A')}",
+            "",
+            # Price information
+            "💰 PRICING INFORMATION:",
+            _HR40,
+        ]
         
-        # TCGPlayer prices (new v2 API format)
+        # TCGPlayer prices (new v2 API format), non-null only
+        prices = []
         if card_data.get('tcg_price') is not None:
             prices.append(f"🎯 TCGPlayer Low: ${card_data['tcg_price']}")
         if card_data.get('tcg_market_price') is not None:
             prices.append(f"📈 TCGPlayer Market: ${card_data['tcg_market_price']}")
         
         if prices:
-            for price in prices:
-                result += f"  {price}\n"
+            parts.extend(f"  {price}" for price in prices)
         else:
-            result += "  ❌ No pricing data available\n"
-        
-        result += "\n"
+            parts.append("  ❌ No pricing data available")
         
         # Additional info
-        result += "ℹ️  ADDITIONAL INFORMATION:\n"
-        result += "-" * 40 + "\n"
-        result += f"Scrape Success: {'✅ Yes' if card_data.get('scrape_success') else '❌ No'}\n"
-        
+        parts.extend([
+            "",
+            "ℹ️  ADDITIONAL INFORMATION:",
+            _HR40,
+            f"Scrape Success: {'✅ Yes' if card_data.get('scrape_success') else '❌ No'}",
+        ])
         if card_data.get('source_url'):
-            result += f"Source URL: {card_data['source_url']}\n"
+            parts.append(f"Source URL: {card_data['source_url']}")
         
-        result += f"\nAPI Message: {data.get('message', 'N/A')}\n"
-        result += f"Query Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        result += "\n" + "=" * 80
+        parts.extend([
+            "",
+            f"API Message: {data.get('message', 'N/A')}",
+            f"Query Time: {datetime.now():%Y-%m-%d %H:%M:%S}",
+            "",
+            _HR80,
+        ])
         
-        return result
+        return "\n".join(parts)
+    
+    def _replace_results(self, text):
+        """Replace the results pane contents in a single main-loop callback"""
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, text)
     
-    def check_price_thread(self):
-        """Run the API request in a separate thread"""
+    def _show_error(self, template_key, **fields):
+        """Format an error template and schedule it into the results pane"""
+        self.root.after(0, self._replace_results, _ERROR_TEMPLATES[template_key].format(**fields))
+    
+    def check_price_thread(self, payload):
+        """Run the API request in a separate thread with a payload snapshotted on the UI thread"""
         url = None  # Initialize url variable
         try:
-            payload = self.prepare_payload()
             url = f"{self.api_url}/cards/price"
             
             # Update UI to show loading
-            self.root.after(0, lambda: self.check_button.config(state='disabled'))
-            self.root.after(0, lambda: self.progress.start())
-            self.root.after(0, lambda: self.results_text.delete(1.0, tk.END))
-            self.root.after(0, lambda: self.results_text.insert(tk.END, "🔄 Fetching price data...\n\nPlease wait while we retrieve the latest pricing information.\n"))
+            self.root.after(0, self.check_button.config, {'state': 'disabled'})
+            self.root.after(0, self.progress.start)
+            self.root.after(0, self._replace_results, "🔄 Fetching price data...\n\nPlease wait while we retrieve the latest pricing information.\n")
             
             # Make API request
-            response = requests.post(url, json=payload, timeout=30)
+            response = self.http.post(url, json=payload, timeout=30)
             
             # Log the API call
             log_api_call("POST", url, body=payload, response=response)
             
             response.raise_for_status()
             
-            data = response.json()
+            data = parse_json_response(response)
             formatted_result = self.format_price_data(data)
             
             # Update UI with results
-            self.root.after(0, lambda: self.results_text.delete(1.0, tk.END))
-            self.root.after(0, lambda: self.results_text.insert(tk.END, formatted_result))
+            self.root.after(0, self._replace_results, formatted_result)
             
         except requests.exceptions.ConnectionError as e:
             # Log the error
             if url:
                 log_api_call("POST", url, body=payload, error=e)
-            error_msg = f"🚫 CONNECTION ERROR\n\nCould not connect to: {url}\n\nPossible solutions:\n• Check if the API server is running\n• Verify the API_URL environment variable is correct\n• Check your internet connection\n• Ensure the server is accessible"
-            self.root.after(0, lambda: self.results_text.delete(1.0, tk.END))
-            self.root.after(0, lambda: self.results_text.insert(tk.END, error_msg))
+            self._show_error("connection", url=url)
         except requests.exceptions.Timeout as e:
             # Log the error
             if url:
                 log_api_call("POST", url, body=payload, error=e)
-            error_msg = "⏰ TIMEOUT ERROR\n\nThe request took too long to complete.\nThe server might be experiencing high load.\nPlease try again in a few moments."
-            self.root.after(0, lambda: self.results_text.delete(1.0, tk.END))
-            self.root.after(0, lambda: self.results_text.insert(tk.END, error_msg))
+            self._show_error("timeout")
         except requests.exceptions.HTTPError as e:
             # Log the error
             if url:
                 log_api_call("POST", url, body=payload, response=response, error=e)
-            error_msg = f"🔴 HTTP ERROR\n\nServer Error: {e}\nStatus Code: {response.status_code}\n\nThe server returned an error. Please check your input data and try again."
-            self.root.after(0, lambda: self.results_text.delete(1.0, tk.END))
-            self.root.after(0, lambda: self.results_text.insert(tk.END, error_msg))
+            self._show_error("http", error=e, status=response.status_code)
         except Exception as e:
             # Log the error
             if url:
                 log_api_call("POST", url, body=payload, error=e)
-            error_msg = f"❌ UNEXPECTED ERROR\n\nAn unexpected error occurred:\n{str(e)}\n\nPlease try again or contact support if the problem persists."
-            self.root.after(0, lambda: self.results_text.delete(1.0, tk.END))
-            self.root.after(0, lambda: self.results_text.insert(tk.END, error_msg))
+            self._show_error("unexpected", error=e)
         finally:
             # Re-enable UI
-            self.root.after(0, lambda: self.progress.stop())
-            self.root.after(0, lambda: self.check_button.config(state='normal'))
+            self.root.after(0, self.progress.stop)
+            self.root.after(0, self.check_button.config, {'state': 'normal'})
     
     def check_price(self):
         """Handle the check price button click"""
         if not self.validate_inputs():
             return
         
-        # Run API request in separate thread to prevent UI freezing
-        thread = threading.Thread(target=self.check_price_thread)
-        thread.daemon = True
-        thread.start()
+        # Run API request on the shared I/O pool to prevent UI freezing
+        self.submit_io(self.check_price_thread, self._pending_payload)
     
     def clear_fields(self):
         """Clear all input fields and results"""
@@ -3995,11 +4976,7 @@ The application will fetch pricing data from TCGPlayer and display:
         self.results_text.delete(1.0, tk.END)
         
         # Show welcome message again
-        welcome_msg = """Welcome back! 🃏
-
-Enter new card information above and click "Check Price" to get pricing data.
-"""
-        self.results_text.insert(tk.END, welcome_msg)
+        self.results_text.insert(tk.END, _WELCOME_BACK_MSG)
     
     def create_pack_ripper_tab(self):
         """Create the new pack ripper tab"""
@@ -4045,6 +5022,11 @@ Enter new card information above and click "Check Price" to get pricing data.
         self.set_combobox.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=5)
         self.set_combobox.bind('<<ComboboxSelected>>', self.on_set_selected)
         
+        # Hint shown when the dropdown is truncated
+        self.set_more_var = tk.StringVar()
+        ttk.Label(set_frame, textvariable=self.set_more_var, font=("Arial", 9),
+                 foreground="#666666").grid(row=2, column=1, sticky=tk.W, padx=(10, 0))
+        
         # Load sets button
         load_sets_btn = ttk.Button(set_frame, text="🔄 Load Sets", command=self.load_card_sets)
         load_sets_btn.grid(row=0, column=2, padx=(10, 0), pady=5)
@@ -4079,6 +5061,7 @@ Enter new card information above and click "Check Price" to get pricing data.
         
         # Auto-confirm checkbox and threshold
         self.auto_confirm_var = tk.BooleanVar()
+        self.auto_confirm_var.trace_add('write', self.update_auto_confirm_setting)
         auto_confirm_check = ttk.Checkbutton(session_row2, text="Auto-confirm matches above", variable=self.auto_confirm_var)
         auto_confirm_check.pack(side=tk.LEFT, padx=(0, 5))
         
@@ -4086,6 +5069,7 @@ Enter new card information above and click "Check Price" to get pricing data.
         self.auto_confirm_threshold_var = tk.StringVar(value="85")
         threshold_spinner = ttk.Spinbox(session_row2, from_=70, to=95, increment=5, width=5, 
                                        textvariable=self.auto_confirm_threshold_var)
+        self.auto_confirm_threshold_var.trace_add('write', self.update_auto_confirm_setting)
         threshold_spinner.pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Label(session_row2, text="% confidence").pack(side=tk.LEFT, padx=(0, 20))
@@ -4128,6 +5112,14 @@ Enter new card information above and click "Check Price" to get pricing data.
                                                command=self.update_auto_art_rarity_setting)
         auto_art_rarity_check.pack(side=tk.LEFT, padx=(0, 15))
         
+        # Pause between recognitions (mirrored into a plain int for the voice thread)
+        ttk.Label(voice_row2, text="Pause after card:").pack(side=tk.LEFT, padx=(0, 5))
+        self.recognition_pause_var = tk.IntVar(value=self.recognition_pause_ms)
+        self.recognition_pause_var.trace_add('write', self.update_recognition_pause_setting)
+        ttk.Spinbox(voice_row2, from_=0, to=1000, increment=50, width=5,
+                    textvariable=self.recognition_pause_var).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Label(voice_row2, text="ms").pack(side=tk.LEFT)
+        
         # Voice controls row 3 - focus mode
         voice_row3 = ttk.Frame(voice_frame)
         voice_row3.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E))
@@ -4167,8 +5159,9 @@ Enter new card information above and click "Check Price" to get pricing data.
         export_frame = ttk.LabelFrame(main_frame, text="Export & Settings", padding="15")
         export_frame.grid(row=7, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
         
-        export_btn = ttk.Button(export_frame, text="📊 Export to Excel", command=self.export_to_excel)
-        export_btn.pack(side=tk.LEFT, padx=(0, 10))
+        # Disabled while an export is being written
+        self.export_btn = ttk.Button(export_frame, text="📊 Export to Excel", command=self.export_to_excel)
+        self.export_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         # Pack session state
         self.pack_session_active = False
@@ -4184,20 +5177,54 @@ Enter new card information above and click "Check Price" to get pricing data.
         self.auto_art_rarity_enabled = self.auto_art_rarity_var.get()
         print(f"[VOICE SETTINGS] Auto art rarity extraction: {'Enabled' if self.auto_art_rarity_enabled else 'Disabled'}")
     
+    def update_auto_confirm_setting(self, *args):
+        """Mirror the auto-confirm checkbox and threshold into plain attributes"""
+        self._auto_confirm_enabled = self.auto_confirm_var.get()
+        try:
+            self._auto_threshold = int(self.auto_confirm_threshold_var.get())
+        except ValueError:
+            self._auto_threshold = 85
+    
+    def update_recognition_pause_setting(self, *args):
+        """Update the pause inserted after each recognised card"""
+        try:
+            self.recognition_pause_ms = max(0, self.recognition_pause_var.get())
+        except tk.TclError:
+            return  # Partially typed value; keep the previous setting
+        print(f"[VOICE SETTINGS] Pause after card: {self.recognition_pause_ms}ms")
+    
     # Pack Ripper Methods
     def on_set_search_change(self, *args):
-        """Handle set search text change"""
+        """Handle set search text change - debounced so filtering runs once typing settles"""
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(150, self._apply_search)
+    
+    def _apply_search(self):
+        """Filter the available sets against the current search text"""
+        self._search_after_id = None
         search_text = self.set_search_var.get().strip().lower()
+        # Substring checks over the pre-lowered names take microseconds - done inline so
+        # the dropdown never waits behind slow API calls on the I/O pool
         if not search_text:
             self.filtered_sets = self.available_sets
         else:
-            self.filtered_sets = [s for s in self.available_sets if search_text in s['set_name'].lower()]
-        
+            self.filtered_sets = [s for name_lower, s in self._available_sets_lower if search_text in name_lower]
         self.update_set_combobox()
     
     def update_set_combobox(self):
         """Update the set selection combobox"""
-        set_names = [s['set_name'] for s in self.filtered_sets]
+        # Values may be prebuilt by the set loader; a tuple goes to Tcl as one list object
+        set_names = self._pending_set_names
+        self._pending_set_names = None
+        if set_names is None:
+            set_names = tuple(s['set_name'] for s in self.filtered_sets)
+        hidden = len(set_names) - _SET_DROPDOWN_LIMIT
+        if hidden > 0:
+            set_names = set_names[:_SET_DROPDOWN_LIMIT]
+            self.set_more_var.set(f"+ {hidden} more — refine search")
+        else:
+            self.set_more_var.set("")
         self.set_combobox['values'] = set_names
         if set_names:
             self.set_combobox.current(0)
@@ -4214,17 +5241,44 @@ Enter new card information above and click "Check Price" to get pricing data.
             return
         
         # Find the set in the available sets
-        set_info = next((s for s in self.filtered_sets if s['set_name'] == selected_set), None)
+        set_info = self._sets_by_name.get(selected_set)
         if set_info:
             self.pack_session.current_set = set_info
     
+    def _fetch_api_json(self, url, cache_key=None):
+        """GET a JSON endpoint (worker thread), served from the TTL cache while cache_key is fresh"""
+        data = self.api_cache.get(cache_key) if cache_key else None
+        if data is None:
+            response = self.http.get(url, timeout=30)
+            
+            # Log the API call off the request path
+            self.submit_io(log_api_call, "GET", url, response=response)
+            
+            response.raise_for_status()
+            
+            data = parse_json_response(response)
+            if cache_key and data.get('success'):
+                self.api_cache.set(cache_key, data)
+        return data
+    
+    def _apply_card_sets(self, sets_data):
+        """Install a loaded set list and the lookups derived from it (worker thread)"""
+        self.available_sets = sets_data
+        self.filtered_sets = sets_data
+        self._available_sets_lower = [(s['set_name'].lower(), s) for s in sets_data]
+        self._sets_by_name = {s['set_name']: s for s in sets_data}
+        self._pending_set_names = tuple(s['set_name'] for s in sets_data)
+    
     def load_card_sets(self):
         """Load card sets from the API"""
+        # Tk vars are only read on the main thread; the worker gets a snapshot
+        search_term = self.set_search_var.get().strip()
+        
         def load_sets_thread():
+            # Bound up front so the except branch can always reference it
+            url = None
             try:
                 # Check if there's a search term
-                search_term = self.set_search_var.get().strip()
-                
                 if search_term:
                     # Use search endpoint with search term
                     url = f"{self.api_url}/card-sets/search/{search_term}"
@@ -4232,18 +5286,12 @@ Enter new card information above and click "Check Price" to get pricing data.
                     # Use cache endpoint to get all sets
                     url = f"{self.api_url}/card-sets/from-cache"
                 
-                response = requests.get(url, timeout=30)
-                
-                # Log the API call
-                log_api_call("GET", url, response=response)
-                
-                response.raise_for_status()
+                # The full set list is served from the TTL cache when fresh; searches always go to the API
+                data = self._fetch_api_json(url, None if search_term else _CARD_SETS_CACHE_KEY)
                 
-                data = response.json()
                 if data.get('success'):
                     sets_data = data.get('data', [])
-                    self.available_sets = sets_data
-                    self.filtered_sets = sets_data
+                    self._apply_card_sets(sets_data)
                     
                     # Update UI on main thread
                     self.root.after(0, self.update_set_combobox)
@@ -4256,14 +5304,12 @@ Enter new card information above and click "Check Price" to get pricing data.
                     self.root.after(0, lambda msg=error_message: messagebox.showerror("Error", msg))
             except requests.exceptions.RequestException as e:
                 # Log the error
-                log_api_call("GET", url, error=e)
+                self.submit_io(log_api_call, "GET", url, error=e)
                 error_message = f"Failed to load sets:\n{str(e)}"
                 self.root.after(0, lambda msg=error_message: messagebox.showerror("Request Error", msg))
         
-        # Run in separate thread
-        thread = threading.Thread(target=load_sets_thread)
-        thread.daemon = True
-        thread.start()
+        # Run on the shared I/O pool
+        self.submit_io(load_sets_thread)
     
     def load_set_cards(self):
         """Load cards for the selected set"""
@@ -4271,20 +5317,35 @@ Enter new card information above and click "Check Price" to get pricing data.
             messagebox.showwarning("Warning", "Please select a set first!")
             return
         
+        # Snapshot the selection so a change mid-request can't mix sets
+        set_name = self.pack_session.current_set.get('set_name')
+        
         def load_cards_thread():
+            # Bound up front so the except branch can always reference it
+            url = None
             try:
-                set_name = self.pack_session.current_set.get('set_name')
                 url = f"{self.api_url}/card-sets/{set_name}/cards"
-                response = requests.get(url, timeout=30)
                 
-                # Log the API call
-                log_api_call("GET", url, response=response)
+                cache_key = f"set-cards:{set_name}"
+                data = self.api_cache.get(cache_key)
                 
-                response.raise_for_status()
+                if data is None:
+                    # Card lists can be multi-MB, so the body is parsed as it arrives
+                    response = self.http.get(url, timeout=30, stream=True)
+                    
+                    try:
+                        response.raise_for_status()
+                        
+                        data = parse_json_stream(response)
+                    finally:
+                        # Logged on this thread once the body is consumed - reading an unread
+                        # stream=True body from two threads splits its chunks between them
+                        log_api_call("GET", url, response=response)
+                    if data.get('success'):
+                        self.api_cache.set(cache_key, data)
                 
-                data = response.json()
                 if data.get('success'):
-                    cards = data.get('data', [])
+                    cards = normalize_set_cards(data.get('data', []))
                     self.pack_session.set_cards = cards
                     
                     # Update UI on main thread
@@ -4294,47 +5355,35 @@ Enter new card information above and click "Check Price" to get pricing data.
                     self.root.after(0, lambda msg=error_message: messagebox.showerror("Error", msg))
             except requests.exceptions.RequestException as e:
                 # Log the error
-                log_api_call("GET", url, error=e)
+                self.submit_io(log_api_call, "GET", url, error=e)
                 error_message = f"Failed to load cards:\n{str(e)}"
                 self.root.after(0, lambda msg=error_message: messagebox.showerror("Request Error", msg))
         
-        # Run in separate thread
-        thread = threading.Thread(target=load_cards_thread)
-        thread.daemon = True
-        thread.start()
+        # Run on the shared I/O pool
+        self.submit_io(load_cards_thread)
     
     def update_session_display(self):
-        """Update the session tracker display if it exists"""
-        print("[SESSION UPDATE DEBUG] update_session_display called")
-        print(f"[SESSION UPDATE DEBUG] Called from thread: {threading.current_thread().name}")
-        print(f"[SESSION UPDATE DEBUG] Session tracker exists: {self.session_tracker is not None}")
+        """Schedule a session tracker refresh, coalescing bursts into one redraw per frame"""
+        logger.debug("[SESSION UPDATE] update_session_display called from thread %s", threading.current_thread().name)
         
-        if self.session_tracker:
-            print("[SESSION UPDATE DEBUG] Session tracker exists, calling safe_update_cards_display")
-            print(f"[SESSION UPDATE DEBUG] Session has {len(self.pack_session.cards)} cards")
-            
-            # CRITICAL FIX: Always schedule on main thread with multiple fallback mechanisms
-            def do_update():
-                try:
-                    print("[SESSION UPDATE DEBUG] Executing UI update on main thread")
-                    self.session_tracker.safe_update_cards_display()
-                    print("[SESSION UPDATE DEBUG] UI update completed successfully")
-                except Exception as e:
-                    print(f"[SESSION UPDATE DEBUG] ERROR during UI update: {e}")
-                    import traceback
-                    traceback.print_exc()
-            
-            if threading.current_thread() == threading.main_thread():
-                print("[SESSION UPDATE DEBUG] Already on main thread, calling directly")
-                do_update()
-            else:
-                print("[SESSION UPDATE DEBUG] Not on main thread, scheduling with after()")
-                # Use both after(0) and after_idle as fallbacks
-                self.root.after(0, do_update)
-                # Also schedule with after_idle as a backup
-                self.root.after_idle(lambda: print("[SESSION UPDATE DEBUG] after_idle backup triggered"))
-        else:
-            print("[SESSION UPDATE DEBUG] No session tracker exists")
+        if self._session_update_pending:
+            return
+        self._session_update_pending = True
+        # ~60Hz cap: every update requested before this fires shares one repaint
+        self.root.after(16, self._flush_session_update)
+    
+    def _flush_session_update(self):
+        """Run the pending session tracker refresh on the main thread"""
+        self._session_update_pending = False
+        if not self.session_tracker:
+            logger.debug("[SESSION UPDATE] No session tracker exists")
+            return
+        
+        logger.debug("[SESSION UPDATE] Session has %d cards", len(self.pack_session.cards))
+        try:
+            self.session_tracker.safe_update_cards_display()
+        except Exception:
+            logger.exception("[SESSION UPDATE] ERROR during UI update")
     
     def update_cards_display(self):
         """Legacy method - now redirects to session tracker"""
@@ -4434,10 +5483,59 @@ Enter new card information above and click "Check Price" to get pricing data.
         self.listen_btn.config(text="🛑 Stop Listening")
         self.voice_status_var.set("🎤 Listening for card names...")
         
-        # Start voice recognition in separate thread
-        thread = threading.Thread(target=self.voice_recognition_loop)
-        thread.daemon = True
-        thread.start()
+        # Start voice recognition in separate thread, unless the previous loop is still
+        # winding down - it sees voice_listening again and carries on
+        with self._voice_state_lock:
+            if self._voice_thread is None:
+                self._voice_thread = threading.Thread(target=self._run_voice_loop, name="voice", daemon=True)
+                self._voice_thread.start()
+    
+    def _run_voice_loop(self):
+        """Voice thread body - keeps looping if listening was restarted as the loop exited"""
+        try:
+            while True:
+                self.voice_recognition_loop()
+                with self._voice_state_lock:
+                    if not (self.voice_listening and self.pack_session_active):
+                        self._voice_thread = None
+                        return
+        except BaseException:
+            with self._voice_state_lock:
+                self._voice_thread = None
+            raise
+    
+    @property
+    def pending_voice_confirmation(self):
+        """True while a card options dialog is waiting for the user"""
+        return self._pending_voice_confirmation
+    
+    @pending_voice_confirmation.setter
+    def pending_voice_confirmation(self, value):
+        with self._voice_state_lock:
+            self._pending_voice_confirmation = value
+            self._update_can_listen()
+    
+    @property
+    def voice_status_locked(self):
+        """True while a status message must not be overwritten by the voice loop"""
+        return self._status_locked.is_set()
+    
+    @voice_status_locked.setter
+    def voice_status_locked(self, value):
+        with self._voice_state_lock:
+            if value:
+                self._status_locked.set()
+            else:
+                self._status_locked.clear()
+            self._update_can_listen()
+    
+    def _update_can_listen(self):
+        """Wake or park the voice loop to match the confirmation/lock flags (_voice_state_lock held)"""
+        # An open options dialog always listens - it is waiting for a spoken number
+        if self._status_locked.is_set() and not self._pending_voice_confirmation:
+            self._can_listen.clear()
+        else:
+            self._can_listen.set()
     
     def stop_voice_listening(self):
         """Stop voice listening"""
@@ -4450,20 +5548,23 @@ Enter new card information above and click "Check Price" to get pricing data.
         """Main voice recognition loop"""
         while self.voice_listening and self.pack_session_active:
             try:
-                # Skip voice recognition if a dialog is pending confirmation
-                # This prevents microphone context manager conflicts
-                if self.pending_voice_confirmation:
-                    if not self.voice_status_locked:  # Only update status if not locked
-                        self.root.after(0, lambda: self.voice_status_var.set("🎤 Waiting for selection..."))
-                    time.sleep(0.1)  # Short sleep while waiting for dialog response
+                # Skip voice recognition while the status is locked (e.g. showing "Added:").
+                # Sleep until the flag clears instead of polling; the timeout only lets
+                # the loop notice that listening was stopped.
+                if not self._can_listen.is_set():
+                    self._can_listen.wait(timeout=1.0)
                     continue
                 
-                # Skip voice recognition if status is locked (e.g., showing "Added:" message)
-                if self.voice_status_locked:
-                    time.sleep(0.1)  # Short sleep while status is locked
+                # Options dialog open: this loop owns the microphone, so route what is
+                # heard to the dialog instead of starting a new card search
+                if self.pending_voice_confirmation:
+                    voice_text = self.voice_recognizer.listen_once(timeout=2)
+                    if voice_text:
+                        print(f"[DIALOG VOICE DEBUG] Dialog heard: '{voice_text}'")
+                        self.root.after(0, self._handle_dialog_voice_text, voice_text)
                     continue
                 
-                self.root.after(0, lambda: self.voice_status_var.set("🎤 Listening..."))
+                self.root.after(0, self.voice_status_var.set, "🎤 Listening...")
                 
                 # Listen for voice input
                 voice_text = self.voice_recognizer.listen_once(timeout=3)
@@ -4477,25 +5578,35 @@ Enter new card information above and click "Check Price" to get pricing data.
                     self.voice_status_locked = True
                     
                     # Update UI with debug info and schedule status clear
-                    self.root.after(0, lambda text=voice_text: self.voice_status_var.set(f"Heard: '{text}' (len: {len(text)})"))
-                    # Clear the "Heard:" status after 2 seconds with high priority to prevent UI appearing stuck
-                    self.root.after(2000, lambda: self.root.after_idle(self.clear_voice_status_if_heard))
+                    self.root.after(0, self.voice_status_var.set, f"Heard: '{voice_text}' (len: {len(voice_text)})")
+                    # Clear the "Heard:" status after 2 seconds to prevent UI appearing stuck
+                    self.root.after(2000, self.clear_voice_status_if_heard)
                     
                     self.process_voice_input(voice_text)
-                    time.sleep(0.5)  # Brief pause between recognitions
+                    # Lookup and the status lock already space recognitions; extra pause is opt-in
+                    if self.recognition_pause_ms:
+                        time.sleep(self.recognition_pause_ms / 1000)
                 else:
                     # Debug: Show when nothing was heard
                     print("[VOICE DEBUG] No speech detected or recognition failed")
                     logger.info("Voice recognition: No speech detected")
                     if not self.voice_status_locked:  # Only update if not locked
-                        self.root.after(0, lambda: self.voice_status_var.set("🎤 Listening... (no speech detected)"))
+                        self.root.after(0, self.voice_status_var.set, "🎤 Listening... (no speech detected)")
                 
             except Exception as e:
                 print(f"[VOICE DEBUG] Voice recognition error: {e}")
                 logger.error(f"Voice recognition error: {e}")
                 if not self.voice_status_locked:  # Only update if not locked
-                    self.root.after(0, lambda: self.voice_status_var.set("Voice recognition error"))
+                    self.root.after(0, self.voice_status_var.set, "Voice recognition error")
                 time.sleep(1)
+        
+        # Listening stopped: hand the microphone back to the OS
+        self.voice_recognizer.release_microphone()
+    
+    def _handle_dialog_voice_text(self, voice_text):
+        """Main-thread handoff of a dialog selection heard by the voice loop"""
+        if self.pending_voice_confirmation:  # The dialog may have been closed with the mouse meanwhile
+            self.handle_voice_selection(voice_text)
     
     def clear_voice_status_if_heard(self):
         """Clear voice status if it shows 'Heard:' to prevent UI appearing stuck"""
@@ -4537,64 +5648,36 @@ Enter new card information above and click "Check Price" to get pricing data.
         
         # Extract art variant (if auto art rarity is enabled)
         if self.auto_art_rarity_enabled:
-            art_patterns = [
-                r'art variant (\w+)',
-                r'art (\w+)',
-                r'variant (\w+)',
-                r'artwork (\w+)',
-                r'art rarity (.+?)(?:\s|$)',
-                r'art variant (.+?)(?:\s|$)'
-            ]
-            for pattern in art_patterns:
-                match = re.search(pattern, voice_text)
+            for pattern in _ART_PATTERNS:
+                match = pattern.search(voice_text)
                 if match:
                     art_variant = match.group(1)
-                    card_name = re.sub(pattern, '', card_name).strip()
-                    print(f"[VOICE DEBUG] Auto-extracted art variant: '{art_variant}'")
+                    card_name = pattern.sub('', card_name).strip()
+                    logger.debug("[VOICE] Auto-extracted art variant: '%s'", art_variant)
                     break
         
         # Extract rarity (if auto rarity is enabled)
         if self.auto_rarity_enabled:
-            # Enhanced rarity patterns to catch more YGO rarity types
-            rarity_patterns = [
-                r'quarter century secret rare',
-                r'quarter century secret',
-                r'prismatic secret rare',
-                r'prismatic secret',
-                r'starlight rare',
-                r'collector.*?rare',
-                r'ghost rare',
-                r'secret rare',
-                r'ultra rare',
-                r'super rare',
-                r'rare',
-                r'common',
-                r'rarity (.+?)(?:\s|$)',
-                r'rare (.+?)(?:\s|$)',
-                r'(.+?) rare(?:\s|$)',
-                r'(.+?) rarity(?:\s|$)'
-            ]
-            for pattern in rarity_patterns:
-                match = re.search(pattern, voice_text)
-                if match:
-                    if pattern in [r'quarter century secret rare', r'quarter century secret', 
-                                 r'prismatic secret rare', r'prismatic secret', r'starlight rare',
-                                 r'collector.*?rare', r'ghost rare', r'secret rare', 
-                                 r'ultra rare', r'super rare', r'rare', r'common']:
-                        # Direct match patterns
-                        rarity = match.group(0).strip()
-                    else:
-                        # Group-based patterns
+            # Enhanced rarity patterns to catch more YGO rarity types: one search for
+            # the known names, then the capture patterns as fallbacks
+            match = _RARITY_RE.search(voice_text)
+            if match:
+                rarity = match.group(1).strip()
+                card_name = card_name.replace(match.group(0), '').strip()
+            else:
+                for pattern in _RARITY_CAPTURE_PATTERNS:
+                    match = pattern.search(voice_text)
+                    if match:
                         rarity = match.group(1).strip()
-                    
-                    card_name = re.sub(pattern, '', card_name).strip()
-                    print(f"[VOICE DEBUG] Auto-extracted rarity: '{rarity}'")
-                    break
+                        card_name = pattern.sub('', card_name).strip()
+                        break
+            if rarity:
+                logger.debug("[VOICE] Auto-extracted rarity: '%s'", rarity)
         
         # Clean up card name
-        card_name = re.sub(r'\s+', ' ', card_name).strip()
+        card_name = _WHITESPACE_RE.sub(' ', card_name).strip()
         
-        print(f"[VOICE DEBUG] Processed - Card: '{card_name}', Rarity: '{rarity}', Art: '{art_variant}'")
+        logger.debug("[VOICE] Processed - Card: '%s', Rarity: '%s', Art: '%s'", card_name, rarity, art_variant)
         
         # Find matching cards
         self.find_and_present_card_options(card_name, art_variant, rarity)
@@ -4602,16 +5685,8 @@ Enter new card information above and click "Check Price" to get pricing data.
     def handle_voice_selection(self, voice_text):
         """Handle numbered selection from voice input"""
         # Check for numbered selections (e.g., "1", "option 1", "select 1", etc.)
-        number_patterns = [
-            r'^\s*(\d+)\s*$',
-            r'option\s+(\d+)',
-            r'select\s+(\d+)',
-            r'choose\s+(\d+)',
-            r'number\s+(\d+)'
-        ]
-        
-        for pattern in number_patterns:
-            match = re.search(pattern, voice_text)
+        for pattern in _NUMBER_PATTERNS:
+            match = pattern.search(voice_text)
             if match:
                 selection_index = int(match.group(1)) - 1  # Convert to 0-based index
                 if 0 <= selection_index < len(self.pending_card_options):
@@ -4631,24 +5706,19 @@ Enter new card information above and click "Check Price" to get pricing data.
                     self.pending_voice_data = {}
                     return
                 else:
-                    self.root.after(0, lambda: self.voice_status_var.set(f"Invalid selection. Please say 1-{len(self.pending_card_options)}"))
+                    self.root.after(0, self.voice_status_var.set, f"Invalid selection. Please say 1-{len(self.pending_card_options)}")
                     return
         
         # Check for reject/cancel commands
-        reject_patterns = [
-            r'reject', r'cancel', r'no', r'none', r'skip'
-        ]
-        
-        for pattern in reject_patterns:
-            if re.search(pattern, voice_text):
-                self.pending_voice_confirmation = False
-                self.pending_card_options = []
-                self.pending_voice_data = {}
-                self.root.after(0, lambda: self.voice_status_var.set("Selection cancelled, continue speaking..."))
-                return
+        if _REJECT_RE.search(voice_text):
+            self.pending_voice_confirmation = False
+            self.pending_card_options = []
+            self.pending_voice_data = {}
+            self.root.after(0, self.voice_status_var.set, "Selection cancelled, continue speaking...")
+            return
         
         # If we get here, the voice input wasn't recognized
-        self.root.after(0, lambda: self.voice_status_var.set(f"Say a number 1-{len(self.pending_card_options)} or 'cancel'"))
+        self.root.after(0, self.voice_status_var.set, f"Say a number 1-{len(self.pending_card_options)} or 'cancel'")
     
     def find_and_present_card_options(self, card_name, art_variant=None, rarity=None):
         """Find multiple matching cards and present options to user"""
@@ -4656,95 +5726,58 @@ Enter new card information above and click "Check Price" to get pricing data.
             return
         
         # Debug: Print search parameters
-        print(f"[CARD SEARCH DEBUG] Searching for: '{card_name}', rarity: '{rarity}', art_variant: '{art_variant}'")
-        print(f"[CARD SEARCH DEBUG] Total cards in set: {len(self.pack_session.set_cards)}")
+        # Per-card debug output is skipped entirely unless DEBUG logging is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Normalised once; set rarities are pre-normalised in the match index
+        rarity_norm = rarity.lower().strip() if rarity else None
+        logger.debug("[CARD SEARCH] Searching for: '%s', rarity: '%s', art_variant: '%s'", card_name, rarity, art_variant)
+        logger.debug("[CARD SEARCH] Total cards in set: %s", len(self.pack_session.set_cards))
         
         # Enhanced matching for YGO fantasy names with improved lenient search
         card_matches = []
         
-        # Implement both normal and lenient search modes
-        def get_card_name_variants(name):
-            """Generate alternative spellings and pronunciations for YGO cards"""
-            variants = [name]
-            
-            # Common YGO card name patterns and substitutions
-            substitutions = {
-                'yu': ['you', 'u'],
-                'gi': ['gee', 'ji'],
-                'oh': ['o'],
-                'elemental': ['elemental', 'element'],
-                'hero': ['hiro', 'heero', 'hero'],
-                'evil': ['evil', 'evel'],
-                'dark': ['dark', 'drak'],
-                'gaia': ['gaia', 'gaya', 'guy', 'gya'],
-                'cyber': ['siber', 'cyber'],
-                'dragon': ['drago', 'drag'],
-                'magician': ['magic', 'mage'],
-                'warrior': ['war', 'warrior'],
-                'machine': ['mach', 'machin'],
-                'beast': ['best', 'beast'],
-                'fiend': ['fend', 'fiend'],
-                'spellcaster': ['spell', 'caster'],
-                'aqua': ['agua', 'aqua'],
-                'winged': ['wing', 'winged'],
-                'thunder': ['under', 'thunder'],
-                'zombie': ['zomb', 'zombie'],
-                'plant': ['plan', 'plant'],
-                'insect': ['insec', 'insect'],
-                'rock': ['rok', 'rock'],
-                'pyro': ['fire', 'pyro'],
-                'sea': ['see', 'sea'],
-                'divine': ['divin', 'divine'],
-                # Add compound word handling
-                'metal flame': ['metalflame', 'metal flame'],
-                'flame': ['flame', 'flam'],
-                'metal': ['metal', 'mettle']
-            }
-            
-            # Create phonetic alternatives
-            lower_name = name.lower()
-            for original, alternatives in substitutions.items():
-                if original in lower_name:
-                    for alt in alternatives:
-                        variants.append(lower_name.replace(original, alt))
-            
-            # Add compound word variants (for cases like "metal flame" -> "metalflame")
-            words = lower_name.split()
-            if len(words) >= 2:
-                # Add version with spaces removed
-                variants.append(''.join(words))
-                # Add version with different spacing
-                for i in range(1, len(words)):
-                    compound_variant = ''.join(words[:i]) + ' ' + ' '.join(words[i:])
-                    variants.append(compound_variant)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_variants = []
-            for variant in variants:
-                if variant.lower() not in seen:
-                    seen.add(variant.lower())
-                    unique_variants.append(variant)
-            
-            return unique_variants
-        
-        # Get card name variants for better matching
-        search_variants = get_card_name_variants(card_name)
-        print(f"[CARD SEARCH DEBUG] Generated search variants: {search_variants}")
-        print(f"[CARD SEARCH DEBUG] Using rarity filter: '{rarity}'")
-        
-        for card in self.pack_session.set_cards:
+        self._card_match_index()  # Rebuild the match index if the set changed
+        
+        # Fast path: a clearly spoken name is a substring of the card name, so only
+        # those cards are scored and no phonetic variants are needed
+        exact = []
+        if len(card_name) >= 3:
+            exact = [i for i, name in enumerate(self._card_names_lower) if card_name in name]
+        
+        if exact:
+            search_variants = (card_name,)
+            candidates = exact
+            logger.debug("[CARD SEARCH] Exact substring match in %s cards, skipping variants", len(exact))
+        else:
+            # Get card name variants for better matching
+            search_variants = get_card_name_variants(card_name)
+            logger.debug("[CARD SEARCH] Generated search variants: %s", search_variants)
+            # Prefilter through the token index
+            candidates = self._candidate_card_indices(search_variants)
+        logger.debug("[CARD SEARCH] Using rarity filter: '%s'", rarity)
+        # A set has only a handful of rarities: score each once, cards then just look theirs up
+        rarity_table = {r: rarity_match_score(rarity_norm, r) for r in self._set_rarity_vocab} if rarity else None
+        
+        # Fuzzy-score the shortlist in one pass (reused when the same phrase is retried)
+        set_cards = self.pack_session.set_cards
+        candidate_name_scores = self._candidate_name_scores(card_name, search_variants, candidates)
+        logger.debug("[CARD SEARCH] Scoring %s candidate cards", len(candidates))
+        name_scores = {}  # card name -> name score, reused for the variant pass below
+        
+        for pos, idx in enumerate(candidates):
+            card = set_cards[idx]
+            name_score = candidate_name_scores[pos]
+            if name_score is None:
+                continue  # Scoring failed for this card (already logged)
             try:
-                # Simplified and improved confidence calculation
-                # Calculate name score using 3 key methods
-                name_score = self.calculate_name_confidence(card_name, card['name'], search_variants)
+                name_scores[card['name']] = name_score
                 
                 # Calculate rarity score (only if rarity was specified)
                 rarity_score = 0
                 if rarity:
-                    rarity_score = self.calculate_rarity_confidence(rarity, card)
+                    rarity_score = self.calculate_rarity_confidence(rarity, card, self._card_rarity_keys[idx], rarity_table)
             except Exception as e:
-                print(f"[NAME MATCH ERROR] Error processing card '{card.get('name', 'Unknown')}': {e}")
+                logger.warning("[NAME MATCH] Error processing card '%s': %s", card.get('name', 'Unknown'), e)
                 continue
             
             # Weight card name more heavily than rarity (75% name + 25% rarity)
@@ -4762,11 +5795,11 @@ Enter new card information above and click "Check Price" to get pricing data.
                 total_score = name_score
             
             # Debug output for matches above threshold
-            if total_score >= 50:
-                print(f"[CARD SEARCH DEBUG] Match: '{card['name']}' (Name: {name_score:.1f}%, Rarity: {rarity_score:.1f}%, Total: {total_score:.1f}%)")
-                card_sets = card.get('card_sets', [])
+            if debug and total_score >= 50:
+                logger.debug("[CARD SEARCH] Match: '%s' (Name: %.1f%%, Rarity: %.1f%%, Total: %.1f%%)", card['name'], name_score, rarity_score, total_score)
+                card_sets = card['card_sets']
                 for card_set in card_sets[:2]:  # Show first 2 rarities
-                    print(f"  - Available: {card_set.get('set_rarity', 'N/A')}")
+                    logger.debug("  - Available: %s", card_set.get('set_rarity', 'N/A'))
             
             if total_score >= 50:  # Lowered threshold since name is now weighted more heavily
                 # Check if this is the same card name we already have
@@ -4792,233 +5825,340 @@ Enter new card information above and click "Check Price" to get pricing data.
                     })
         
         if not card_matches:
-            print("[CARD SEARCH DEBUG] No matches found above 50% threshold")
-            self.root.after(0, lambda: self.voice_status_var.set(f"No matches found for: {card_name}"))
+            logger.debug("[CARD SEARCH] No matches found above 50% threshold")
+            self.root.after(0, self.voice_status_var.set, f"No matches found for: {card_name}")
             return
         
         # Now find ALL variants of the matched cards in the current set
-        all_variants = []
-        exact_name_matches = []  # Track exact name matches for prioritization
+        variants_by_key = {}  # variant_key -> variant; a priority variant replaces a plain one
         
         for match in card_matches:
             card_name_to_find = match['name']
-            print(f"[CARD SEARCH DEBUG] Finding all variants for: '{card_name_to_find}'")
+            logger.debug("[CARD SEARCH] Finding all variants for: '%s'", card_name_to_find)
             
             # Check if this is an exact or very close match to what the user said
             is_priority_match = (
-                fuzz.token_set_ratio(card_name.lower(), card_name_to_find.lower()) >= 90 or
+                fuzz.token_set_ratio(_fuzz_key(card_name), _fuzz_key(card_name_to_find)) >= 90 or
                 card_name_to_find.lower() in card_name.lower() or
                 card_name.lower() in card_name_to_find.lower()
             )
             
-            # Find all cards with the same name but different rarities/variants
-            for card in self.pack_session.set_cards:
-                if card['name'] == card_name_to_find:
-                    card_sets = card.get('card_sets', [])
-                    for card_set in card_sets:
-                        # Create a unique variant for each rarity
-                        variant_key = f"{card['name']}_{card_set.get('set_rarity', 'Unknown')}_{card_set.get('set_code', 'N/A')}"
+            # Find all cards with the same name but different rarities/variants (indexed by name)
+            for card_idx in self._indices_by_name.get(card_name_to_find, ()):
+                card = set_cards[card_idx]
+                card_sets = card['card_sets']
+                for card_set, set_rarity in zip(card_sets, self._card_rarity_keys[card_idx]):
+                    # Create a unique variant for each rarity
+                    variant_key = f"{card['name']}_{card_set.get('set_rarity', 'Unknown')}_{card_set.get('set_code', 'N/A')}"
+                    
+                    # Skip variants already added, unless this one upgrades it to priority
+                    existing = variants_by_key.get(variant_key)
+                    if existing is not None and (existing['is_priority'] or not is_priority_match):
+                        continue
+                    
+                    # Same name, same score: reuse the first pass
+                    name_score = name_scores.get(card['name'])
+                    if name_score is None:
+                        name_score = self.calculate_name_confidence(card_name, card['name'], search_variants,
+                                                                    card_norm=self._card_norms[card_idx])
+                    
+                    # Calculate rarity score for this specific variant
+                    rarity_score = 0
+                    if rarity:
+                        # Direct rarity comparison for this variant
+                        if set_rarity == rarity_norm:
+                            rarity_score = 100  # Perfect match
+                        elif rarity_norm in set_rarity or set_rarity in rarity_norm:
+                            rarity_score = 80   # Good partial match
+                        else:
+                            rarity_score = rarity_similarity(rarity_norm, set_rarity) * 0.7  # Fuzzy match scaled down
+                    
+                    # Weight card name more heavily than rarity (75% name + 25% rarity)
+                    # Getting the correct card is more important than identifying the correct rarity
+                    if rarity:
+                        confidence = (name_score * 0.75) + (rarity_score * 0.25)
                         
-                        # Check if we already added this exact variant
-                        if not any(v.get('variant_key') == variant_key for v in all_variants):
-                            # Recalculate confidence using the new simplified method
-                            name_score = self.calculate_name_confidence(card_name, card['name'], search_variants)
-                            
-                            # Calculate rarity score for this specific variant
-                            rarity_score = 0
-                            if rarity:
-                                # Direct rarity comparison for this variant
-                                set_rarity = card_set.get('set_rarity', '').lower().strip()
-                                input_rarity = rarity.lower().strip()
-                                
-                                if set_rarity == input_rarity:
-                                    rarity_score = 100  # Perfect match
-                                elif input_rarity in set_rarity or set_rarity in input_rarity:
-                                    rarity_score = 80   # Good partial match
-                                else:
-                                    rarity_score = fuzz.ratio(input_rarity, set_rarity) * 0.7  # Fuzzy match scaled down
-                            
-                            # Weight card name more heavily than rarity (75% name + 25% rarity)
-                            # Getting the correct card is more important than identifying the correct rarity
-                            if rarity:
-                                confidence = (name_score * 0.75) + (rarity_score * 0.25)
-                                
-                                # Require minimum name score to prevent poor card matches
-                                # being boosted by perfect rarity matches
-                                if name_score < 40:
-                                    confidence = confidence * 0.5  # Heavily penalize poor name matches
-                            else:
-                                confidence = name_score
-                            
-                            # Apply caps to prevent over-confidence
-                            if rarity and rarity_score == 100:  # Exact rarity match
-                                confidence = min(95, confidence)
-                            else:
-                                confidence = min(85, confidence)
-                            
-                            variant = {
-                                'card_data': card,
-                                'confidence': confidence,
-                                'name': card['name'],
-                                'rarity': card_set.get('set_rarity', 'Unknown'),
-                                'set_code': card_set.get('set_code', 'N/A'),
-                                'variant_key': variant_key,
-                                'is_priority': is_priority_match
-                            }
-                            
-                            # Debug output
-                            rarity_debug = f"(Name: {name_score:.1f}%, Rarity: {rarity_score:.1f}%)" if rarity else f"(Name: {name_score:.1f}%)"
-                            
-                            if is_priority_match:
-                                exact_name_matches.append(variant)
-                                print(f"[CARD SEARCH DEBUG] Priority variant: {card['name']} - {card_set.get('set_rarity')} ({confidence:.1f}%) {rarity_debug}")
-                            else:
-                                all_variants.append(variant)
-                                print(f"[CARD SEARCH DEBUG] Added variant: {card['name']} - {card_set.get('set_rarity')} ({confidence:.1f}%) {rarity_debug}")
-        
-        # Combine priority matches first, then other variants
-        final_variants = exact_name_matches + all_variants
+                        # Require minimum name score to prevent poor card matches
+                        # being boosted by perfect rarity matches
+                        if name_score < 40:
+                            confidence = confidence * 0.5  # Heavily penalize poor name matches
+                    else:
+                        confidence = name_score
+                    
+                    # Apply caps to prevent over-confidence
+                    if rarity and rarity_score == 100:  # Exact rarity match
+                        confidence = min(95, confidence)
+                    else:
+                        confidence = min(85, confidence)
+                    
+                    variant = {
+                        'card_data': card,
+                        'confidence': confidence,
+                        'name': card['name'],
+                        'rarity': card_set.get('set_rarity', 'Unknown'),
+                        'set_code': card_set.get('set_code', 'N/A'),
+                        'variant_key': variant_key,
+                        'is_priority': is_priority_match
+                    }
+                    
+                    variants_by_key[variant_key] = variant
+                    
+                    # Debug output
+                    if debug:
+                        rarity_debug = f"(Name: {name_score:.1f}%, Rarity: {rarity_score:.1f}%)" if rarity else f"(Name: {name_score:.1f}%)"
+                        kind = "Priority" if is_priority_match else "Added"
+                        logger.debug("[CARD SEARCH] %s variant: %s - %s (%.1f%%) %s", kind, card['name'], card_set.get('set_rarity'), confidence, rarity_debug)
+
+        final_variants = list(variants_by_key.values())
         
         if not final_variants:
-            print("[CARD SEARCH DEBUG] No variants found")
-            self.root.after(0, lambda: self.voice_status_var.set(f"No variants found for: {card_name}"))
+            logger.debug("[CARD SEARCH] No variants found")
+            self.root.after(0, self.voice_status_var.set, f"No variants found for: {card_name}")
             return
         
-        # Sort by confidence level (highest first) as requested by user
-        # Apply bonuses for exact rarity matches and priority, but sort purely by final confidence
-        def sort_key(variant):
-            confidence = variant['confidence']
-            # Sort by confidence only (highest first)
-            return -confidence
-        
-        final_variants.sort(key=sort_key)
+        # Top 8 variants (increased from 5) by confidence, highest first, as requested by user
+        # Priority only breaks ties, so equal scores still list priority matches first
+        final_variants = heapq.nlargest(8, final_variants, key=lambda v: (v['confidence'], v['is_priority']))
         
-        # Ensure unique confidence scores to avoid ties
+        # Ensure unique confidence scores to avoid ties (each adjustment only depends on
+        # higher-ranked variants, so doing this after the cut gives the same top 8)
         self.ensure_unique_confidence_scores(final_variants)
         
-        # Limit to top 8 variants (increased from 5) to capture more options
-        final_variants = final_variants[:8]
-        
-        print(f"[CARD SEARCH DEBUG] Final variants to present: {len(final_variants)}")
-        for i, variant in enumerate(final_variants, 1):
-            priority_flag = "⭐ PRIORITY" if variant.get('is_priority') else ""
-            # Check for exact rarity match
-            exact_rarity_flag = ""
-            if rarity:
-                variant_rarity = variant.get('rarity', '').lower().strip()
-                input_rarity = rarity.lower().strip()
-                if variant_rarity == input_rarity:
-                    exact_rarity_flag = "🎯 EXACT RARITY"
-            
-            print(f"  {i}. {variant['name']} - {variant['rarity']} ({variant['confidence']:.1f}%) {priority_flag} {exact_rarity_flag}")
-        
-        # Get auto-confirm threshold
-        try:
-            auto_threshold = int(self.auto_confirm_threshold_var.get())
-        except ValueError:
-            auto_threshold = 85
+        logger.debug("[CARD SEARCH] Final variants to present: %s", len(final_variants))
+        if debug:
+            for i, variant in enumerate(final_variants, 1):
+                priority_flag = "⭐ PRIORITY" if variant.get('is_priority') else ""
+                # Check for exact rarity match
+                exact_rarity_flag = ""
+                if rarity:
+                    variant_rarity = variant.get('rarity', '').lower().strip()
+                    if variant_rarity == rarity_norm:
+                        exact_rarity_flag = "🎯 EXACT RARITY"
+                
+                logger.debug("  %s. %s - %s (%.1f%%) %s %s", i, variant['name'], variant['rarity'], variant['confidence'], priority_flag, exact_rarity_flag)
         
-        # Debug auto-confirm state with explicit checkbox checking
-        auto_confirm_enabled = self.auto_confirm_var.get()
+        # Auto-confirm settings, mirrored from the Tk vars by update_auto_confirm_setting
+        auto_threshold = self._auto_threshold
+        auto_confirm_enabled = self._auto_confirm_enabled
         best_match = final_variants[0]
         
-        # Additional debug: check the actual widget state
-        print(f"[AUTO-CONFIRM DEBUG] BooleanVar.get(): {auto_confirm_enabled}")
-        print(f"[AUTO-CONFIRM DEBUG] Threshold: {auto_threshold}%, Best match: {best_match['name']} ({best_match['confidence']:.1f}%)")
-        print(f"[AUTO-CONFIRM DEBUG] Would auto-confirm: {auto_confirm_enabled and best_match['confidence'] >= auto_threshold}")
+        logger.debug("[AUTO-CONFIRM] Enabled: %s", auto_confirm_enabled)
+        logger.debug("[AUTO-CONFIRM] Threshold: %s%%, Best match: %s (%.1f%%)", auto_threshold, best_match['name'], best_match['confidence'])
+        logger.debug("[AUTO-CONFIRM] Would auto-confirm: %s", auto_confirm_enabled and best_match['confidence'] >= auto_threshold)
         
         # Check for auto-confirm - FIXED: Properly check the state
         if auto_confirm_enabled and best_match['confidence'] >= auto_threshold:
             # Auto-confirm the best match
-            print(f"[AUTO-CONFIRM DEBUG] Auto-confirming {best_match['name']} - {best_match['rarity']}")
+            logger.debug("[AUTO-CONFIRM] Auto-confirming %s - %s", best_match['name'], best_match['rarity'])
             # Lock status to prevent voice loop interference
             self.voice_status_locked = True
             
             # CRITICAL FIX: Schedule card addition on main thread to fix UI update issues
             def add_card_on_main_thread():
-                print(f"[AUTO-CONFIRM DEBUG] Adding card on main thread")
+                logger.debug("[AUTO-CONFIRM] Adding card on main thread")
                 self.add_card_to_session(best_match['card_data'], art_variant, best_match['rarity'])
             
             self.root.after(0, add_card_on_main_thread)
-            self.root.after(0, lambda: self.voice_status_var.set(f"Auto-confirmed: {best_match['name']} - {best_match['rarity']} ({best_match['confidence']}%)"))
+            self.root.after(0, self.voice_status_var.set, f"Auto-confirmed: {best_match['name']} - {best_match['rarity']} ({best_match['confidence']}%)")
             
             # Clear the auto-confirmed status after 2 seconds and return to listening mode
             def clear_auto_confirm_status():
-                print("[VOICE DEBUG] Clearing auto-confirmed status and unlocking voice status")
+                logger.debug("[VOICE] Clearing auto-confirmed status and unlocking voice status")
                 if self.voice_listening:
                     self.voice_status_var.set("🎤 Listening...")
                 else:
                     self.voice_status_var.set("Voice recognition ready")
                 # Unlock status to allow voice loop to continue
                 self.voice_status_locked = False
-                print("[VOICE DEBUG] Voice status unlocked after auto-confirm - ready for new input")
+                logger.debug("[VOICE] Voice status unlocked after auto-confirm - ready for new input")
             
-            # Use after_idle for higher priority to ensure voice status clearing is not blocked by other UI updates
-            self.root.after(2000, lambda: self.root.after_idle(clear_auto_confirm_status))  # Clear after 2 seconds with high priority
+            self.root.after(2000, clear_auto_confirm_status)  # Clear after 2 seconds
             return
         
         # Present options to user
-        print(f"[VOICE DEBUG] Showing dialog with {len(final_variants)} options to user")
+        logger.debug("[VOICE] Showing dialog with %s options to user", len(final_variants))
         self.show_voice_card_options(final_variants, card_name, art_variant, rarity)
     
-    def calculate_name_confidence(self, input_name, card_name, search_variants):
-        """Calculate confidence score for name matching using simplified approach"""
-        scores = []
-        
-        # Method 1: Best fuzzy match across all variants
-        best_fuzzy = 0
+    def _card_match_index(self):
+        """Fuzzy-normalised names for the current set, rebuilt only when set_cards is replaced"""
+        cards = self.pack_session.set_cards
+        if self._match_index_cards is not cards:
+            self._match_index_cards = cards
+            self._card_norms = [card_name_norm(c.get('name') or '') for c in cards]
+            self._card_name_keys = [norm['key'] for norm in self._card_norms]
+            self._card_names_lower = [(c.get('name') or '').lower() for c in cards]
+            self._card_rarity_keys = [
+                tuple((cs.get('set_rarity') or '').lower().strip() for cs in c['card_sets'])
+                for c in cards
+            ]
+            self._set_rarity_vocab = frozenset(r for keys in self._card_rarity_keys for r in keys)
+            token_to_cards = defaultdict(set)
+            ngram_to_cards = defaultdict(set)
+            indices_by_name = defaultdict(list)
+            for idx, c in enumerate(cards):
+                for key in name_index_tokens(c.get('name') or ''):
+                    token_to_cards[key].add(idx)
+                for gram in name_ngrams(c.get('name') or ''):
+                    ngram_to_cards[gram].add(idx)
+                indices_by_name[c.get('name')].append(idx)
+            self._token_to_cards = dict(token_to_cards)
+            self._ngram_to_cards = dict(ngram_to_cards)
+            self._name_score_cache.clear()
+            self._indices_by_name = dict(indices_by_name)
+        return self._card_name_keys
+    
+    def _candidate_card_indices(self, search_variants):
+        """Shortlist set_cards indices sharing a word or prefix with any search variant"""
+        keys = set()
         for variant in search_variants:
-            # Use token_set_ratio as it handles word order differences well
-            score = fuzz.token_set_ratio(variant.lower(), card_name.lower())
-            best_fuzzy = max(best_fuzzy, score)
-        scores.append(best_fuzzy)
-        
-        # Method 2: Enhanced substring/word matching for fantasy names
-        clean_input = re.sub(r'[^\w\s]', '', input_name.lower())
-        clean_card = re.sub(r'[^\w\s]', '', card_name.lower())
-        
-        input_words = clean_input.split()
-        card_words = clean_card.split()
+            keys |= name_index_tokens(variant)
+        candidates = set()
+        for key in keys:
+            candidates |= self._token_to_cards.get(key, set())
+        # Too few hits means the words were likely misheard; widen to cards sharing 3-grams
+        if len(candidates) < 3:
+            grams = set()
+            for variant in search_variants:
+                grams |= name_ngrams(variant)
+            shared = Counter()
+            for gram in grams:
+                shared.update(self._ngram_to_cards.get(gram, ()))
+            candidates |= {idx for idx, count in shared.items() if count >= _NGRAM_MIN_SHARED}
+        # Still nothing to go on; score everything
+        if len(candidates) < 3:
+            return range(len(self.pack_session.set_cards))
+        return sorted(candidates)
+    
+    def _candidate_name_scores(self, card_name, search_variants, candidates):
+        """Name confidence per candidate, memoised per spoken phrase until set_cards changes"""
+        cache_key = (card_name, search_variants)
+        cached = self._name_score_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("[CARD SEARCH] Reusing name scores for '%s'", card_name)
+            return cached
+        
+        set_cards = self.pack_session.set_cards
+        best_fuzzy = self._best_variant_scores(search_variants, [self._card_name_keys[i] for i in candidates])
+        word_scores = self._word_match_scores(card_name, [self._card_norms[i] for i in candidates])
+        compound_scores = self._compound_scores(card_name, [self._card_norms[i] for i in candidates])
+        scores = []
+        for pos, idx in enumerate(candidates):
+            card = set_cards[idx]
+            try:
+                # Calculate name score using 3 key methods
+                scores.append(self.calculate_name_confidence(card_name, card['name'], search_variants,
+                                                             best_fuzzy[pos], word_scores[pos], self._card_norms[idx],
+                                                             compound_scores[pos]))
+            except Exception as e:
+                logger.warning("[NAME MATCH] Error processing card '%s': %s", card.get('name', 'Unknown'), e)
+                scores.append(None)
+        self._name_score_cache.set(cache_key, scores)
+        return scores
+    
+    def _best_variant_scores(self, search_variants, name_keys):
+        """Best token_set_ratio of any search variant against each card name, by card index"""
+        variant_keys = [_fuzz_key(v) for v in search_variants]
+        best = [0] * len(name_keys)
+        if RAPIDFUZZ_AVAILABLE and NUMPY_AVAILABLE and name_keys:
+            # One variants x cards matrix in C++, reduced to the best variant per card
+            return process.cdist(variant_keys, name_keys, scorer=fuzz.token_set_ratio,
+                                 processor=None).max(axis=0).tolist()
+        if RAPIDFUZZ_AVAILABLE:
+            for key in variant_keys:
+                for _, score, idx in process.extract(key, name_keys, scorer=fuzz.token_set_ratio,
+                                                     processor=None, limit=None):
+                    if score > best[idx]:
+                        best[idx] = score
+        else:
+            for idx, name_key in enumerate(name_keys):
+                best[idx] = max((fuzz.token_set_ratio(key, name_key) for key in variant_keys), default=0)
+        return best
+    
+    def _word_match_scores(self, input_name, card_norms):
+        """Method-2 word match score for each card_name_norm(), fuzzy word pairs scored in one cdist call"""
+        input_words = clean_card_name(input_name).split()
+        card_word_lists = [norm['words'] for norm in card_norms]
+        if not (RAPIDFUZZ_AVAILABLE and NUMPY_AVAILABLE) or not input_words:
+            return [None] * len(card_norms)  # calculate_name_confidence scores each card itself
+        
+        meaningful = [word for word in input_words if len(word) >= 2]
+        vocab = list(dict.fromkeys(word for words in card_word_lists for word in words))
+        if not meaningful or not vocab:
+            return [0] * len(card_norms)
+        vocab_pos = {word: i for i, word in enumerate(vocab)}
+        # hits[i, j]: spoken word i fuzzily matches (>=80) vocabulary word j
+        hits = process.cdist(meaningful, vocab, scorer=fuzz.ratio, processor=None, score_cutoff=80) >= 80
         
-        # Calculate percentage of input words that have good matches in card name
-        word_match_score = 0
-        if input_words:
+        scores = []
+        for norm, card_words in zip(card_norms, card_word_lists):
+            fuzzy_hit = hits[:, [vocab_pos[word] for word in card_words]].any(axis=1) if card_words else None
+            wordset = norm['wordset']
             matched_words = 0
-            for input_word in input_words:
-                if len(input_word) >= 2:  # Check meaningful words
-                    best_word_match = 0
-                    for card_word in card_words:
-                        # Check for exact substring match first, but only for meaningful words
-                        # Avoid false positives from very short words like "a", "i", "of", "the"
-                        if len(card_word) >= 3 and len(input_word) >= 3:
-                            if input_word in card_word or card_word in input_word:
-                                best_word_match = 100
-                                break
-                        # Check fuzzy similarity for all words
-                        word_similarity = fuzz.ratio(input_word, card_word)
-                        best_word_match = max(best_word_match, word_similarity)
-                    
-                    # Consider it a match if similarity is high enough
-                    if best_word_match >= 80:
-                        matched_words += 1
-            
-            word_match_score = (matched_words / len(input_words)) * 100
+            for i, input_word in enumerate(meaningful):
+                # Exact word first, then the name_word_matches rules: substring for meaningful words, then fuzzy
+                if input_word in wordset or (len(input_word) >= 3 and any(len(card_word) >= 3 and (input_word in card_word or card_word in input_word)
+                                                 for card_word in card_words)) or (card_words and fuzzy_hit[i]):
+                    matched_words += 1
+            scores.append((matched_words / len(input_words)) * 100)
+        return scores
+    
+    def _compound_scores(self, input_name, card_norms):
+        """Method-3 fuzz.ratio of the space-free input against each space-free card name, in one cdist call"""
+        if not (RAPIDFUZZ_AVAILABLE and NUMPY_AVAILABLE) or not card_norms:
+            return [None] * len(card_norms)  # calculate_name_confidence scores each card itself
+        no_space_input = clean_card_name(input_name).replace(' ', '')
+        return process.cdist([no_space_input], [norm['nospace'] for norm in card_norms],
+                             scorer=fuzz.ratio, processor=None)[0].tolist()
+    
+    def calculate_name_confidence(self, input_name, card_name, search_variants, best_fuzzy=None, word_match_score=None,
+                                  card_norm=None, compound_score=None):
+        """Calculate confidence score for name matching using simplified approach"""
+        # Card side comes precomputed from the match index when given
+        if card_norm is None:
+            card_norm = card_name_norm(card_name)
+        clean_input = clean_card_name(input_name)
         
-        scores.append(word_match_score)
+        input_words = clean_input.split()
+        card_words = card_norm['words']
         
-        # Method 3: Special handling for compound words (like "Metal flame" -> "Metalflame")
+        # Method 3 (checked first): Special handling for compound words (like "Metal flame" -> "Metalflame")
         # Remove spaces and check direct similarity
-        no_space_input = clean_input.replace(' ', '')
-        no_space_card = clean_card.replace(' ', '')
-        compound_score = fuzz.ratio(no_space_input, no_space_card)
-        scores.append(compound_score)
+        if compound_score is None:
+            no_space_input = clean_input.replace(' ', '')
+            no_space_card = card_norm['nospace']
+            # Identical compounds are a plain string compare; only differing ones need the DP
+            compound_score = (100 if no_space_input and no_space_input == no_space_card
+                              else fuzz.ratio(no_space_input, no_space_card))
+        
+        # A perfect compound match is already the best possible score, so the
+        # fuzzy and word methods are skipped (the length penalty still applies)
+        if compound_score < 100:
+            # Method 1: Best fuzzy match across all variants (precomputed for the whole set when given)
+            if best_fuzzy is None:
+                # Use token_set_ratio as it handles word order differences well
+                best_fuzzy = max((fuzz.token_set_ratio(_fuzz_key(v), card_norm['key']) for v in search_variants), default=0)
+            
+            # Method 2: Enhanced substring/word matching for fantasy names
+            # Calculate percentage of input words that have good matches in card name (batched when given)
+            if word_match_score is None:
+                word_match_score = 0
+                if input_words:
+                    matched_words = 0
+                    for input_word in input_words:
+                        # Check meaningful words - an exact word is a set probe, fuzzy only otherwise
+                        if len(input_word) >= 2 and (input_word in card_norm['wordset'] or
+                                                     name_word_matches(input_word, card_words)):
+                            matched_words += 1
+                    
+                    word_match_score = (matched_words / len(input_words)) * 100
         
-        # Take the best score from all methods
-        raw_score = max(scores)
+        # Take the best score from all methods (None for a method that was skipped)
+        scores = [best_fuzzy, word_match_score, compound_score]
+        raw_score = max(score for score in scores if score is not None)
         
         # Apply length penalty for significantly different lengths
-        input_len = len(clean_input.split())
-        card_len = len(clean_card.split())
+        input_len = len(input_words)
+        card_len = len(card_words)
         
         # If input is much shorter than card name, apply penalty to avoid over-matching
         if input_len > 0 and card_len > 0:
@@ -5035,36 +6175,23 @@ Enter new card information above and click "Check Price" to get pricing data.
             final_score = raw_score
         
         # Debug output for significant matches
-        if final_score >= 70:
+        if final_score >= 70 and logger.isEnabledFor(logging.DEBUG):
             penalty_info = f" (penalty: {(1-length_penalty)*100:.0f}%)" if length_penalty < 1.0 else ""
-            print(f"[NAME MATCH DEBUG] '{input_name}' -> '{card_name}': {final_score:.1f}% (fuzzy: {scores[0]}, word: {scores[1]}, compound: {scores[2]}){penalty_info}")
+            logger.debug("[NAME MATCH] '%s' -> '%s': %.1f%% (fuzzy: %s, word: %s, compound: %s)%s", input_name, card_name, final_score, scores[0], scores[1], scores[2], penalty_info)
         
         return final_score
     
-    def calculate_rarity_confidence(self, input_rarity, card):
-        """Calculate confidence score for rarity matching"""
-        card_sets = card.get('card_sets', [])
-        best_rarity_score = 0
+    def calculate_rarity_confidence(self, input_rarity, card, set_rarities=None, rarity_table=None):
+        """Calculate confidence score for rarity matching (set_rarities: precomputed lowercase rarities,
+        rarity_table: rarity_match_score per set rarity for this input)"""
+        if set_rarities is None:
+            set_rarities = [cs.get('set_rarity', '').lower().strip() for cs in card.get('card_sets', [])]
+        if rarity_table is not None:
+            return max((rarity_table[set_rarity] for set_rarity in set_rarities), default=0)
         
         input_rarity_clean = input_rarity.lower().strip()
-        
-        for card_set in card_sets:
-            set_rarity = card_set.get('set_rarity', '').lower().strip()
-            
-            if set_rarity == input_rarity_clean:
-                # Exact match gets highest score
-                best_rarity_score = 100
-                break
-            elif input_rarity_clean in set_rarity or set_rarity in input_rarity_clean:
-                # Partial match gets good score
-                best_rarity_score = max(best_rarity_score, 80)
-            else:
-                # Use fuzzy matching for rarity names
-                rarity_similarity = fuzz.ratio(input_rarity_clean, set_rarity)
-                if rarity_similarity >= 70:
-                    best_rarity_score = max(best_rarity_score, rarity_similarity * 0.7)  # Scale down fuzzy rarity matches
-        
-        return best_rarity_score
+        # Best of exact (100), partial (80) and scaled fuzzy matches across the card's rarities
+        return max((rarity_match_score(input_rarity_clean, set_rarity) for set_rarity in set_rarities), default=0)
     
     def get_card_rarity_display(self, card, specified_rarity=None):
         """Get the best rarity display for a card"""
@@ -5082,48 +6209,26 @@ Enter new card information above and click "Check Price" to get pricing data.
         if not variants:
             return
         
-        # Track used confidence scores
-        used_scores = set()
+        # Highest first; the sort is stable so the caller's tie order (priority first) is kept
+        variants.sort(key=lambda v: -v['confidence'])
         
+        # One pass: each score must sit at least 0.1 below the one above it (0.1 is the displayed precision)
+        previous = None
         for variant in variants:
             original_confidence = variant['confidence']
-            confidence = original_confidence
-            
-            # If this confidence is already used, find a unique one
-            while confidence in used_scores:
-                confidence -= 0.1
-                # Ensure we don't go below reasonable bounds
-                if confidence < 10:
-                    confidence = original_confidence + 0.1
-                    while confidence in used_scores:
-                        confidence += 0.1
-                        if confidence > 99:
-                            break
-                    break
-            
-            # Round to one decimal place and update
-            confidence = round(confidence, 1)
+            confidence = round(original_confidence, 1)
+            if previous is not None and confidence > previous - 0.1:
+                confidence = round(previous - 0.1, 1)
             variant['confidence'] = confidence
-            used_scores.add(confidence)
+            previous = confidence
             
             if confidence != original_confidence:
-                print(f"[CARD SEARCH DEBUG] Adjusted confidence for uniqueness: {variant['name']} {original_confidence}% -> {confidence}%")
+                logger.debug("[CARD SEARCH] Adjusted confidence for uniqueness: %s %s%% -> %s%%", variant['name'], original_confidence, confidence)
     
     def show_voice_card_options(self, card_matches, original_input, art_variant, rarity):
         """Show card options dialog for voice selection"""
         print(f"[DIALOG DEBUG] show_voice_card_options called with {len(card_matches)} matches")
         
-        # Test: Try to create a simple dialog first to see if it's a dialog creation issue
-        try:
-            test_dialog = tk.Toplevel(self.root)
-            test_dialog.title("Test Dialog")
-            test_dialog.geometry("200x100")
-            ttk.Label(test_dialog, text="Dialog creation test").pack()
-            test_dialog.after(1000, test_dialog.destroy)  # Auto-close after 1 second
-            print(f"[DIALOG DEBUG] Simple test dialog created successfully")
-        except Exception as e:
-            print(f"[DIALOG DEBUG] Failed to create test dialog: {e}")
-        
         try:
             # Set pending state
             self.pending_voice_confirmation = True
@@ -5140,7 +6245,7 @@ Enter new card information above and click "Check Price" to get pricing data.
                 self.pending_voice_confirmation = False
                 self.pending_card_options = []
                 self.pending_voice_data = {}
-                self.root.after(0, lambda: self.voice_status_var.set("No options to display"))
+                self.root.after(0, self.voice_status_var.set, "No options to display")
                 return
             
             print(f"[VOICE DEBUG] Displaying {len(card_matches)} options in dialog")
@@ -5176,7 +6281,7 @@ Enter new card information above and click "Check Price" to get pricing data.
                     self.pending_voice_confirmation = False
                     self.pending_card_options = []
                     self.pending_voice_data = {}
-                    self.root.after(0, lambda: self.voice_status_var.set("Error selecting option"))
+                    self.root.after(0, self.voice_status_var.set, "Error selecting option")
             
             def cancel_selection():
                 try:
@@ -5191,7 +6296,7 @@ Enter new card information above and click "Check Price" to get pricing data.
                     except:
                         pass  # Dialog might already be destroyed
                         
-                    self.root.after(0, lambda: self.voice_status_var.set("Selection cancelled, continue speaking..."))
+                    self.root.after(0, self.voice_status_var.set, "Selection cancelled, continue speaking...")
                     print("[VOICE DEBUG] Selection cancelled by user")
                 except Exception as e:
                     print(f"[VOICE DEBUG] Error cancelling selection: {e}")
@@ -5247,58 +6352,48 @@ Enter new card information above and click "Check Price" to get pricing data.
             if rarity:
                 ttk.Label(dialog, text=f"Specified Rarity: {rarity}", font=("Arial", 10)).pack(pady=2)
             
-            ttk.Label(dialog, text="Select an option by clicking or saying the number:", 
+            ttk.Label(dialog, text="Select an option by double-clicking or saying the number:", 
                      font=("Arial", 11, "bold")).pack(pady=(15, 10))
             
-            # Create scrollable frame for options
-            canvas = tk.Canvas(dialog, height=300)
-            scrollbar = ttk.Scrollbar(dialog, orient="vertical", command=canvas.yview)
-            scrollable_frame = ttk.Frame(canvas)
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-            
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            # Add options
-            for i, match in enumerate(card_matches, 1):
-                option_frame = ttk.LabelFrame(scrollable_frame, text=f"Option {i}", padding="10")
-                option_frame.pack(fill=tk.X, padx=10, pady=5)
-                
-                # Card name and confidence
-                name_label = ttk.Label(option_frame, text=match['name'], font=("Arial", 12, "bold"))
-                name_label.pack(anchor=tk.W)
-                
-                confidence_label = ttk.Label(option_frame, text=f"Confidence: {match['confidence']:.1f}%", 
-                                            font=("Arial", 10), foreground="#0066CC")
-                confidence_label.pack(anchor=tk.W)
-                
-                # Card rarity
-                rarity_label = ttk.Label(option_frame, text=f"Rarity: {match['rarity']}", 
-                                       font=("Arial", 10))
-                rarity_label.pack(anchor=tk.W)
-                
-                # Set code if available
-                set_code = match.get('set_code', 'N/A')
-                set_label = ttk.Label(option_frame, text=f"Set Code: {set_code}", 
-                                    font=("Arial", 9), foreground="#666666")
-                set_label.pack(anchor=tk.W)
-                
-                # Select button
-                select_btn = ttk.Button(option_frame, text=f"Select Option {i}", 
-                                      command=lambda idx=i-1: select_option(idx))
-                select_btn.pack(anchor=tk.W, pady=(5, 0))
-            
-            canvas.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=10)
-            scrollbar.pack(side="right", fill="y", pady=10, padx=(0, 10))
+            # One Treeview row per option instead of a frame of labels and a button each
+            list_frame = ttk.Frame(dialog)
+            columns = ('option', 'name', 'confidence', 'rarity', 'set_code')
+            tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=min(len(card_matches), 10),
+                                selectmode='browse')
+            for column, heading, width, anchor in (('option', '#', 40, tk.CENTER),
+                                                   ('name', 'Card Name', 220, tk.W),
+                                                   ('confidence', 'Confidence', 90, tk.CENTER),
+                                                   ('rarity', 'Rarity', 130, tk.W),
+                                                   ('set_code', 'Set Code', 90, tk.W)):
+                tree.heading(column, text=heading)
+                tree.column(column, width=width, anchor=anchor, stretch=(column == 'name'))
+            scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=tree.yview)
+            tree.configure(yscrollcommand=scrollbar.set)
+            
+            # Add options (iid is the option index, numbered from 1 as spoken)
+            for i, match in enumerate(card_matches):
+                tree.insert('', 'end', iid=str(i), values=(i + 1, match['name'], f"{match['confidence']:.1f}%",
+                                                           match['rarity'], match.get('set_code', 'N/A')))
+            
+            def select_focused(event=None):
+                focused = tree.focus()
+                if focused:
+                    select_option(int(focused))
+            
+            tree.bind('<Double-1>', select_focused)
+            tree.bind('<Return>', select_focused)
+            tree.focus('0')
+            tree.selection_set('0')
+            
+            tree.pack(side="left", fill="both", expand=True)
+            scrollbar.pack(side="right", fill="y")
+            list_frame.pack(fill="both", expand=True, padx=10, pady=10)
             
             # Control buttons
             button_frame = ttk.Frame(dialog)
             button_frame.pack(pady=10)
             
+            ttk.Button(button_frame, text="✅ Select", command=select_focused).pack(side=tk.LEFT, padx=5)
             ttk.Button(button_frame, text="❌ Cancel", command=cancel_selection).pack(side=tk.LEFT, padx=5)
             
             # Voice instruction
@@ -5307,36 +6402,11 @@ Enter new card information above and click "Check Price" to get pricing data.
                                         font=("Arial", 9, "italic"), foreground="#666666")
             voice_instruction.pack(pady=(0, 10))
             
-            # Start dedicated voice listener for dialog selections
-            def dialog_voice_listener():
-                """Dedicated voice listener for dialog selections to avoid context manager conflicts"""
-                listen_count = 0
-                max_listen_attempts = 20  # Limit attempts to prevent infinite loops
-                
-                while self.pending_voice_confirmation and listen_count < max_listen_attempts:
-                    try:
-                        # Use a shorter timeout for dialog listening
-                        voice_text = self.voice_recognizer.listen_once(timeout=2)
-                        if voice_text:
-                            print(f"[DIALOG VOICE DEBUG] Dialog heard: '{voice_text}'")
-                            # Process the voice selection in the main thread
-                            self.root.after(0, lambda text=voice_text: self.handle_voice_selection(text))
-                            break  # Exit after processing one command
-                        listen_count += 1
-                        time.sleep(0.1)  # Brief pause between attempts
-                    except Exception as e:
-                        print(f"[DIALOG VOICE DEBUG] Dialog voice error: {e}")
-                        listen_count += 1
-                        time.sleep(0.5)
-                
-                print(f"[DIALOG VOICE DEBUG] Dialog voice listener stopped after {listen_count} attempts")
-            
-            # Start dialog voice listener in separate thread
-            dialog_voice_thread = threading.Thread(target=dialog_voice_listener, daemon=True)
-            dialog_voice_thread.start()
+            # Spoken selections arrive from voice_recognition_loop, which keeps listening
+            # while pending_voice_confirmation is set - no dialog-specific listener thread
             
             # Update voice status
-            self.root.after(0, lambda: self.voice_status_var.set(f"Waiting for selection: Say 1-{len(card_matches)} or 'cancel'"))
+            self.root.after(0, self.voice_status_var.set, f"Waiting for selection: Say 1-{len(card_matches)} or 'cancel'")
             
             print(f"[VOICE DEBUG] Dialog displayed successfully with {len(card_matches)} options")
             
@@ -5346,85 +6416,73 @@ Enter new card information above and click "Check Price" to get pricing data.
             self.pending_voice_confirmation = False
             self.pending_card_options = []
             self.pending_voice_data = {}
-            self.root.after(0, lambda: self.voice_status_var.set(f"Error displaying options: {str(e)}"))
+            self.root.after(0, self.voice_status_var.set, f"Error displaying options: {str(e)}")
     
     def add_card_to_session(self, card_data, art_variant=None, rarity=None):
         """Add a card to the current session with immediate placeholder, then fetch pricing asynchronously"""
-        print(f"[ADD CARD DEBUG] Adding card: {card_data.get('name', 'Unknown')} - {rarity}")
+        logger.debug("[ADD CARD] Adding card: %s - %s", card_data.get('name', 'Unknown'), rarity)
         
         # Use the provided rarity parameter as the definitive rarity (this comes from the selected option)
         final_rarity = rarity or self.get_card_rarity_display(card_data, rarity)
         
-        # Immediately add card with loading placeholder
-        loading_card = {
-            **card_data,
-            'card_name': card_data.get('name', 'Unknown Card'),
-            'card_rarity': final_rarity,  # Use the exact rarity from selection
-            'art_variant': art_variant or 'None',
-            'tcg_price': '⏳ Loading...',
-            'tcg_market_price': '⏳ Loading...',
-            'price_status': 'loading',
-            'quantity': 1,  # Default quantity
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        # Add to session immediately
-        self.pack_session.add_card(loading_card)
-        print(f"[ADD CARD DEBUG] Session now has {len(self.pack_session.cards)} cards")
+        # Immediately add card with loading placeholder (add_card builds the one copy
+        # and stamps it); the price fetch updates this stored dict directly
+        session_card = self.pack_session.add_card(
+            card_data,
+            card_name=card_data.get('name', 'Unknown Card'),
+            card_rarity=final_rarity,  # Use the exact rarity from selection
+            art_variant=art_variant or 'None',
+            tcg_price='⏳ Loading...',
+            tcg_market_price='⏳ Loading...',
+            price_status='loading',
+            quantity=1  # Default quantity
+        )
+        logger.debug("[ADD CARD] Session now has %d cards", len(self.pack_session.cards))
         
         # Pre-load images for both modes to improve mode switching performance
         self.preload_card_images_background(card_data)
         
         # Update UI immediately with loading placeholder
-        print(f"[ADD CARD DEBUG] About to call update_session_display() from main thread")
-        print(f"[ADD CARD DEBUG] Current thread: {threading.current_thread().name}")
-        print(f"[ADD CARD DEBUG] Is main thread: {threading.current_thread() == threading.main_thread()}")
-        print(f"[ADD CARD DEBUG] Session tracker exists: {self.session_tracker is not None}")
-        print(f"[ADD CARD DEBUG] Pack session active: {self.pack_session_active}")
+        logger.debug("[ADD CARD] Updating display from thread %s (tracker: %s, session active: %s)",
+                     threading.current_thread().name, self.session_tracker is not None, self.pack_session_active)
         
         if not self.session_tracker:
-            print(f"[ADD CARD DEBUG] ERROR: No session tracker available! Cannot update UI.")
+            logger.error("[ADD CARD] No session tracker available! Cannot update UI.")
             return
             
         if not self.pack_session_active:
-            print(f"[ADD CARD DEBUG] WARNING: Pack session not active!")
+            logger.warning("[ADD CARD] Pack session not active!")
             
         self.update_session_display()
         
-        # CRITICAL FIX: Add fallback update mechanism with delay
-        def delayed_update_fallback():
-            print(f"[ADD CARD DEBUG] Executing delayed fallback update")
-            if self.session_tracker:
-                try:
-                    self.session_tracker.safe_update_cards_display()
-                    print(f"[ADD CARD DEBUG] Fallback update completed")
-                except Exception as e:
-                    print(f"[ADD CARD DEBUG] Fallback update failed: {e}")
-            else:
-                print(f"[ADD CARD DEBUG] No session tracker for fallback update")
-        
-        # Schedule a fallback update after 500ms in case the immediate one fails
-        self.root.after(500, delayed_update_fallback)
+        # Fallback update after 500ms in case the immediate one fails - routed through the
+        # coalesced path so it shares a repaint with any price updates landing meanwhile
+        self.root.after(500, self.update_session_display)
         
         # Lock status if not already locked (auto-confirm already locks it)
         if not self.voice_status_locked:
             self.voice_status_locked = True
             
-        self.root.after(0, lambda: self.voice_status_var.set(f"Added: {card_data.get('name', 'Card')} - {final_rarity} (fetching price...)"))
+        self.root.after(0, self.voice_status_var.set, f"Added: {card_data.get('name', 'Card')} - {final_rarity} (fetching price...)")
         
         # Clear the status message after 2 seconds and return to listening mode
         def clear_status_and_resume():
-            print("[VOICE DEBUG] Clearing 'Added:' status and unlocking voice status")
+            logger.debug("[VOICE] Clearing 'Added:' status and unlocking voice status")
             if self.voice_listening:
                 self.voice_status_var.set("🎤 Listening...")
             else:
                 self.voice_status_var.set("Voice recognition ready")
             # Unlock status to allow voice loop to continue
             self.voice_status_locked = False
-            print("[VOICE DEBUG] Voice status unlocked - ready for new input")
+            logger.debug("[VOICE] Voice status unlocked - ready for new input")
         
-        # Use after_idle for higher priority to ensure voice status clearing is not blocked by other UI updates
-        self.root.after(2000, lambda: self.root.after_idle(clear_status_and_resume))  # Clear after 2 seconds with high priority
+        self.root.after(2000, clear_status_and_resume)  # Clear after 2 seconds
+        
+        def apply_price_result(updates):
+            # The card dict is live in pack_session.cards, and auto_save's json.dump walks
+            # those dicts on the Tk thread - so they are only ever resized on this thread
+            session_card.update(updates)
+            self.update_session_display()
         
         # Fetch price in background without blocking
         def fetch_price_and_update():
@@ -5438,105 +6496,77 @@ Enter new card information above and click "Check Price" to get pricing data.
                     "force_refresh": False
                 }
                 
-                print(f"[PRICE FETCH DEBUG] Fetching price for: {payload['card_name']} - {payload['card_rarity']}")
+                logger.debug("[PRICE FETCH] Fetching price for: %s - %s", payload['card_name'], payload['card_rarity'])
                 
                 # Make API call to get pricing
                 url = f"{self.api_url}/cards/price"
-                response = requests.post(url, json=payload, timeout=30)
+                response = self.http.post(url, json=payload, timeout=30)
                 
                 # Log the API call
                 log_api_call("POST", url, body=payload, response=response)
                 
                 response.raise_for_status()
                 
-                price_data = response.json()
+                price_data = parse_json_response(response)
                 
-                # Find the card in our session and update it (match by name AND exact rarity)
-                for i, session_card in enumerate(self.pack_session.cards):
-                    if (session_card.get('name') == card_data.get('name') and 
-                        session_card.get('price_status') == 'loading' and
-                        session_card.get('card_rarity') == final_rarity):  # Match exact rarity
-                        
-                        if price_data.get('success'):
-                            # Update with actual pricing data, preserving the selected rarity
-                            updated_card = {
-                                **session_card,
-                                **price_data.get('data', {}),
-                                'card_rarity': final_rarity,  # Ensure rarity doesn't get overwritten
-                                'price_status': 'loaded'
-                            }
-                            print(f"[PRICE FETCH DEBUG] Price loaded for {card_data.get('name')} - {final_rarity}: Low=${price_data.get('data', {}).get('tcg_price', 'N/A')}, Market=${price_data.get('data', {}).get('tcg_market_price', 'N/A')}")
-                        else:
-                            # Update with failed status, preserving the selected rarity
-                            updated_card = {
-                                **session_card,
-                                'tcg_price': 'Price unavailable',
-                                'tcg_market_price': 'Price unavailable',
-                                'card_rarity': final_rarity,  # Ensure rarity doesn't get overwritten
-                                'price_status': 'failed'
-                            }
-                            print(f"[PRICE FETCH DEBUG] Price fetch failed for {card_data.get('name')} - {final_rarity}")
-                        
-                        # Replace the card in the session
-                        self.pack_session.cards[i] = updated_card
-                        
-                        # Update UI on main thread - use immediate scheduling to ensure execution
-                        print(f"[PRICE FETCH DEBUG] Scheduling UI update for {card_data.get('name')} - {final_rarity}")
-                        self.root.after(0, self.update_session_display)  # Use after(0) to ensure execution
-                        break
+                # Update the card this fetch belongs to in place (no session scan
+                # by name and rarity; quantity edits and removals keep the same dict)
+                if price_data.get('success'):
+                    # Update with actual pricing data, preserving the selected rarity
+                    updates = {
+                        **price_data.get('data', {}),
+                        'card_rarity': final_rarity,  # Ensure rarity doesn't get overwritten
+                        'price_status': 'loaded'
+                    }
+                    logger.debug("[PRICE FETCH] Price loaded for %s - %s: Low=$%s, Market=$%s", card_data.get('name'), final_rarity,
+                                 price_data['data'].get('tcg_price', 'N/A') if price_data.get('data') else 'N/A',
+                                 price_data['data'].get('tcg_market_price', 'N/A') if price_data.get('data') else 'N/A')
+                else:
+                    # Update with failed status, preserving the selected rarity
+                    updates = {
+                        'tcg_price': 'Price unavailable',
+                        'tcg_market_price': 'Price unavailable',
+                        'card_rarity': final_rarity,  # Ensure rarity doesn't get overwritten
+                        'price_status': 'failed'
+                    }
+                    logger.debug("[PRICE FETCH] Price fetch failed for %s - %s", card_data.get('name'), final_rarity)
+                
+                # Apply and repaint on the main thread
+                self.root.after(0, apply_price_result, updates)
                 
             except Exception as e:
-                print(f"[PRICE FETCH DEBUG] Error fetching price for {card_data.get('name')} - {final_rarity}: {e}")
-                # Find and update the card with error status, preserving the selected rarity
-                for i, session_card in enumerate(self.pack_session.cards):
-                    if (session_card.get('name') == card_data.get('name') and 
-                        session_card.get('price_status') == 'loading' and
-                        session_card.get('card_rarity') == final_rarity):  # Match exact rarity
-                        
-                        # Update with error status, preserving the selected rarity
-                        updated_card = {
-                            **session_card,
-                            'tcg_price': '❌ Error',
-                            'tcg_market_price': '❌ Error',
-                            'card_rarity': final_rarity,  # Ensure rarity doesn't get overwritten
-                            'price_status': 'error'
-                        }
-                        
-                        self.pack_session.cards[i] = updated_card
-                        self.root.after(0, self.update_session_display)  # Use after(0) to ensure execution
-                        break
-        
-        # Start price fetching in background thread
-        thread = threading.Thread(target=fetch_price_and_update)
-        thread.daemon = True
-        thread.start()
+                logger.warning("[PRICE FETCH] Error fetching price for %s - %s: %s", card_data.get('name'), final_rarity, e)
+                # Update the card with error status, preserving the selected rarity
+                self.root.after(0, apply_price_result, {
+                    'tcg_price': '❌ Error',
+                    'tcg_market_price': '❌ Error',
+                    'card_rarity': final_rarity,  # Ensure rarity doesn't get overwritten
+                    'price_status': 'error'
+                })
+        
+        # Start price fetching on the shared I/O pool
+        self.submit_io(fetch_price_and_update)
     
     def preload_card_images_background(self, card_data):
-        """Pre-load card images in both modes in background thread for better performance"""
-        def preload_images():
-            try:
-                if not PIL_AVAILABLE or not hasattr(self, 'image_manager'):
-                    return
-                    
-                card_images = card_data.get('card_images', [])
-                if not card_images or len(card_images) == 0:
-                    return
+        """Queue pre-loading of card images in both modes for better performance"""
+        try:
+            if not PIL_AVAILABLE or not hasattr(self, 'image_manager'):
+                return
                 
-                image_url = card_images[0].get('image_url')
-                card_id = card_data.get('id')
+            card_images = card_data.get('card_images', [])
+            if not card_images or len(card_images) == 0:
+                return
+            
+            image_url = card_images[0].get('image_url')
+            card_id = card_data.get('id')
+            
+            if image_url and card_id:
+                # Returns at once - the decode/resize runs on the image manager's preload pool
+                if self.image_manager.preload_image_for_both_modes(card_id, image_url):
+                    print(f"[IMAGE PRELOAD] Queued pre-loading for card {card_data.get('name')} (ID: {card_id})")
                 
-                if image_url and card_id:
-                    print(f"[IMAGE PRELOAD] Pre-loading images for card {card_data.get('name')} (ID: {card_id})")
-                    self.image_manager.preload_image_for_both_modes(card_id, image_url)
-                    print(f"[IMAGE PRELOAD] Completed pre-loading for card {card_data.get('name')}")
-                    
-            except Exception as e:
-                print(f"[IMAGE PRELOAD] Error pre-loading images: {e}")
-        
-        # Run in background thread to avoid blocking UI
-        thread = threading.Thread(target=preload_images)
-        thread.daemon = True
-        thread.start()
+        except Exception as e:
+            print(f"[IMAGE PRELOAD] Error pre-loading images: {e}")
     
     def save_session_manual(self):
         """Manually save the current session"""
@@ -5587,25 +6617,9 @@ Enter new card information above and click "Check Price" to get pricing data.
         ttk.Label(dialog, text="Select fields to export:", font=("Arial", 12, "bold")).pack(pady=10)
         
         # Available fields with more comprehensive options from v2 API
-        available_fields = {
-            'card_name': 'Card Name',
-            'card_rarity': 'Card Rarity',
-            'art_variant': 'Art Variant',
-            'tcg_price': 'TCGPlayer Low Price',
-            'tcg_market_price': 'TCGPlayer Market Price',
-            'set_code': 'Set Code',
-            'booster_set_name': 'Set Name',
-            'card_number': 'Card Number',
-            'card_art_variant': 'Card Art Variant',
-            'scrape_success': 'Scrape Success',
-            'source_url': 'Source URL',
-            'last_price_updt': 'Last Updated',
-            'timestamp': 'Added Timestamp',
-            'error_message': 'Error Message (if any)'
-        }
-        
         field_vars = {}
-        for field, label in available_fields.items():
+        for field in _EXPORT_FIELDS:
+            label = _EXPORT_FIELD_LABELS[field]
             var = tk.BooleanVar(value=True)  # Default to selected
             field_vars[field] = var
             ttk.Checkbutton(dialog, text=label, variable=var).pack(anchor=tk.W, padx=20, pady=2)
@@ -5629,69 +6643,29 @@ Enter new card information above and click "Check Price" to get pricing data.
         if not file_path:
             return
         
+        headers = export_headers(tuple(selected_fields))
+        
+        # Build and save the workbook on the I/O pool from a snapshot of the cards
+        cards = list(self.pack_session.cards)
+        self.export_btn.config(state='disabled')
+        self.submit_io(self._excel_export_worker, file_path, cards, selected_fields, headers)
+    
+    def _excel_export_worker(self, file_path, cards, selected_fields, headers):
+        """Write the export workbook off the Tk thread, then report back on it"""
         try:
-            # Create workbook
-            workbook = openpyxl.Workbook()
-            worksheet = workbook.active
-            worksheet.title = "Pack Session Cards"
-            
-            # Field labels with expanded v2 API fields
-            field_labels = {
-                'card_name': 'Card Name',
-                'card_rarity': 'Card Rarity',
-                'art_variant': 'Art Variant',
-                'tcg_price': 'TCGPlayer Low Price',
-                'tcg_market_price': 'TCGPlayer Market Price',
-                'set_code': 'Set Code',
-                'booster_set_name': 'Set Name',
-                'card_number': 'Card Number',
-                'card_art_variant': 'Card Art Variant',
-                'scrape_success': 'Scrape Success',
-                'source_url': 'Source URL',
-                'last_price_updt': 'Last Updated',
-                'timestamp': 'Added Timestamp',
-                'error_message': 'Error Message (if any)'
-            }
-            
-            # Write headers
-            headers = [field_labels.get(field, field) for field in selected_fields]
-            worksheet.append(headers)
-            
-            # Style headers
-            for cell in worksheet["1:1"]:
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            # Write data
-            for card in self.pack_session.cards:
-                row_data = []
-                for field in selected_fields:
-                    value = card.get(field, 'N/A')
-                    if value is None:
-                        value = 'N/A'
-                    row_data.append(value)
-                worksheet.append(row_data)
-            
-            # Auto-size columns
-            for column in worksheet.columns:
-                max_length = 0
-                column = [cell for cell in column]
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)  # Cap at 50 chars
-                worksheet.column_dimensions[column[0].column_letter].width = adjusted_width
-            
-            # Save workbook
-            workbook.save(file_path)
-            messagebox.showinfo("Export Success", f"Excel file created successfully!\n\nFile: {file_path}\nCards exported: {len(self.pack_session.cards)}")
-            
+            write_cards_workbook(file_path, cards, selected_fields, headers)
+            error = None
         except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to create Excel file:\n{str(e)}")
+            error = str(e)
+        self.root.after(0, self._finish_excel_export, file_path, len(cards), error)
+    
+    def _finish_excel_export(self, file_path, card_count, error):
+        """Re-enable export and show the result (Tk thread)"""
+        self.export_btn.config(state='normal')
+        if error is not None:
+            messagebox.showerror("Export Error", f"Failed to create Excel file:\n{error}")
+        else:
+            messagebox.showinfo("Export Success", f"Excel file created successfully!\n\nFile: {file_path}\nCards exported: {card_count}")
     
     def show_cache_info(self):
         """Show image cache information and management"""
@@ -5776,20 +6750,13 @@ The image cache stores downloaded card images locally to comply with YGO API gui
         """Automatically load card sets from cache on startup"""
         def load_sets_thread():
             try:
-                # Use cache endpoint to get all sets
+                # Use cache endpoint to get all sets - through the same TTL cache as Load Sets,
+                # so a restart within the TTL skips the download
                 url = f"{self.api_url}/card-sets/from-cache"
-                response = requests.get(url, timeout=30)
-                
-                # Log the API call
-                log_api_call("GET", url, response=response)
-                
-                response.raise_for_status()
-                
-                data = response.json()
+                data = self._fetch_api_json(url, _CARD_SETS_CACHE_KEY)
                 if data.get('success'):
                     sets_data = data.get('data', [])
-                    self.available_sets = sets_data
-                    self.filtered_sets = sets_data
+                    self._apply_card_sets(sets_data)
                     
                     # Update UI on main thread
                     self.root.after(0, self.update_set_combobox)
@@ -5801,10 +6768,8 @@ The image cache stores downloaded card images locally to comply with YGO API gui
                 log_api_call("GET", url, error=e)
                 print(f"Failed to auto-load sets: {str(e)}")
         
-        # Run in separate thread to avoid blocking UI startup
-        thread = threading.Thread(target=load_sets_thread)
-        thread.daemon = True
-        thread.start()
+        # Run on the shared I/O pool to avoid blocking UI startup
+        self.submit_io(load_sets_thread)
 
 def main():
     root = tk.Tk()